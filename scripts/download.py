@@ -10,6 +10,7 @@ Each source only downloads data it's best suited for, avoiding redundancy.
 """
 
 import argparse
+import io
 import sys
 from pathlib import Path
 
@@ -18,7 +19,24 @@ _scripts_dir = str(Path(__file__).parent)
 if _scripts_dir not in sys.path:
     sys.path.insert(0, _scripts_dir)
 
-from simtradedata.writers.duckdb_writer import DEFAULT_DB_PATH, DuckDBWriter
+from simtradedata.writers.duckdb_writer import (
+    DEFAULT_DB_PATH,
+    STATUS_SIMPLE_TABLES,
+    STATUS_SYMBOL_TABLES,
+    DuckDBWriter,
+)
+
+# Status report templates, filled in by print_data_status for the tables
+# get_data_status reports
+_STATUS_HEADER = "{sep}\nSimTradeData Status Report\n{sep}\n\n[Per-Symbol Tables]\n"
+_STATUS_SYMBOL_ROW = (
+    "  {table:18s}: {rows:>10,} rows, {stocks:>5} stocks, {min_date} ~ {max_date}\n"
+)
+_STATUS_MIDDLE = (
+    "\n  Completed fundamentals quarters: {quarters}\n\n[Metadata Tables]\n"
+)
+_STATUS_SIMPLE_ROW = "  {table:18s}: {rows:>10,} rows\n"
+_STATUS_FOOTER = "\n[Database]\n  Path: {path}\n  Size: {size:.1f} MB\n{sep}\n"
 
 
 def print_data_status(db_path: str = DEFAULT_DB_PATH) -> None:
@@ -31,42 +49,25 @@ def print_data_status(db_path: str = DEFAULT_DB_PATH) -> None:
     writer = DuckDBWriter(db_path=db_path)
     try:
         status = writer.get_data_status()
-
-        print("=" * 70)
-        print("SimTradeData Status Report")
-        print("=" * 70)
-
-        # Per-symbol tables
-        print("\n[Per-Symbol Tables]")
-        for table in ["stocks", "valuation", "fundamentals", "exrights", "adjust_factors"]:
-            info = status.get(table, {})
-            rows = info.get("rows", 0)
-            stocks = info.get("stocks", 0)
-            min_date = info.get("min_date", "N/A")
-            max_date = info.get("max_date", "N/A")
-            print(f"  {table:18s}: {rows:>10,} rows, {stocks:>5} stocks, {min_date} ~ {max_date}")
-
-        # Fundamentals quarters
-        quarters = status.get("fundamentals_quarters", 0)
-        print(f"\n  Completed fundamentals quarters: {quarters}")
-
-        # Metadata tables
-        print("\n[Metadata Tables]")
-        for table in ["benchmark", "trade_days", "index_constituents", "stock_status"]:
-            info = status.get(table, {})
-            rows = info.get("rows", 0)
-            print(f"  {table:18s}: {rows:>10,} rows")
-
-        # Database size
-        print("\n[Database]")
-        db_size = db_file.stat().st_size / (1024 * 1024)
-        print(f"  Path: {db_path}")
-        print(f"  Size: {db_size:.1f} MB")
-
-        print("=" * 70)
     finally:
         writer.close()
 
+    # Render the report from the templates into one buffer and write it once
+    sep = "=" * 70
+    empty = {"rows": 0, "stocks": 0, "min_date": "N/A", "max_date": "N/A"}
+    buf = io.StringIO()
+    write = buf.write
+    write(_STATUS_HEADER.format(sep=sep))
+    for table in STATUS_SYMBOL_TABLES:
+        write(_STATUS_SYMBOL_ROW.format(table=table, **{**empty, **status.get(table, {})}))
+    write(_STATUS_MIDDLE.format(quarters=status.get("fundamentals_quarters", 0)))
+    for table in STATUS_SIMPLE_TABLES:
+        write(_STATUS_SIMPLE_ROW.format(table=table, rows=status.get(table, {}).get("rows", 0)))
+    db_size = db_file.stat().st_size / (1024 * 1024)
+    write(_STATUS_FOOTER.format(path=db_path, size=db_size, sep=sep))
+
+    sys.stdout.write(buf.getvalue())
+
 
 def run_mootdx_download(skip_fundamentals: bool = False, download_dir: str | None = None) -> bool:
     """Run Mootdx download phase."""
@@ -16,7 +16,7 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import baostock as bs
@@ -27,6 +27,7 @@ from simtradedata.config.field_mappings import BENCHMARK_CONFIG
 from simtradedata.fetchers.baostock_fetcher import BaoStockFetcher
 from simtradedata.fetchers.unified_fetcher import UnifiedDataFetcher
 from simtradedata.processors.data_splitter import DataSplitter
+from simtradedata.utils.batching import batch_count, iter_batches
 from simtradedata.writers.duckdb_writer import DEFAULT_DB_PATH, DuckDBWriter
 
 # Configuration
@@ -101,13 +102,10 @@ class EfficientBaoStockDownloader:
         skip_metadata: bool = False,
         valuation_only: bool = False,
     ):
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
         self.unified_fetcher = UnifiedDataFetcher()
         self.standard_fetcher = BaoStockFetcher()
         self.data_splitter = DataSplitter()
-        self.writer = DuckDBWriter(db_path=str(self.db_path))
+        self.writer = DuckDBWriter(db_path=str(db_path))
 
         self.skip_fundamentals = skip_fundamentals
         self.skip_metadata = skip_metadata
@@ -116,25 +114,40 @@ class EfficientBaoStockDownloader:
         self.status_cache = {}
         self.failed_stocks = []
 
-    def get_incremental_start_date(self, symbol: str) -> str:
+        # Industry lookups are as of the day the run started, computed once
+        # instead of once per stock
+        self.run_date = date.today().isoformat()
+
+    @property
+    def db_path(self) -> Path:
+        """Database path (owned by the writer)"""
+        return self.writer.db_path
+
+    def plan_incremental_starts(self, symbols: list) -> dict:
         """
-        Get incremental start date for a symbol.
-        Returns next day after MAX(date), or START_DATE if no data.
+        Get incremental start dates for a batch of symbols.
+        Returns next day after MAX(date) per symbol, or START_DATE if no data,
+        using a single GROUP BY query for the whole batch.
         """
         table = "valuation" if self.valuation_only else "stocks"
-        max_date = self.writer.get_max_date(table, symbol)
-        if max_date:
-            next_day = datetime.strptime(max_date, "%Y-%m-%d") + timedelta(days=1)
-            return next_day.strftime("%Y-%m-%d")
-        return START_DATE
+        max_dates = self.writer.get_max_dates(table, symbols)
+        return {
+            symbol: (max_dates[symbol] + timedelta(days=1)).isoformat()
+            if symbol in max_dates
+            else START_DATE
+            for symbol in symbols
+        }
 
     def download_stock_data(
-        self, symbol: str, start_date: str, end_date: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        actual_start: str = START_DATE,
     ) -> dict:
         """Download all data for a single stock with auto-incremental logic"""
         try:
-            # Auto-incremental: determine actual start date
-            actual_start = self.get_incremental_start_date(symbol)
+            # Auto-incremental: actual_start is planned per batch
             if actual_start > start_date:
                 start_date = actual_start
 
@@ -219,7 +232,9 @@ class EfficientBaoStockDownloader:
             industry_info = {}
             if not self.skip_metadata and not is_incremental:
                 try:
-                    industry_df = self.standard_fetcher.fetch_stock_industry(symbol)
+                    industry_df = self.standard_fetcher.fetch_stock_industry(
+                        symbol, self.run_date
+                    )
                     if not industry_df.empty:
                         industry_info = {
                             "industry": industry_df["industry"].values[0],
@@ -254,16 +269,36 @@ class EfficientBaoStockDownloader:
             return None
 
     def download_batch(
-        self, stock_batch: list, start_date: str, end_date: str, pbar=None
+        self,
+        stock_batch: list,
+        start_date: str,
+        end_date: str,
+        pbar=None,
+        starts: dict | None = None,
     ) -> list:
-        """Download data for a batch of stocks in a single transaction"""
+        """
+        Download data for a batch of stocks in a single transaction.
+
+        Writes are deferred, so each table gets one upsert per batch, and are
+        committed by the writer's background thread while the next batch
+        downloads.
+
+        starts may hold the incremental start dates already planned for the
+        whole run; otherwise they are looked up for this batch.
+        """
         metadata_list = []
 
-        self.writer.begin()
+        # Resolve every start date up front so the loop only downloads
+        if starts is None:
+            starts = self.plan_incremental_starts(stock_batch)
+
+        self.writer.begin(defer_writes=True)
         try:
             for stock in stock_batch:
                 try:
-                    metadata = self.download_stock_data(stock, start_date, end_date)
+                    metadata = self.download_stock_data(
+                        stock, start_date, end_date, starts[stock]
+                    )
                     if metadata:
                         metadata_list.append(metadata)
                 except Exception as e:
@@ -272,7 +307,7 @@ class EfficientBaoStockDownloader:
                     if pbar:
                         pbar.update(1)
 
-            self.writer.commit()
+            self.writer.commit_async()
         except Exception:
             self.writer.rollback()
             raise
@@ -291,20 +326,23 @@ class EfficientBaoStockDownloader:
             logger.info("No status data to aggregate")
             return
 
-        # Collect all status data into a single DataFrame
-        all_status = []
-        for symbol, status_df in self.status_cache.items():
-            if status_df is None or status_df.empty:
-                continue
-            df = status_df.copy()
-            df["symbol"] = symbol
-            all_status.append(df)
+        # Collect all status data into a single DataFrame; concat labels the
+        # rows with their symbol, so no per-symbol copy is needed
+        all_status = {
+            symbol: status_df
+            for symbol, status_df in self.status_cache.items()
+            if status_df is not None and not status_df.empty
+        }
 
         if not all_status:
             logger.info("No valid status data to aggregate")
             return
 
-        combined = pd.concat(all_status, ignore_index=True)
+        combined = (
+            pd.concat(all_status, names=["symbol", None])
+            .reset_index(level="symbol")
+            .reset_index(drop=True)
+        )
 
         # Ensure date column exists
         if "date" not in combined.columns:
@@ -319,24 +357,25 @@ class EfficientBaoStockDownloader:
                 combined["tradestatus"], errors="coerce"
             ).fillna(1)
 
-        # Group by date and aggregate
-        for date_val in combined["date"].unique():
-            date_str = pd.to_datetime(date_val).strftime("%Y%m%d")
-            day_data = combined[combined["date"] == date_val]
-
-            # ST stocks
-            if "isST" in day_data.columns:
-                st_symbols = day_data[day_data["isST"] == 1]["symbol"].tolist()
-                if st_symbols:
-                    self.writer.write_stock_status(date_str, "ST", st_symbols)
-
+        # Group flagged rows by date in one pass (instead of re-filtering
+        # the whole frame once per date)
+        status_filters = []
+        if "isST" in combined.columns:
+            status_filters.append(("ST", combined["isST"] == 1))
+        if "tradestatus" in combined.columns:
             # HALT stocks (tradestatus == 0)
-            if "tradestatus" in day_data.columns:
-                halt_symbols = day_data[day_data["tradestatus"] == 0]["symbol"].tolist()
-                if halt_symbols:
-                    self.writer.write_stock_status(date_str, "HALT", halt_symbols)
+            status_filters.append(("HALT", combined["tradestatus"] == 0))
+
+        for status_type, mask in status_filters:
+            by_date = combined.loc[mask].groupby("date")["symbol"].agg(list)
+            by_date.index = pd.to_datetime(by_date.index).strftime("%Y%m%d")
+            self.writer.write_stock_status_batch(status_type, by_date)
 
-        logger.info(f"Aggregated status data for {len(combined['date'].unique())} dates")
+        # Counting distinct dates scans the whole frame; skip it when unlogged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Aggregated status data for %d dates", combined["date"].nunique()
+            )
 
     def download_fundamentals_by_quarter(
         self, stock_pool: list, start_date: str, end_date: str
@@ -374,11 +413,8 @@ class EfficientBaoStockDownloader:
             print(f"\n  Quarter {qi}/{len(pending_quarters)}: "
                   f"{year}Q{quarter} (end: {q_end})")
 
-            # Batch process stocks for this quarter
-            batches = [
-                stock_pool[i : i + BATCH_SIZE]
-                for i in range(0, len(stock_pool), BATCH_SIZE)
-            ]
+            # Fetch existing symbols for this quarter in one query
+            existing_symbols = self.writer.get_fundamental_symbols(q_end)
 
             success_count = 0
             skip_count = 0
@@ -389,12 +425,13 @@ class EfficientBaoStockDownloader:
                 unit="stock",
                 ncols=100,
             ) as pbar:
-                for batch in batches:
+                # Batch process stocks for this quarter
+                for batch in iter_batches(stock_pool, BATCH_SIZE):
                     self.writer.begin()
                     try:
                         for symbol in batch:
                             try:
-                                if self.writer.has_fundamental(symbol, q_end):
+                                if symbol in existing_symbols:
                                     skip_count += 1
                                     continue
 
@@ -462,14 +499,13 @@ def download_all_data(
         end_date = (
             datetime.now().date()
             if END_DATE is None
-            else datetime.strptime(END_DATE, "%Y-%m-%d").date()
+            else date.fromisoformat(END_DATE)
         )
 
         use_start_date = start_date or START_DATE
-        start_date_obj = datetime.strptime(use_start_date, "%Y-%m-%d").date()
 
-        start_date_str = start_date_obj.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
+        start_date_str = date.fromisoformat(use_start_date).isoformat()
+        end_date_str = end_date.isoformat()
 
         print(f"\nDate range: {start_date_str} ~ {end_date_str}")
         print("(Each symbol starts from its MAX(date)+1 automatically)")
@@ -508,11 +544,11 @@ def download_all_data(
                 return prefix in valid_prefixes
 
             sample_dates = generate_monthly_start_dates(
-                START_DATE, end_date.strftime("%Y-%m-%d")
+                START_DATE, end_date_str
             )
 
             # Check cached data
-            sampled_dates = set(downloader.writer.get_sampled_dates())
+            sampled_dates = downloader.writer.get_sampled_dates()
             cached_pool = downloader.writer.get_stock_pool()
 
             # Also get stocks already in database (from TDX import)
@@ -536,7 +572,7 @@ def download_all_data(
 
                 all_stocks = set(cached_pool) if cached_pool else set()
                 for date_obj in tqdm(dates_to_sample, desc=desc):
-                    date_str = date_obj.strftime("%Y-%m-%d")
+                    date_str = date_obj.date().isoformat()
                     try:
                         rs = bs.query_all_stock(day=date_str)
                         if rs.error_code == "0":
@@ -556,12 +592,6 @@ def download_all_data(
                 stock_pool = sorted([s for s in all_stocks if is_a_share_stock(s)])
                 print(f"Total A-share stocks: {len(stock_pool)}")
 
-            # Download in batches
-            batches = [
-                stock_pool[i : i + BATCH_SIZE]
-                for i in range(0, len(stock_pool), BATCH_SIZE)
-            ]
-
             # Check if data is already up to date by checking global MAX(date)
             check_table = "valuation" if valuation_only else "stocks"
             global_max_date = downloader.writer.get_max_date(check_table)
@@ -569,10 +599,18 @@ def download_all_data(
 
             if global_max_date:
                 # Use a sample stock to check if there's new data
-                test_start = (datetime.strptime(global_max_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+                test_day = date.fromisoformat(global_max_date) + timedelta(days=1)
+                test_start = test_day.isoformat()
                 if test_start > end_date_str:
                     print(f"\n{check_table.capitalize()} data already up to date (max_date: {global_max_date})")
                     skip_stock_download = True
+                elif not downloader.writer.has_trading_day_between(
+                    test_day, end_date
+                ):
+                    # Weekend/holiday per the stored calendar: no network probe
+                    print(f"\n{check_table.capitalize()} data already up to date (max_date: {global_max_date})")
+                    print("No new trading days since last update, skipping stock download.")
+                    skip_stock_download = True
                 else:
                     # Try fetching a sample stock to see if there's new data
                     try:
@@ -591,7 +629,7 @@ def download_all_data(
                 success = 0
                 skipped = len(stock_pool)
             else:
-                print(f"\nProcessing {len(stock_pool)} stocks in {len(batches)} batches...")
+                print(f"\nProcessing {len(stock_pool)} stocks in {batch_count(len(stock_pool), BATCH_SIZE)} batches...")
                 print(f"Batch size: {BATCH_SIZE}")
                 print("Note: Each symbol auto-detects its incremental start date")
                 print("=" * 60)
@@ -608,20 +646,42 @@ def download_all_data(
                     ncols=100,
                     bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
                 ) as pbar:
-                    for batch in batches:
+                    # One GROUP BY over the whole pool instead of one per
+                    # batch; each stock is in a single batch, so the plan
+                    # stays valid while earlier batches are written
+                    starts = downloader.plan_incremental_starts(stock_pool)
+                    downloader.writer.start_background_writes()
+                    for batch in iter_batches(stock_pool, BATCH_SIZE):
+                        ticked_before = pbar.n
                         try:
                             metadata_list = downloader.download_batch(
-                                batch, start_date_str, end_date_str, pbar
+                                batch, start_date_str, end_date_str, pbar,
+                                starts=starts,
                             )
                             all_metadata.extend(metadata_list)
                             success += len(metadata_list)
                             skipped += len(batch) - len(metadata_list)
                         except Exception as e:
                             logger.error(f"Batch failed: {e}")
-                            pbar.update(len(batch))
+                            # Only advance past stocks the batch did not tick
+                            pbar.update(len(batch) - (pbar.n - ticked_before))
+                    failed_writes = downloader.writer.stop_background_writes()
+
+                if failed_writes:
+                    # Their rows were lost with the batch; do not count them
+                    # as updated or save their metadata
+                    kept = [
+                        m for m in all_metadata if m["stock_code"] not in failed_writes
+                    ]
+                    success -= len(all_metadata) - len(kept)
+                    skipped += len(all_metadata) - len(kept)
+                    all_metadata = kept
+                    downloader.failed_stocks.extend(sorted(failed_writes))
 
                 print("=" * 60)
                 print(f"Download complete: {success} updated, {skipped} skipped/failed")
+                if failed_writes:
+                    print(f"Warning: {len(failed_writes)} stocks failed to write, see log")
 
             # Save metadata (skip in valuation-only mode)
             if all_metadata and not valuation_only:
@@ -657,16 +717,21 @@ def download_all_data(
             if not valuation_only:
                 print("  Trading calendar...")
                 try:
-                    trade_cal = downloader.standard_fetcher.fetch_trade_calendar(
-                        start_date_str, end_date_str
-                    )
-                    if not trade_cal.empty:
-                        trade_days = trade_cal[trade_cal["is_trading_day"] == "1"]
-                        trade_days = trade_days.rename(
-                            columns={"calendar_date": "trade_date"}
+                    # Only fetch days after the calendar already stored
+                    cal_start = downloader.writer.get_trade_days_start(start_date_str)
+                    if cal_start > end_date_str:
+                        print("    Already up to date")
+                    else:
+                        trade_cal = downloader.standard_fetcher.fetch_trade_calendar(
+                            cal_start, end_date_str
                         )
-                        downloader.writer.write_trade_days(trade_days)
-                        print(f"    {len(trade_days)} days")
+                        if not trade_cal.empty:
+                            trade_days = trade_cal[trade_cal["is_trading_day"] == "1"]
+                            trade_days = trade_days.rename(
+                                columns={"calendar_date": "trade_date"}
+                            )
+                            downloader.writer.write_trade_days(trade_days)
+                            print(f"    {len(trade_days)} days")
                 except Exception as e:
                     logger.error(f"Failed to download trading calendar: {e}")
 
@@ -675,12 +740,17 @@ def download_all_data(
                 BENCHMARK_INDEX = BENCHMARK_CONFIG["default_index"]
                 print(f"  Benchmark index ({BENCHMARK_INDEX})...")
                 try:
-                    benchmark_df = downloader.unified_fetcher.fetch_index_data(
-                        BENCHMARK_INDEX, start_date_str, end_date_str
-                    )
-                    if not benchmark_df.empty:
-                        downloader.writer.write_benchmark(benchmark_df)
-                        print(f"    {len(benchmark_df)} days")
+                    # Only fetch bars after those already stored
+                    bench_start = downloader.writer.get_benchmark_start(start_date_str)
+                    if bench_start > end_date_str:
+                        print("    Already up to date")
+                    else:
+                        benchmark_df = downloader.unified_fetcher.fetch_index_data(
+                            BENCHMARK_INDEX, bench_start, end_date_str
+                        )
+                        if not benchmark_df.empty:
+                            downloader.writer.write_benchmark(benchmark_df)
+                            print(f"    {len(benchmark_df)} days")
                 except Exception as e:
                     logger.error(f"Failed to download benchmark: {e}")
 
@@ -691,46 +761,47 @@ def download_all_data(
                 # Get existing index constituent dates
                 existing_dates = set()
                 try:
-                    result = downloader.writer.conn.execute(
-                        "SELECT DISTINCT date FROM index_constituents"
-                    ).fetchall()
-                    existing_dates = {row[0] for row in result}
+                    existing_dates = downloader.writer.get_index_constituent_dates()
                 except Exception:
                     pass
 
                 index_sample_dates = generate_monthly_end_dates(
-                    START_DATE, end_date.strftime("%Y-%m-%d")
+                    START_DATE, end_date_str
                 )
 
-                # Filter to only new dates
-                new_dates = [d for d in index_sample_dates if d.strftime("%Y%m%d") not in existing_dates]
+                # Filter to only new dates, formatting each date once as the
+                # stored key (YYYYMMDD) and the BaoStock query date (ISO)
+                new_dates = []
+                for d in index_sample_dates:
+                    date_str = d.strftime("%Y%m%d")
+                    if date_str not in existing_dates:
+                        new_dates.append((date_str, d.date().isoformat()))
 
                 if not new_dates:
                     print(f"    All {len(index_sample_dates)} dates already downloaded")
                 else:
                     print(f"    Downloading {len(new_dates)} new dates (skipping {len(existing_dates)} existing)...")
-                    for date_obj in new_dates:
-                        date_str = date_obj.strftime("%Y%m%d")
-
+                    for date_str, query_date in new_dates:
+                        # All indexes of one date go through a single
+                        # prepared statement
+                        rows = []
                         for index_code in ["000016.SS", "000300.SS", "000905.SS"]:
                             try:
                                 stocks_df = downloader.standard_fetcher.fetch_index_stocks(
-                                    index_code, date_obj.strftime("%Y-%m-%d")
+                                    index_code, query_date
                                 )
                                 if not stocks_df.empty:
-                                    from simtradedata.utils.code_utils import (
-                                        convert_to_ptrade_code,
-                                    )
-
                                     ptrade_codes = [
                                         convert_to_ptrade_code(code, "baostock")
                                         for code in stocks_df["code"].tolist()
                                     ]
-                                    downloader.writer.write_index_constituents(
-                                        date_str, index_code, ptrade_codes
-                                    )
+                                    rows.append((date_str, index_code, ptrade_codes))
                             except Exception as e:
                                 logger.warning(f"Index {index_code} {date_str}: {e}")
+                        try:
+                            downloader.writer.write_index_constituents_batch(rows)
+                        except Exception as e:
+                            logger.warning(f"Index constituents {date_str}: {e}")
 
                     print(f"    Done ({len(new_dates)} dates)")
             except Exception as e:
@@ -18,7 +18,8 @@ import fcntl
 import logging
 import os
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pandas as pd
@@ -26,6 +27,8 @@ from tqdm import tqdm
 
 from simtradedata.config.field_mappings import BENCHMARK_CONFIG
 from simtradedata.fetchers.mootdx_unified_fetcher import MootdxUnifiedFetcher
+from simtradedata.utils.batching import batch_count, iter_batches
+from simtradedata.utils.code_utils import convert_to_ptrade_code
 from simtradedata.writers.duckdb_writer import DEFAULT_DB_PATH, DuckDBWriter
 
 # Configuration
@@ -40,6 +43,10 @@ END_DATE = None  # None means current date
 # Batch size for stock processing
 BATCH_SIZE = 20
 
+# Concurrent fetches: per-stock quotes over the shared (multithread) TDX
+# client, and per-quarter financial ZIP downloads
+FETCH_WORKERS = 4
+
 # Ensure log directory exists
 Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
 
@@ -99,98 +106,115 @@ class MootdxDownloader:
         skip_fundamentals: bool = False,
         download_dir: str = None,
     ):
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
         self.unified_fetcher = MootdxUnifiedFetcher(download_dir=download_dir)
-        self.writer = DuckDBWriter(db_path=str(self.db_path))
+        self.writer = DuckDBWriter(db_path=str(db_path))
 
         self.skip_fundamentals = skip_fundamentals
         self.download_dir = download_dir
         self.failed_stocks = []
 
-    def get_incremental_start_date(self, symbol: str) -> str:
-        """Get next date after MAX(date) for incremental updates."""
-        max_date = self.writer.get_max_date("stocks", symbol)
-        if max_date:
-            next_day = datetime.strptime(max_date, "%Y-%m-%d") + timedelta(days=1)
-            return next_day.strftime("%Y-%m-%d")
-        return START_DATE
-
-    def download_stock_data(
-        self, symbol: str, start_date: str, end_date: str
-    ) -> bool:
+    @property
+    def db_path(self) -> Path:
+        """Database path (owned by the writer)"""
+        return self.writer.db_path
+
+    def plan_incremental_starts(self, symbols: list) -> dict:
+        """Get next date after MAX(date) per symbol, with one batch query."""
+        max_dates = self.writer.get_max_dates("stocks", symbols)
+        return {
+            symbol: (max_dates[symbol] + timedelta(days=1)).isoformat()
+            if symbol in max_dates
+            else START_DATE
+            for symbol in symbols
+        }
+
+    def fetch_stock_data(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        actual_start: str = START_DATE,
+    ):
         """
-        Download daily OHLCV + adjust factor + XDXR for a single stock.
+        Fetch daily OHLCV + adjust factor + XDXR for a single stock.
+
+        Only touches the network, so it is safe to run in a worker thread;
+        the results are written by write_stock_data on the calling thread.
 
         Returns:
-            True if data was downloaded, False if skipped/failed
+            (market_df, adj_series, exrights) tuple, or None if skipped.
+            adj_series and exrights may be None when unavailable.
         """
-        try:
-            # Auto-incremental
-            actual_start = self.get_incremental_start_date(symbol)
-            if actual_start > start_date:
-                start_date = actual_start
+        # Auto-incremental: actual_start is planned per batch
+        if actual_start > start_date:
+            start_date = actual_start
+
+        if start_date > end_date:
+            return None  # Already up to date
+
+        # Fetch daily bars
+        df = self.unified_fetcher.fetch_daily_data(symbol, start_date, end_date)
 
-            if start_date > end_date:
-                return False  # Already up to date
+        if df.empty:
+            logger.warning(f"No data for {symbol}")
+            return None
 
-            # Fetch daily bars
-            df = self.unified_fetcher.fetch_daily_data(symbol, start_date, end_date)
+        # Raw bars as fetched, reused for the adjust factor calculation
+        raw_df = df
 
+        # Filter out empty rows (halted stocks return rows with all NaN)
+        price_cols = ["open", "high", "low", "close"]
+        available_cols = [c for c in price_cols if c in df.columns]
+        if available_cols:
+            df = df.dropna(subset=available_cols, how="all")
             if df.empty:
-                logger.warning(f"No data for {symbol}")
-                return False
-
-            # Filter out empty rows (halted stocks return rows with all NaN)
-            price_cols = ["open", "high", "low", "close"]
-            available_cols = [c for c in price_cols if c in df.columns]
-            if available_cols:
-                df = df.dropna(subset=available_cols, how="all")
-                if df.empty:
-                    logger.warning(f"No valid data for {symbol} (all rows empty)")
-                    return False
-
-            # Write market data (set date as index)
-            if "date" in df.columns:
-                market_df = df.set_index("date")
-            else:
-                market_df = df
-
-            # Rename amount -> money if needed
-            if "amount" in market_df.columns:
-                market_df = market_df.rename(columns={"amount": "money"})
-
-            self.writer.write_market_data(symbol, market_df)
-
-            # Fetch and write adjust factor
-            try:
-                adj_df = self.unified_fetcher.fetch_adjust_factor(
-                    symbol, start_date, end_date
-                )
-                if not adj_df.empty:
-                    adj_series = adj_df.set_index("date")["backAdjustFactor"]
-                    self.writer.write_adjust_factor(symbol, adj_series)
-            except Exception as e:
-                logger.warning(f"Failed to fetch adjust factor for {symbol}: {e}")
+                logger.warning(f"No valid data for {symbol} (all rows empty)")
+                return None
 
-            # Fetch and write XDXR data
-            try:
-                xdxr_df = self.unified_fetcher.fetch_xdxr(symbol)
-                if not xdxr_df.empty:
-                    # Convert XDXR to exrights format if possible
-                    exrights = self._convert_xdxr_to_exrights(xdxr_df)
-                    if not exrights.empty:
-                        self.writer.write_exrights(symbol, exrights)
-            except Exception as e:
-                logger.warning(f"Failed to fetch XDXR for {symbol}: {e}")
+        # Market data is written with date as index
+        if "date" in df.columns:
+            market_df = df.set_index("date")
+        else:
+            market_df = df
 
-            return True
+        # Rename amount -> money if needed
+        if "amount" in market_df.columns:
+            market_df = market_df.rename(columns={"amount": "money"})
 
+        # Fetch adjust factor
+        adj_series = None
+        try:
+            adj_df = self.unified_fetcher.fetch_adjust_factor(
+                symbol, start_date, end_date, raw_df=raw_df
+            )
+            if not adj_df.empty:
+                adj_series = adj_df.set_index("date")["backAdjustFactor"]
         except Exception as e:
-            logger.error(f"Failed to download {symbol}: {e}")
-            self.failed_stocks.append(symbol)
-            return False
+            logger.warning(f"Failed to fetch adjust factor for {symbol}: {e}")
+
+        # Fetch XDXR data
+        exrights = None
+        try:
+            xdxr_df = self.unified_fetcher.fetch_xdxr(symbol)
+            if not xdxr_df.empty:
+                # Convert XDXR to exrights format if possible
+                exrights = self._convert_xdxr_to_exrights(xdxr_df)
+        except Exception as e:
+            logger.warning(f"Failed to fetch XDXR for {symbol}: {e}")
+
+        return market_df, adj_series, exrights
+
+    def write_stock_data(self, symbol: str, fetched: tuple) -> None:
+        """Write the result of fetch_stock_data (calling thread only)."""
+        market_df, adj_series, exrights = fetched
+
+        self.writer.write_market_data(symbol, market_df)
+
+        if adj_series is not None:
+            self.writer.write_adjust_factor(symbol, adj_series)
+
+        if exrights is not None and not exrights.empty:
+            self.writer.write_exrights(symbol, exrights)
 
     def _convert_xdxr_to_exrights(self, xdxr_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -249,27 +273,64 @@ class MootdxDownloader:
         return result
 
     def download_batch(
-        self, stock_batch: list, start_date: str, end_date: str, pbar=None
+        self,
+        stock_batch: list,
+        start_date: str,
+        end_date: str,
+        pbar=None,
+        starts: dict | None = None,
     ) -> int:
-        """Download data for a batch of stocks in a single transaction."""
-        success_count = 0
+        """
+        Download data for a batch of stocks in a single transaction.
 
-        self.writer.begin()
-        try:
-            for stock in stock_batch:
-                try:
-                    if self.download_stock_data(stock, start_date, end_date):
-                        success_count += 1
-                except Exception as e:
-                    logger.error(f"Exception downloading {stock}: {e}")
-                finally:
-                    if pbar:
-                        pbar.update(1)
+        Network fetches run in a thread pool (FETCH_WORKERS); writes stay on
+        the calling thread, which owns the DuckDB connection. Writes are
+        deferred, so each table gets one upsert per batch, and are committed
+        by the writer's background thread while the next batch downloads.
+
+        starts may hold the incremental start dates already planned for the
+        whole run; otherwise they are looked up for this batch.
+        """
+        success_count = 0
 
-            self.writer.commit()
-        except Exception:
-            self.writer.rollback()
-            raise
+        # Resolve every start date up front so the workers only download
+        if starts is None:
+            starts = self.plan_incremental_starts(stock_batch)
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self.fetch_stock_data,
+                    stock,
+                    start_date,
+                    end_date,
+                    starts[stock],
+                ): stock
+                for stock in stock_batch
+            }
+
+            self.writer.begin(defer_writes=True)
+            try:
+                for future in as_completed(futures):
+                    stock = futures[future]
+                    try:
+                        fetched = future.result()
+                        if fetched is not None:
+                            self.write_stock_data(stock, fetched)
+                            success_count += 1
+                    except Exception as e:
+                        logger.error(f"Failed to download {stock}: {e}")
+                        self.failed_stocks.append(stock)
+                    finally:
+                        if pbar:
+                            pbar.update(1)
+
+                self.writer.commit_async()
+            except Exception:
+                self.writer.rollback()
+                for future in futures:
+                    future.cancel()
+                raise
 
         return success_count
 
@@ -285,7 +346,6 @@ class MootdxDownloader:
         Hash verification: Compares remote file hash with stored hash to detect
         updates. If hash differs, deletes old data and re-downloads.
         """
-        from simtradedata.fetchers.mootdx_affair_fetcher import MootdxAffairFetcher
         from simtradedata.utils.ttm_calculator import get_quarters_in_range
 
         quarters = get_quarters_in_range(start_date, end_date)
@@ -293,34 +353,32 @@ class MootdxDownloader:
             print("  No quarters in date range")
             return
 
-        # Create affair fetcher for hash lookups (same download dir as unified_fetcher)
-        affair_fetcher = MootdxAffairFetcher(download_dir=self.download_dir)
-
         print(f"  Total quarters: {len(quarters)}")
         print("  Checking for incremental updates...")
 
         # Get already completed quarters (may not have hash if downloaded with old code)
         completed_quarters = self.writer.get_completed_fundamental_quarters()
+        local_hash_map = self.writer.get_fundamental_quarter_hashes()
 
         # Batch fetch remote file info (one API call instead of N)
         try:
-            remote_files = affair_fetcher.list_available_reports()
+            remote_files = self.unified_fetcher.list_available_reports()
             remote_hash_map = {f.get("filename"): f.get("hash") for f in remote_files}
         except Exception as e:
-            logger.warning(f"Failed to fetch remote file list: {e}")
+            logger.warning("Failed to fetch remote file list: %s", e)
             remote_hash_map = {}
 
         pending = []
         skipped = 0
 
         for year, quarter in quarters:
-            filename = affair_fetcher.get_quarter_filename(year, quarter)
+            filename = self.unified_fetcher.get_quarter_filename(year, quarter)
             remote_hash = remote_hash_map.get(filename)
-            local_hash = self.writer.get_fundamental_quarter_hash(year, quarter)
+            local_hash = local_hash_map.get((year, quarter))
 
             if remote_hash is None:
                 # File not available on server
-                logger.info(f"File {filename} not available on TDX server")
+                logger.info("File %s not available on TDX server", filename)
                 continue
 
             # If already completed and hash matches (or no local hash recorded), skip
@@ -328,18 +386,24 @@ class MootdxDownloader:
                 if local_hash is None:
                     # Old record without hash - trust it as complete
                     skipped += 1
-                    logger.debug(f"Quarter {year}Q{quarter} already completed (no hash)")
+                    logger.debug(
+                        "Quarter %dQ%d already completed (no hash)", year, quarter
+                    )
                     continue
                 elif local_hash == remote_hash:
                     # Hash match, skip
                     skipped += 1
-                    logger.debug(f"Hash match for {year}Q{quarter}, skipping")
+                    logger.debug("Hash match for %dQ%d, skipping", year, quarter)
                     continue
                 else:
                     # Hash differs, need to re-download
                     print(f"    {year}Q{quarter}: hash changed, will re-download")
                     logger.info(
-                        f"Hash changed for {year}Q{quarter}: {local_hash} -> {remote_hash}"
+                        "Hash changed for %dQ%d: %s -> %s",
+                        year,
+                        quarter,
+                        local_hash,
+                        remote_hash,
                     )
 
             pending.append((year, quarter, filename, remote_hash))
@@ -352,69 +416,83 @@ class MootdxDownloader:
             f"  Pending: {len(pending)}, skipped (hash match): {skipped}"
         )
 
-        for qi, (year, quarter, filename, remote_hash) in enumerate(pending, 1):
-            print(f"\n  Quarter {qi}/{len(pending)}: {year}Q{quarter}")
+        # ZIP downloads for different quarters are independent, so fetch
+        # them concurrently and write each one on this thread as it lands
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self.unified_fetcher.fetch_fundamentals_for_quarter,
+                    year,
+                    quarter,
+                ): (year, quarter, filename, remote_hash)
+                for year, quarter, filename, remote_hash in pending
+            }
+
+            for qi, future in enumerate(as_completed(futures), 1):
+                year, quarter, filename, remote_hash = futures[future]
+                print(f"\n  Quarter {qi}/{len(pending)}: {year}Q{quarter}")
 
-            # Check if we need to delete old data first
-            old_hash = self.writer.get_fundamental_quarter_hash(year, quarter)
-            if old_hash is not None:
-                deleted = self.writer.delete_fundamental_quarter_data(year, quarter)
-                print(f"    Deleted {deleted} old records (hash changed)")
-
-            try:
-                fund_df = self.unified_fetcher.fetch_fundamentals_for_quarter(
-                    year, quarter
-                )
+                try:
+                    fund_df = future.result()
 
-                if fund_df.empty:
-                    logger.warning(f"No fundamentals for {year}Q{quarter}")
-                    # Still mark as completed (empty is valid state)
-                    self.writer.mark_fundamental_quarter_completed(
-                        year, quarter, 0,
-                        filename=filename, file_hash=remote_hash or ""
-                    )
-                    continue
+                    # Delete old data only once its replacement is fetched
+                    old_hash = local_hash_map.get((year, quarter))
+                    if old_hash is not None:
+                        deleted = self.writer.delete_fundamental_quarter_data(
+                            year, quarter
+                        )
+                        print(f"    Deleted {deleted} old records (hash changed)")
 
-                # Write per-stock fundamentals
-                success_count = 0
-                if "code" in fund_df.columns:
-                    self.writer.begin()
-                    try:
-                        for code, group in fund_df.groupby("code"):
-                            try:
-                                # Convert code to PTrade format
-                                from simtradedata.utils.code_utils import (
-                                    convert_to_ptrade_code,
-                                )
-                                ptrade_code = convert_to_ptrade_code(
-                                    str(code), "qstock"
-                                )
-
-                                write_df = group.drop(columns=["code"])
-                                if "end_date" in write_df.columns:
-                                    write_df = write_df.sort_values("end_date")
-                                    write_df = write_df.set_index("end_date")
-
-                                self.writer.write_fundamentals(ptrade_code, write_df)
-                                success_count += 1
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to write fundamentals for {code}: {e}"
-                                )
-
-                        # Record progress in same transaction
+                    if fund_df.empty:
+                        logger.warning(f"No fundamentals for {year}Q{quarter}")
+                        # Still mark as completed (empty is valid state)
                         self.writer.mark_fundamental_quarter_completed(
-                            year, quarter, success_count,
+                            year, quarter, 0,
                             filename=filename, file_hash=remote_hash or ""
                         )
-                        self.writer.commit()
-                        print(f"    Completed: {success_count} stocks (hash: {remote_hash[:8]}...)")
-                    except Exception:
-                        self.writer.rollback()
-                        raise
+                        continue
 
-            except Exception as e:
-                logger.error(f"Failed to download fundamentals {year}Q{quarter}: {e}")
+                    # Write per-stock fundamentals
+                    success_count = 0
+                    if "code" in fund_df.columns:
+                        self.writer.begin()
+                        try:
+                            for code, group in fund_df.groupby("code"):
+                                try:
+                                    # Convert code to PTrade format
+                                    ptrade_code = convert_to_ptrade_code(
+                                        str(code), "qstock"
+                                    )
+
+                                    write_df = group.drop(columns=["code"])
+                                    if "end_date" in write_df.columns:
+                                        write_df = write_df.sort_values("end_date")
+                                        write_df = write_df.set_index("end_date")
+
+                                    self.writer.write_fundamentals(
+                                        ptrade_code, write_df
+                                    )
+                                    success_count += 1
+                                except Exception as e:
+                                    logger.warning(
+                                        f"Failed to write fundamentals for {code}: {e}"
+                                    )
+
+                            # Record progress in same transaction
+                            self.writer.mark_fundamental_quarter_completed(
+                                year, quarter, success_count,
+                                filename=filename, file_hash=remote_hash or ""
+                            )
+                            self.writer.commit()
+                            print(f"    Completed: {success_count} stocks (hash: {remote_hash[:8]}...)")
+                        except Exception:
+                            self.writer.rollback()
+                            raise
+
+                except Exception as e:
+                    logger.error(
+                        f"Failed to download fundamentals {year}Q{quarter}: {e}"
+                    )
 
 
 def download_all_data(
@@ -440,12 +518,12 @@ def download_all_data(
         end_date = (
             datetime.now().date()
             if END_DATE is None
-            else datetime.strptime(END_DATE, "%Y-%m-%d").date()
+            else date.fromisoformat(END_DATE)
         )
 
         use_start_date = start_date or START_DATE
         start_date_str = use_start_date
-        end_date_str = end_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.isoformat()
 
         print(f"\nDate range: {start_date_str} ~ {end_date_str}")
 
@@ -463,13 +541,16 @@ def download_all_data(
             global_max_date = downloader.writer.get_max_date("stocks")
             skip_stock_download = False
             if global_max_date:
-                # Check if there's any new trading day since global_max_date
+                # Check if there's any new trading day since global_max_date:
+                # first against the stored calendar (weekends/holidays), then
                 # by fetching a single stock's data for the date range
-                test_df = downloader.unified_fetcher.fetch_daily_data(
-                    "000001.SZ",
-                    (datetime.strptime(global_max_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d"),
-                    end_date_str,
-                )
+                test_start = date.fromisoformat(global_max_date) + timedelta(days=1)
+                if downloader.writer.has_trading_day_between(test_start, end_date):
+                    test_df = downloader.unified_fetcher.fetch_daily_data(
+                        "000001.SZ", test_start.isoformat(), end_date_str
+                    )
+                else:
+                    test_df = pd.DataFrame()
                 if test_df.empty:
                     print(f"\nStocks data already up to date (max_date: {global_max_date})")
                     print("No new trading days since last update, skipping stock download.")
@@ -486,12 +567,8 @@ def download_all_data(
                     return
 
                 # Download in batches
-                batches = [
-                    stock_pool[i : i + BATCH_SIZE]
-                    for i in range(0, len(stock_pool), BATCH_SIZE)
-                ]
-
-                print(f"\nProcessing {len(stock_pool)} stocks in {len(batches)} batches...")
+                n_batches = batch_count(len(stock_pool), BATCH_SIZE)
+                print(f"\nProcessing {len(stock_pool)} stocks in {n_batches} batches...")
                 print(f"Batch size: {BATCH_SIZE}")
                 print("=" * 60)
 
@@ -504,17 +581,34 @@ def download_all_data(
                     ncols=100,
                     bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
                 ) as pbar:
-                    for batch in batches:
+                    # One GROUP BY over the whole pool instead of one per
+                    # batch; each stock is in a single batch, so the plan
+                    # stays valid while earlier batches are written
+                    starts = downloader.plan_incremental_starts(stock_pool)
+                    downloader.writer.start_background_writes()
+                    for batch in iter_batches(stock_pool, BATCH_SIZE):
+                        ticked_before = pbar.n
                         try:
                             success = downloader.download_batch(
-                                batch, start_date_str, end_date_str, pbar
+                                batch, start_date_str, end_date_str, pbar,
+                                starts=starts,
                             )
                             total_success += success
                         except Exception as e:
                             logger.error(f"Batch failed: {e}")
-                            pbar.update(len(batch))
+                            # Only advance past stocks the batch did not tick
+                            pbar.update(len(batch) - (pbar.n - ticked_before))
+                    failed_writes = downloader.writer.stop_background_writes()
+
+                # Stocks whose batch could not be written were counted as
+                # downloaded; move them to the failed list
+                lost = failed_writes - set(downloader.failed_stocks)
+                total_success -= len(lost)
+                downloader.failed_stocks.extend(sorted(lost))
 
                 print("=" * 60)
+                if failed_writes:
+                    print(f"Warning: {len(failed_writes)} stocks failed to write, see log")
                 print(
                     f"Download complete: {total_success} updated, "
                     f"{len(stock_pool) - total_success} skipped/failed"
@@ -536,16 +630,21 @@ def download_all_data(
             # Trading calendar
             print("  Trading calendar...")
             try:
-                trade_cal = downloader.unified_fetcher.fetch_trade_calendar(
-                    start_date_str, end_date_str
-                )
-                if not trade_cal.empty:
-                    trade_days = trade_cal[trade_cal["is_trading_day"] == "1"]
-                    trade_days = trade_days.rename(
-                        columns={"calendar_date": "trade_date"}
+                # Only fetch days after the calendar already stored
+                cal_start = downloader.writer.get_trade_days_start(start_date_str)
+                if cal_start > end_date_str:
+                    print("    Already up to date")
+                else:
+                    trade_cal = downloader.unified_fetcher.fetch_trade_calendar(
+                        cal_start, end_date_str
                     )
-                    downloader.writer.write_trade_days(trade_days)
-                    print(f"    {len(trade_days)} days")
+                    if not trade_cal.empty:
+                        trade_days = trade_cal[trade_cal["is_trading_day"] == "1"]
+                        trade_days = trade_days.rename(
+                            columns={"calendar_date": "trade_date"}
+                        )
+                        downloader.writer.write_trade_days(trade_days)
+                        print(f"    {len(trade_days)} days")
             except Exception as e:
                 logger.error(f"Failed to download trading calendar: {e}")
 
@@ -553,12 +652,17 @@ def download_all_data(
             benchmark = BENCHMARK_CONFIG["default_index"]
             print(f"  Benchmark index ({benchmark})...")
             try:
-                benchmark_df = downloader.unified_fetcher.fetch_index_data(
-                    benchmark, start_date_str, end_date_str
-                )
-                if not benchmark_df.empty:
-                    downloader.writer.write_benchmark(benchmark_df)
-                    print(f"    {len(benchmark_df)} days")
+                # Only fetch bars after those already stored
+                bench_start = downloader.writer.get_benchmark_start(start_date_str)
+                if bench_start > end_date_str:
+                    print("    Already up to date")
+                else:
+                    benchmark_df = downloader.unified_fetcher.fetch_index_data(
+                        benchmark, bench_start, end_date_str
+                    )
+                    if not benchmark_df.empty:
+                        downloader.writer.write_benchmark(benchmark_df)
+                        print(f"    {len(benchmark_df)} days")
             except Exception as e:
                 logger.error(f"Failed to download benchmark: {e}")
 
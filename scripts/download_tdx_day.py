@@ -38,6 +38,7 @@ from simtradedata.writers.duckdb_writer import DEFAULT_DB_PATH
 DOWNLOAD_URL = "https://data.tdx.com.cn/vipdoc/hsjday.zip"
 DOWNLOAD_DIR = Path("data/downloads")
 LOG_FILE = "data/download_tdx_day.log"
+CHUNK_SIZE = 1 << 20  # Bytes per read (one progress bar update each)
 
 # Ensure directories exist
 DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -112,14 +113,14 @@ def download_file(url: str, dest_path: Path, show_progress: bool = True) -> bool
                         ncols=100,
                     ) as pbar:
                         while True:
-                            chunk = response.read(8192)
+                            chunk = response.read(CHUNK_SIZE)
                             if not chunk:
                                 break
                             f.write(chunk)
                             pbar.update(len(chunk))
                 else:
                     while True:
-                        chunk = response.read(8192)
+                        chunk = response.read(CHUNK_SIZE)
                         if not chunk:
                             break
                         f.write(chunk)
@@ -262,15 +263,15 @@ Examples:
         print("=" * 60)
         print("Import Complete")
         print("=" * 60)
-        print(f"Files processed: {stats['files_processed']}")
-        print(f"Files skipped: {stats['files_skipped']}")
-        print(f"Records imported: {stats['records_imported']}")
+        print(f"Files processed: {stats.files_processed}")
+        print(f"Files skipped: {stats.files_skipped}")
+        print(f"Records imported: {stats.records_imported}")
 
-        if stats["records_backfilled"] > 0:
-            print(f"  - Backfilled (historical): {stats['records_backfilled']}")
+        if stats.records_backfilled > 0:
+            print(f"  - Backfilled (historical): {stats.records_backfilled}")
 
-        if stats["records_skipped"] > 0:
-            print(f"Records skipped (up to date): {stats['records_skipped']}")
+        if stats.records_skipped > 0:
+            print(f"Records skipped (up to date): {stats.records_skipped}")
 
     finally:
         importer.close()
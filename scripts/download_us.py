@@ -6,7 +6,7 @@ Uses yfinance to fetch US stock data:
 - Phase 1: Stock list from NASDAQ trader file
 - Phase 2: Batch OHLCV + adjust factors + preclose (yf.download)
 - Phase 3: Per-stock fundamentals + valuation
-- Phase 4: Per-stock metadata + exrights
+- Phase 4: Per-stock metadata + exrights (fetched in the same pass as Phase 3)
 - Phase 5: Benchmark + trade_days + index_constituents
 
 Output: DuckDB database (data/us_stocks.duckdb)
@@ -17,13 +17,15 @@ import fcntl
 import logging
 import os
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pandas as pd
 from tqdm import tqdm
 
 from simtradedata.fetchers.yfinance_fetcher import YFinanceFetcher
+from simtradedata.utils.batching import iter_batches
 from simtradedata.writers.duckdb_writer import DuckDBWriter
 
 # Configuration
@@ -40,6 +42,13 @@ END_DATE = None  # None means current date
 OHLCV_BATCH_SIZE = 50  # yf.download batch size
 COMMIT_BATCH_SIZE = 20  # DB commit batch size
 
+# Concurrent per-stock fetches (each worker still throttles between calls)
+FETCH_WORKERS = 4
+
+# Symbols whose incremental starts are at most this many days apart share
+# one yf.download call (starting at the earliest of them)
+START_MERGE_DAYS = 7
+
 # Ensure log directory exists
 Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
 
@@ -52,6 +61,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def group_by_start(
+    symbol_starts: dict[str, str],
+    end_date: str,
+    merge_days: int = START_MERGE_DAYS,
+) -> list[tuple[str, list[str]]]:
+    """
+    Coalesce symbols with nearby start dates into shared download ranges.
+
+    Symbols already up to date (start after end_date) are dropped. A new
+    group is opened whenever a start lies more than merge_days after the
+    current group's start, so one newly listed symbol no longer drags the
+    rest of the batch back to its full history.
+
+    Returns:
+        List of (group_start, symbols) in ascending start order
+    """
+    groups = []
+    group_day = None  # parsed start of the current group
+    for start, symbol in sorted(
+        (start, symbol)
+        for symbol, start in symbol_starts.items()
+        if start <= end_date
+    ):
+        day = date.fromisoformat(start)
+        if group_day is None or (day - group_day).days > merge_days:
+            group_day = day
+            groups.append((start, []))
+        groups[-1][1].append(symbol)
+    return groups
+
+
 class ProcessLock:
     """Process lock to prevent multiple instances from running simultaneously."""
 
@@ -93,23 +133,27 @@ class USDownloader:
     """US stock data downloader with DuckDB storage."""
 
     def __init__(self, db_path: str, symbols: list[str] | None = None):
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
         self.fetcher = YFinanceFetcher()
-        self.writer = DuckDBWriter(db_path=str(self.db_path))
+        self.writer = DuckDBWriter(db_path=str(db_path))
         self.custom_symbols = symbols
         self.failed_stocks = []
 
-    def get_incremental_start_date(
-        self, symbol: str, default_start: str
-    ) -> str:
-        """Get next date after MAX(date) for incremental updates."""
-        max_date = self.writer.get_max_date("stocks", symbol)
-        if max_date:
-            next_day = datetime.strptime(max_date, "%Y-%m-%d") + timedelta(days=1)
-            return next_day.strftime("%Y-%m-%d")
-        return default_start
+    @property
+    def db_path(self) -> Path:
+        """Database path (owned by the writer)"""
+        return self.writer.db_path
+
+    def plan_incremental_starts(
+        self, symbols: list[str], default_start: str
+    ) -> dict[str, str]:
+        """Get next date after MAX(date) per symbol, with one batch query."""
+        max_dates = self.writer.get_max_dates("stocks", symbols)
+        return {
+            symbol: (max_dates[symbol] + timedelta(days=1)).isoformat()
+            if symbol in max_dates
+            else default_start
+            for symbol in symbols
+        }
 
     # ========================================
     # Phase 1: Stock list
@@ -140,28 +184,35 @@ class USDownloader:
         Returns:
             Number of symbols successfully written.
         """
-        # Determine per-symbol start dates for incremental update
-        # Use the earliest needed start for the batch download
-        symbol_starts = {}
-        earliest_start = end_date
-        for sym in symbols:
-            sym_start = self.get_incremental_start_date(sym, start_date)
-            symbol_starts[sym] = sym_start
-            if sym_start < earliest_start:
-                earliest_start = sym_start
-
-        if earliest_start > end_date:
+        # Determine per-symbol start dates for incremental update, then
+        # download each group of nearby starts with one batch call
+        symbol_starts = self.plan_incremental_starts(symbols, start_date)
+        groups = group_by_start(symbol_starts, end_date)
+
+        if not groups:
             return 0  # All symbols up to date
 
-        # Batch download
-        data = self.fetcher.fetch_batch_ohlcv(symbols, earliest_start, end_date)
-        if not data:
-            return 0
+        success = 0
+        for group_start, group in groups:
+            # OHLCV and adjust factors come from the same download
+            data, adj_data = self.fetcher.fetch_batch_ohlcv_with_adjust(
+                group, group_start, end_date
+            )
+            if not data:
+                continue
 
-        # Also get adjust factors in the same batch
-        adj_data = self.fetcher.fetch_adjust_factors(symbols, earliest_start, end_date)
+            success += self._write_ohlcv(group, data, adj_data, symbol_starts)
 
-        # Write per-symbol
+        return success
+
+    def _write_ohlcv(
+        self,
+        symbols: list[str],
+        data: dict,
+        adj_data: dict,
+        symbol_starts: dict[str, str],
+    ) -> int:
+        """Write downloaded OHLCV + adjust factors in one transaction."""
         success = 0
         self.writer.begin()
         try:
@@ -170,7 +221,7 @@ class USDownloader:
                     continue
 
                 df = data[sym]
-                sym_start = symbol_starts.get(sym, start_date)
+                sym_start = symbol_starts[sym]
 
                 # Filter to only new data
                 df = df[df.index >= pd.Timestamp(sym_start)]
@@ -200,129 +251,186 @@ class USDownloader:
         return success
 
     # ========================================
-    # Phase 3: Per-stock fundamentals + valuation
+    # Phase 3+4: Per-stock fundamentals, valuation, metadata, exrights
     # ========================================
 
-    def download_fundamentals_and_valuation(
+    def _fetch_stock_data(
         self,
-        symbols: list[str],
-        pbar=None,
-    ) -> int:
-        """
-        Download fundamentals and valuation data per-stock.
+        symbol: str,
+        ohlcv: pd.DataFrame | None,
+        with_metadata: bool,
+        fetch_meta: bool,
+    ) -> tuple:
+        """Fetch all per-stock data for one stock (runs in worker thread).
+
+        Args:
+            symbol: Stock code
+            ohlcv: OHLCV from DB for valuation, or None to skip Phase 3
+            with_metadata: Fetch Phase 4 data (exrights, plus metadata)
+            fetch_meta: Fetch metadata (False when already in the DB)
 
         Returns:
-            Number of symbols successfully processed.
+            (fund, meta): each phase's result, or None if the phase was
+            skipped, or the exception it raised. fund is (fund_df, val_df)
+            and meta is (info, exr_df). The phases fail independently.
         """
-        success = 0
-        batch_count = 0
+        fund = meta = None
 
-        self.writer.begin()
-        try:
-            for sym in symbols:
-                try:
-                    # Fundamentals
-                    fund_df = self.fetcher.fetch_fundamentals(sym)
-                    if not fund_df.empty:
-                        self.writer.write_fundamentals(sym, fund_df)
-
-                    # Valuation (needs OHLCV from DB)
-                    ohlcv = self._load_ohlcv_from_db(sym)
-                    if not ohlcv.empty:
-                        val_df = self.fetcher.fetch_valuation_data(sym, ohlcv)
-                        if not val_df.empty:
-                            self.writer.write_valuation(sym, val_df)
-
-                    success += 1
-                    self.fetcher._throttle()
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed fundamentals/valuation for {sym}: {e}"
-                    )
-                    self.failed_stocks.append(sym)
-                finally:
-                    batch_count += 1
-                    if pbar:
-                        pbar.update(1)
-
-                    # Commit every COMMIT_BATCH_SIZE stocks
-                    if batch_count % COMMIT_BATCH_SIZE == 0:
-                        self.writer.commit()
-                        self.writer.begin()
-
-            self.writer.commit()
-        except Exception:
-            self.writer.rollback()
-            raise
+        if ohlcv is not None:
+            try:
+                fund_df = self.fetcher.fetch_fundamentals(symbol)
+                val_df = pd.DataFrame()
+                if not ohlcv.empty:
+                    val_df = self.fetcher.fetch_valuation_data(symbol, ohlcv)
+                fund = (fund_df, val_df)
+            except Exception as e:
+                fund = e
+            finally:
+                self.fetcher._throttle()
+
+        if with_metadata:
+            try:
+                info = self.fetcher.fetch_metadata(symbol) if fetch_meta else None
+                exr_df = self.fetcher.fetch_exrights(symbol)
+                meta = (info, exr_df)
+            except Exception as e:
+                meta = e
+            finally:
+                self.fetcher._throttle()
 
-        return success
+        return fund, meta
 
-    # ========================================
-    # Phase 4: Per-stock metadata + exrights
-    # ========================================
-
-    def download_metadata_and_exrights(
+    def download_per_stock_data(
         self,
         symbols: list[str],
+        with_fundamentals: bool = True,
+        with_metadata: bool = True,
         pbar=None,
-    ) -> int:
+    ) -> tuple[int, int]:
         """
-        Download metadata and exrights data per-stock.
+        Download fundamentals/valuation (Phase 3) and metadata/exrights
+        (Phase 4) in a single pass over the stocks.
+
+        Stocks are processed in chunks of COMMIT_BATCH_SIZE: OHLCV for the
+        chunk is loaded from DuckDB on the calling thread (one query per
+        chunk), each stock's fetches for both phases run together in a
+        thread pool (FETCH_WORKERS), and results are written and committed
+        on the calling thread. The DuckDB connection is not shared across
+        threads.
+
+        Metadata is only fetched for symbols not yet in stock_metadata,
+        found with one query up front, which skips the ticker.info request
+        for every known stock on incremental runs.
 
         Returns:
-            Number of symbols successfully processed.
+            (fundamentals successes, metadata successes)
         """
-        success = 0
-        batch_count = 0
+        fund_success = 0
+        meta_success = 0
+        known = (
+            set(self.writer.get_existing_stocks("stock_metadata"))
+            if with_metadata
+            else set()
+        )
 
-        self.writer.begin()
-        try:
-            for sym in symbols:
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            for chunk in iter_batches(symbols, COMMIT_BATCH_SIZE):
+                # Valuation needs OHLCV from DB; read it before handing off
+                ohlcv = self._load_ohlcv_from_db(chunk) if with_fundamentals else {}
+                futures = {
+                    executor.submit(
+                        self._fetch_stock_data,
+                        sym,
+                        ohlcv.get(sym, pd.DataFrame()) if with_fundamentals else None,
+                        with_metadata,
+                        sym not in known,
+                    ): sym
+                    for sym in chunk
+                }
+
+                self.writer.begin()
                 try:
-                    # Metadata
-                    meta = self.fetcher.fetch_metadata(sym)
-                    if meta:
-                        meta_df = pd.DataFrame([meta])
-                        self.writer.write_stock_metadata(meta_df)
-
-                    # Exrights
-                    exr_df = self.fetcher.fetch_exrights(sym)
-                    if not exr_df.empty:
-                        self.writer.write_exrights(sym, exr_df)
-
-                    success += 1
-                    self.fetcher._throttle()
-
-                except Exception as e:
-                    logger.warning(f"Failed metadata/exrights for {sym}: {e}")
-                    self.failed_stocks.append(sym)
-                finally:
-                    batch_count += 1
-                    if pbar:
-                        pbar.update(1)
-
-                    if batch_count % COMMIT_BATCH_SIZE == 0:
-                        self.writer.commit()
-                        self.writer.begin()
-
-            self.writer.commit()
-        except Exception:
-            self.writer.rollback()
-            raise
-
-        return success
+                    for future in as_completed(futures):
+                        sym = futures[future]
+                        try:
+                            fund, meta = future.result()
+                        except Exception as e:
+                            fund = meta = e
+
+                        if fund is not None:
+                            try:
+                                if isinstance(fund, Exception):
+                                    raise fund
+                                fund_df, val_df = fund
+                                if not fund_df.empty:
+                                    self.writer.write_fundamentals(sym, fund_df)
+                                if not val_df.empty:
+                                    self.writer.write_valuation(sym, val_df)
+                                fund_success += 1
+                            except Exception as e:
+                                logger.warning(
+                                    f"Failed fundamentals/valuation for {sym}: {e}"
+                                )
+                                self.failed_stocks.append(sym)
+
+                        if meta is not None:
+                            try:
+                                if isinstance(meta, Exception):
+                                    raise meta
+                                info, exr_df = meta
+                                if info:
+                                    meta_df = pd.DataFrame([info])
+                                    self.writer.write_stock_metadata(meta_df)
+                                if not exr_df.empty:
+                                    self.writer.write_exrights(sym, exr_df)
+                                meta_success += 1
+                            except Exception as e:
+                                logger.warning(
+                                    f"Failed metadata/exrights for {sym}: {e}"
+                                )
+                                self.failed_stocks.append(sym)
+
+                        if pbar:
+                            pbar.update(1)
+
+                    self.writer.commit()
+                except Exception:
+                    self.writer.rollback()
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        return fund_success, meta_success
 
     # ========================================
     # Phase 5: Benchmark + trade_days + index_constituents
     # ========================================
 
     def download_global_data(self, start_date: str, end_date: str) -> None:
-        """Download benchmark, trade days, and index constituents."""
+        """Download benchmark, trade days, and index constituents.
+
+        The two constituent lists come from Wikipedia and do not depend on
+        the benchmark, so they are fetched in the background while the
+        benchmark downloads. All writes stay on the calling thread.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sp500_future = executor.submit(self.fetcher.fetch_index_constituents_sp500)
+            ndx_future = executor.submit(self.fetcher.fetch_index_constituents_ndx100)
+            self._download_benchmark(start_date, end_date)
+            self._write_index_constituents(sp500_future, ndx_future)
+
+    def _download_benchmark(self, start_date: str, end_date: str) -> None:
+        """Download benchmark bars and derive trade days from them."""
         # Benchmark (S&P 500) + Trade days (from same data)
         print("  Benchmark (S&P 500) + Trade days...")
         try:
-            bench_df = self.fetcher.fetch_benchmark(start_date, end_date)
+            # Only fetch bars after those already stored
+            bench_start = self.writer.get_benchmark_start(start_date)
+            if bench_start > end_date:
+                print("    Already up to date")
+                bench_df = pd.DataFrame()
+            else:
+                bench_df = self.fetcher.fetch_benchmark(bench_start, end_date)
             if not bench_df.empty:
                 self.writer.write_benchmark(bench_df)
                 trade_days = pd.DataFrame({"date": bench_df.index})
@@ -331,12 +439,17 @@ class USDownloader:
         except Exception as e:
             logger.error(f"Failed to download benchmark: {e}")
 
-        # Index constituents
+    def _write_index_constituents(
+        self, sp500_future: Future, ndx_future: Future
+    ) -> None:
+        """Write the constituent lists once their fetches complete."""
+        # Index constituents (both snapshots are stamped with the same day)
+        today = date.today().isoformat()
+
         print("  Index constituents (S&P 500)...")
         try:
-            sp500 = self.fetcher.fetch_index_constituents_sp500()
+            sp500 = sp500_future.result()
             if sp500:
-                today = datetime.now().strftime("%Y-%m-%d")
                 self.writer.write_index_constituents(today, "SPX.US", sp500)
                 print(f"    S&P 500: {len(sp500)} stocks")
         except Exception as e:
@@ -344,9 +457,8 @@ class USDownloader:
 
         print("  Index constituents (NASDAQ-100)...")
         try:
-            ndx = self.fetcher.fetch_index_constituents_ndx100()
+            ndx = ndx_future.result()
             if ndx:
-                today = datetime.now().strftime("%Y-%m-%d")
                 self.writer.write_index_constituents(today, "NDX.US", ndx)
                 print(f"    NASDAQ-100: {len(ndx)} stocks")
         except Exception as e:
@@ -356,20 +468,31 @@ class USDownloader:
     # Helpers
     # ========================================
 
-    def _load_ohlcv_from_db(self, symbol: str) -> pd.DataFrame:
-        """Load existing OHLCV data from DuckDB for valuation calculation."""
+    def _load_ohlcv_from_db(self, symbols: list[str]) -> dict[str, pd.DataFrame]:
+        """
+        Load existing OHLCV data from DuckDB for valuation calculation.
+
+        One columnar query covers the whole chunk and reads only the columns
+        valuation uses (close, volume); the frame is then split per symbol.
+
+        Returns:
+            Dict mapping symbol -> date-indexed DataFrame (symbols without
+            data are absent)
+        """
         try:
-            df = self.writer.conn.execute(
-                "SELECT date, open, high, low, close, volume FROM stocks WHERE symbol = ? ORDER BY date",
-                [symbol],
-            ).fetchdf()
-            if df.empty:
-                return pd.DataFrame()
-            df["date"] = pd.to_datetime(df["date"])
-            df = df.set_index("date")
-            return df
+            df = self.writer.conn.execute("""
+                SELECT symbol, date, close, volume FROM stocks
+                WHERE symbol IN (SELECT unnest(?::VARCHAR[]))
+                ORDER BY symbol, date
+            """, [list(symbols)]).fetchdf()
         except Exception:
-            return pd.DataFrame()
+            return {}
+
+        df["date"] = pd.to_datetime(df["date"])
+        return {
+            symbol: group.drop(columns="symbol").set_index("date")
+            for symbol, group in df.groupby("symbol", sort=False)
+        }
 
 
 def download_us_data(
@@ -395,10 +518,10 @@ def download_us_data(
         end_date = (
             datetime.now().date()
             if END_DATE is None
-            else datetime.strptime(END_DATE, "%Y-%m-%d").date()
+            else date.fromisoformat(END_DATE)
         )
         use_start_date = start_date or START_DATE
-        end_date_str = end_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.isoformat()
 
         print(f"Date range: {use_start_date} ~ {end_date_str}")
 
@@ -426,10 +549,6 @@ def download_us_data(
 
             # Phase 2: Batch OHLCV + adjust factors
             print("\n--- Phase 2: Batch OHLCV + Adjust Factors ---")
-            ohlcv_batches = [
-                stock_list[i : i + OHLCV_BATCH_SIZE]
-                for i in range(0, len(stock_list), OHLCV_BATCH_SIZE)
-            ]
             total_ohlcv = 0
 
             with tqdm(
@@ -438,7 +557,7 @@ def download_us_data(
                 unit="stock",
                 ncols=100,
             ) as pbar:
-                for batch in ohlcv_batches:
+                for batch in iter_batches(stock_list, OHLCV_BATCH_SIZE):
                     try:
                         n = downloader.download_ohlcv_batch(
                             batch, use_start_date, end_date_str
@@ -450,37 +569,33 @@ def download_us_data(
 
             print(f"OHLCV complete: {total_ohlcv} stocks updated")
 
-            # Phase 3: Per-stock fundamentals + valuation
-            if not skip_fundamentals:
-                print("\n--- Phase 3: Fundamentals + Valuation ---")
-                with tqdm(
-                    total=len(stock_list),
-                    desc="Fundamentals",
-                    unit="stock",
-                    ncols=100,
-                ) as pbar:
-                    n = downloader.download_fundamentals_and_valuation(
-                        stock_list, pbar
-                    )
-                print(f"Fundamentals complete: {n} stocks")
+            # Phase 3+4: Per-stock fundamentals/valuation and metadata/exrights,
+            # fetched in one pass over the stocks
+            if skip_fundamentals and skip_metadata:
+                print("\n--- Phase 3+4: Skipped (--skip-fundamentals, --skip-metadata) ---")
             else:
-                print("\n--- Phase 3: Skipped (--skip-fundamentals) ---")
-
-            # Phase 4: Per-stock metadata + exrights
-            if not skip_metadata:
-                print("\n--- Phase 4: Metadata + Exrights ---")
+                phases = []
+                if not skip_fundamentals:
+                    phases.append("Fundamentals + Valuation")
+                if not skip_metadata:
+                    phases.append("Metadata + Exrights")
+                print(f"\n--- Phase 3+4: {', '.join(phases)} ---")
                 with tqdm(
                     total=len(stock_list),
-                    desc="Metadata",
+                    desc="Per-stock data",
                     unit="stock",
                     ncols=100,
                 ) as pbar:
-                    n = downloader.download_metadata_and_exrights(
-                        stock_list, pbar
+                    n_fund, n_meta = downloader.download_per_stock_data(
+                        stock_list,
+                        with_fundamentals=not skip_fundamentals,
+                        with_metadata=not skip_metadata,
+                        pbar=pbar,
                     )
-                print(f"Metadata complete: {n} stocks")
-            else:
-                print("\n--- Phase 4: Skipped (--skip-metadata) ---")
+                if not skip_fundamentals:
+                    print(f"Fundamentals complete: {n_fund} stocks")
+                if not skip_metadata:
+                    print(f"Metadata complete: {n_meta} stocks")
 
             # Phase 5: Global data
             print("\n--- Phase 5: Global Data ---")
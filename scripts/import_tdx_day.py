@@ -7,9 +7,10 @@ Download: 沪深日线 (hsjday.zip) / 北交所日线 (bjday.zip)
 
 Features:
 1. Parse TDX binary .day format (32 bytes per record)
-2. Auto-incremental: only imports data newer than existing records
+2. Auto-incremental: only imports dates not already in the database
 3. Batch processing with transaction support
 4. Supports ZIP files with backslash paths (Windows format)
+5. Skips a ZIP that is unchanged since its last incremental import
 
 Usage:
     # Import from ZIP file
@@ -27,13 +28,14 @@ Usage:
 
 import argparse
 import logging
-import struct
 import tempfile
 import zipfile
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Tuple
+from typing import Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
@@ -43,10 +45,38 @@ from simtradedata.writers.duckdb_writer import DEFAULT_DB_PATH, DuckDBWriter
 # Configuration
 LOG_FILE = "data/import_tdx_day.log"
 BATCH_SIZE = 50  # Number of stocks per transaction
+PROGRESS_STEP = 100  # Files read between progress bar updates
+
+# version_info key recording the last ZIP imported incrementally
+SOURCE_FINGERPRINT_KEY = "tdx_day_source"
 
 # TDX binary format constants
 RECORD_SIZE = 32  # bytes per record
-RECORD_FORMAT = "<IIIIIfII"  # date, open, high, low, close, amount, volume, reserved
+RECORD_DTYPE = np.dtype(
+    [
+        ("date", "<u4"),
+        ("open", "<u4"),
+        ("high", "<u4"),
+        ("low", "<u4"),
+        ("close", "<u4"),
+        ("amount", "<f4"),
+        ("volume", "<u4"),
+        ("reserved", "<u4"),
+    ]
+)
+
+# TDX market prefix -> PTrade suffix
+MARKET_SUFFIX = {"sh": "SS", "sz": "SZ", "bj": "BJ"}
+
+# Stock code prefixes per market (indices/funds/bonds are excluded):
+# - Shanghai: 600xxx, 601xxx, 603xxx, 605xxx (main), 688xxx, 689xxx (STAR)
+# - Shenzhen: 000xxx-003xxx (main board), 300xxx, 301xxx (ChiNext)
+# - Beijing: 43xxxx, 83xxxx, 87xxxx, 92xxxx (mostly)
+STOCK_CODE_PREFIXES = {
+    "sh": ("6",),
+    "sz": ("00", "30"),
+    "bj": ("43", "83", "87", "92"),
+}
 
 # Ensure log directory exists
 Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
@@ -89,61 +119,69 @@ def parse_tdx_day_file(data: bytes) -> pd.DataFrame:
         return pd.DataFrame()
 
     num_records = len(data) // RECORD_SIZE
-    records = []
-
-    for i in range(num_records):
-        offset = i * RECORD_SIZE
-        record = data[offset : offset + RECORD_SIZE]
 
-        try:
-            date_int, open_p, high, low, close, amount, volume, _ = struct.unpack(
-                RECORD_FORMAT, record
-            )
+    # The record layout is fixed, so view the buffer as a structured array
+    # instead of unpacking records one at a time in the interpreter. Price,
+    # volume and amount columns stay in their stored uint32/float32 form and
+    # are widened only for the rows that are kept
+    records = np.frombuffer(data, dtype=RECORD_DTYPE, count=num_records)
+    date_ints = records["date"].astype(np.int64)
+
+    # Parse YYYYMMDD dates with integer arithmetic (no per-record strings)
+    years = date_ints // 10000
+    months = (date_ints % 10000) // 100
+    days = date_ints % 100
+
+    # Skip invalid dates
+    valid = (
+        (years >= 1990) & (years <= 2100)
+        & (months >= 1) & (months <= 12)
+        & (days >= 1) & (days <= 31)
+    )
+    years, months, days = years[valid], months[valid], days[valid]
 
-            # Parse date
-            year = date_int // 10000
-            month = (date_int % 10000) // 100
-            day = date_int % 100
+    month_start = (years - 1970).astype("datetime64[Y]") + (months - 1).astype(
+        "timedelta64[M]"
+    )
+    dates = month_start + (days - 1).astype("timedelta64[D]")
 
-            # Skip invalid dates
-            if year < 1990 or year > 2100 or month < 1 or month > 12 or day < 1 or day > 31:
-                continue
+    # Drop days past month end (e.g. Feb 30), which would roll into next month
+    in_month = dates.astype("datetime64[M]") == month_start
+    dates = dates[in_month]
+    if dates.size == 0:
+        return pd.DataFrame()
 
-            # Convert prices from fen to yuan
-            records.append(
-                {
-                    "date": f"{year:04d}-{month:02d}-{day:02d}",
-                    "open": open_p / 100.0,
-                    "high": high / 100.0,
-                    "low": low / 100.0,
-                    "close": close / 100.0,
-                    "volume": volume,
-                    "money": amount,
-                }
-            )
-        except struct.error:
-            continue
+    keep = np.flatnonzero(valid)[in_month]
 
-    if not records:
-        return pd.DataFrame()
+    kept = records[keep]
 
-    df = pd.DataFrame(records)
-    df["date"] = pd.to_datetime(df["date"])
-    return df
+    # Convert prices from fen to yuan
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(dates.astype("datetime64[ns]")),
+            "open": kept["open"] / 100.0,
+            "high": kept["high"] / 100.0,
+            "low": kept["low"] / 100.0,
+            "close": kept["close"] / 100.0,
+            "volume": kept["volume"].astype(np.int64),
+            "money": kept["amount"].astype(np.float64),
+        }
+    )
 
 
-def iter_day_files_from_zip(zip_path: Path) -> Iterator[Tuple[str, bytes]]:
+def list_day_files_in_zip(zip_path: Path) -> List[Tuple[str, str]]:
     """
-    Iterate over .day files in a ZIP archive.
+    List .day files in a ZIP archive.
 
     Handles Windows-style backslash paths in ZIP files.
 
     Args:
         zip_path: Path to ZIP file
 
-    Yields:
-        Tuples of (filename, file_content)
+    Returns:
+        List of (filename, archive member name) tuples
     """
+    members = []
     with zipfile.ZipFile(zip_path, "r") as zf:
         for name in zf.namelist():
             # Normalize path separators
@@ -156,14 +194,34 @@ def iter_day_files_from_zip(zip_path: Path) -> Iterator[Tuple[str, bytes]]:
                 continue
 
             # Extract filename (e.g., sh600000.day)
-            filename = normalized.split("/")[-1]
+            members.append((normalized.split("/")[-1], name))
+    return members
+
 
+def iter_day_files_from_zip(
+    zip_path: Path, members: List[Tuple[str, str]] | None = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Iterate over .day files in a ZIP archive.
+
+    Args:
+        zip_path: Path to ZIP file
+        members: Result of list_day_files_in_zip(), to avoid listing twice
+
+    Yields:
+        Tuples of (filename, file_content)
+    """
+    if members is None:
+        members = list_day_files_in_zip(zip_path)
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        for filename, name in members:
             yield filename, zf.read(name)
 
 
-def iter_day_files_from_dir(dir_path: Path) -> Iterator[Tuple[str, bytes]]:
+def list_day_files_in_dir(dir_path: Path) -> List[Path]:
     """
-    Iterate over .day files in a directory structure.
+    List .day files in a directory structure.
 
     Expected structure:
     - dir_path/sh/lday/*.day
@@ -173,16 +231,35 @@ def iter_day_files_from_dir(dir_path: Path) -> Iterator[Tuple[str, bytes]]:
     Args:
         dir_path: Path to root directory
 
-    Yields:
-        Tuples of (filename, file_content)
+    Returns:
+        List of .day file paths
     """
+    day_files = []
     for market in ["sh", "sz", "bj"]:
         lday_dir = dir_path / market / "lday"
-        if not lday_dir.exists():
-            continue
+        if lday_dir.exists():
+            day_files.extend(lday_dir.glob("*.day"))
+    return day_files
+
+
+def iter_day_files_from_dir(
+    dir_path: Path, day_files: List[Path] | None = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Iterate over .day files in a directory structure.
+
+    Args:
+        dir_path: Path to root directory
+        day_files: Result of list_day_files_in_dir(), to avoid globbing twice
+
+    Yields:
+        Tuples of (filename, file_content)
+    """
+    if day_files is None:
+        day_files = list_day_files_in_dir(dir_path)
 
-        for day_file in lday_dir.glob("*.day"):
-            yield day_file.name, day_file.read_bytes()
+    for day_file in day_files:
+        yield day_file.name, day_file.read_bytes()
 
 
 def filename_to_ptrade_code(filename: str) -> str:
@@ -203,8 +280,7 @@ def filename_to_ptrade_code(filename: str) -> str:
     code = base[2:]  # 600000, 000001, etc.
 
     # Map to PTrade suffix
-    suffix_map = {"sh": "SS", "sz": "SZ", "bj": "BJ"}
-    suffix = suffix_map.get(market, "")
+    suffix = MARKET_SUFFIX.get(market, "")
 
     if not suffix:
         return None
@@ -223,74 +299,82 @@ def is_stock_code(filename: str) -> bool:
         True if it's a stock code
     """
     base = filename.replace(".day", "")
-    market = base[:2]
     code = base[2:]
 
     if len(code) != 6:
         return False
 
-    # Shanghai stocks: 600xxx, 601xxx, 603xxx, 605xxx (main), 688xxx, 689xxx (STAR)
-    # Shenzhen stocks: 000xxx, 001xxx, 002xxx, 003xxx (main), 300xxx, 301xxx (ChiNext)
-    # Beijing stocks: 43xxxx, 83xxxx, 87xxxx, 92xxxx (mostly)
-    # Indices: usually start with 000xxx (SH) or 399xxx (SZ)
+    prefixes = STOCK_CODE_PREFIXES.get(base[:2])
+    return prefixes is not None and code.startswith(prefixes)
+
+
+def source_fingerprint(source_path: Path) -> str | None:
+    """
+    Cheap change marker for a ZIP source (name, size and mtime).
+
+    Directories are not fingerprinted, since that would mean a stat()
+    for every .day file.
+
+    Args:
+        source_path: Path to ZIP file or directory
+
+    Returns:
+        Fingerprint string, or None for directories
+    """
+    if not source_path.is_file():
+        return None
+    st = source_path.stat()
+    return f"{source_path.name}:{st.st_size}:{st.st_mtime_ns}"
+
 
-    if market == "sh":
-        # SH stocks start with 6
-        return code[0] == "6"
-    elif market == "sz":
-        # SZ stocks: 00xxxx (main board) or 30xxxx (ChiNext)
-        return code[:2] in ("00", "30")
-    elif market == "bj":
-        # BJ stocks
-        return code[:2] in ("43", "83", "87", "92")
+@dataclass(slots=True)
+class ImportStats:
+    """Counters accumulated during an import run"""
 
-    return False
+    files_processed: int = 0
+    files_skipped: int = 0
+    records_imported: int = 0
+    records_skipped: int = 0
+    records_backfilled: int = 0
 
 
 class TdxDayImporter:
     """Import TDX daily data into DuckDB database."""
 
-    def __init__(self, db_path: str = DEFAULT_DB_PATH, full_import: bool = False):
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        full_import: bool = False,
+        batch_size: int = BATCH_SIZE,
+    ):
         """
         Initialize importer.
 
         Args:
             db_path: Path to DuckDB database
             full_import: If True, import all data regardless of existing records
+            batch_size: Number of stocks written per transaction
         """
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.writer = DuckDBWriter(db_path=str(self.db_path))
+        self.writer = DuckDBWriter(db_path=str(db_path))
         self.full_import = full_import
+        self.batch_size = batch_size
 
-        self.stats = {
-            "files_processed": 0,
-            "files_skipped": 0,
-            "records_imported": 0,
-            "records_skipped": 0,
-            "records_backfilled": 0,
-        }
+        self.stats = ImportStats()
+        self.max_dates = {}
 
-    def get_existing_date_range(self, symbol: str) -> tuple:
-        """
-        Get (min_date, max_date) for a symbol.
-
-        Returns:
-            Tuple of (min_date_str, max_date_str), or (None, None) if not exists.
-        """
-        if self.full_import:
-            return None, None
-        min_date = self.writer.get_min_date("stocks", symbol)
-        max_date = self.writer.get_max_date("stocks", symbol)
-        return min_date, max_date
+    @property
+    def db_path(self) -> Path:
+        """Database path (owned by the writer)"""
+        return self.writer.db_path
 
     def import_stock(self, symbol: str, df: pd.DataFrame) -> int:
         """
         Import data for a single stock.
 
-        Handles both:
+        In incremental mode only dates not already stored are inserted
+        (anti-join in DuckDB), which covers:
         - New data (after existing MAX date)
-        - Historical backfill (before existing MIN date)
+        - Historical backfill (before MAX date, including interior gaps)
 
         Args:
             symbol: PTrade format code
@@ -302,40 +386,30 @@ class TdxDayImporter:
         if df.empty:
             return 0
 
-        # Check existing data range for incremental import
-        min_date, max_date = self.get_existing_date_range(symbol)
-
-        if min_date and max_date:
-            min_dt = pd.to_datetime(min_date)
-            max_dt = pd.to_datetime(max_date)
-
-            # Keep data outside existing range:
-            # - Historical backfill: date < min_date
-            # - New data: date > max_date
-            df_backfill = df[df["date"] < min_dt]
-            df_new = df[df["date"] > max_dt]
-
-            if df_backfill.empty and df_new.empty:
-                self.stats["records_skipped"] += 1
-                return 0
-
-            # Track backfilled records separately
-            if not df_backfill.empty:
-                self.stats["records_backfilled"] += len(df_backfill)
-
-            # Combine backfill and new data
-            df = pd.concat([df_backfill, df_new], ignore_index=True)
-
-        # Set date as index for writer
-        df = df.set_index("date")
+        if self.full_import:
+            self.writer.write_market_data(symbol, df.set_index("date"))
+            self.stats.records_imported += len(df)
+            return len(df)
+
+        # Filled per batch by _process_batch with a single GROUP BY query
+        max_date = self.max_dates.get(symbol)
+        imported = self.writer.write_missing_market_data(
+            symbol, df.set_index("date")
+        )
+
+        if imported == 0:
+            self.stats.records_skipped += 1
+            return 0
 
-        # Write to database
-        self.writer.write_market_data(symbol, df)
-        self.stats["records_imported"] += len(df)
+        # Every row after MAX(date) is new, so the remainder was backfilled
+        if max_date:
+            new_count = int((df["date"] > pd.Timestamp(max_date)).sum())
+            self.stats.records_backfilled += imported - new_count
 
-        return len(df)
+        self.stats.records_imported += imported
+        return imported
 
-    def import_from_source(self, source_path: Path) -> dict:
+    def import_from_source(self, source_path: Path) -> ImportStats:
         """
         Import from ZIP file or directory.
 
@@ -343,27 +417,30 @@ class TdxDayImporter:
             source_path: Path to ZIP file or directory
 
         Returns:
-            Statistics dict
+            Import statistics
         """
+        # Nothing changed since the last incremental import of this ZIP
+        fingerprint = source_fingerprint(source_path)
+        if (
+            not self.full_import
+            and fingerprint is not None
+            and fingerprint == self.writer.get_global_metadata(SOURCE_FINGERPRINT_KEY)
+        ):
+            print(f"{source_path.name} unchanged since last import, nothing to do")
+            logger.info(f"Skipping import, source unchanged: {fingerprint}")
+            return self.stats
+
         # Determine source type
+        # List the files once; the same listing gives the total and drives
+        # the iteration
         if source_path.is_file() and source_path.suffix.lower() == ".zip":
-            file_iter = iter_day_files_from_zip(source_path)
-            # Count total files
-            with zipfile.ZipFile(source_path, "r") as zf:
-                total_files = sum(
-                    1
-                    for n in zf.namelist()
-                    if n.endswith(".day") and "lday" in n.replace("\\", "/")
-                )
+            members = list_day_files_in_zip(source_path)
+            total_files = len(members)
+            file_iter = iter_day_files_from_zip(source_path, members)
         elif source_path.is_dir():
-            # Count files first
-            total_files = sum(
-                1
-                for market in ["sh", "sz", "bj"]
-                for _ in (source_path / market / "lday").glob("*.day")
-                if (source_path / market / "lday").exists()
-            )
-            file_iter = iter_day_files_from_dir(source_path)
+            day_files = list_day_files_in_dir(source_path)
+            total_files = len(day_files)
+            file_iter = iter_day_files_from_dir(source_path, day_files)
         else:
             raise ValueError(f"Invalid source: {source_path}")
 
@@ -374,54 +451,82 @@ class TdxDayImporter:
         # Process in batches
         batch = []
         batch_data = []
+        files_skipped = 0  # local counter; folded into stats once at the end
+        unreported = 0  # files read but not yet shown on the progress bar
+        failed_imports = 0
 
         with tqdm(total=total_files, desc="Importing", unit="file", ncols=100) as pbar:
             for filename, data in file_iter:
-                pbar.update(1)
+                # Advance the bar in steps rather than once per file
+                unreported += 1
+                if unreported >= PROGRESS_STEP:
+                    pbar.update(unreported)
+                    unreported = 0
 
                 # Skip non-stock files
                 if not is_stock_code(filename):
-                    self.stats["files_skipped"] += 1
+                    files_skipped += 1
                     continue
 
                 # Convert to PTrade code
                 symbol = filename_to_ptrade_code(filename)
                 if not symbol:
-                    self.stats["files_skipped"] += 1
+                    files_skipped += 1
                     continue
 
                 # Parse data
                 df = parse_tdx_day_file(data)
                 if df.empty:
-                    self.stats["files_skipped"] += 1
+                    files_skipped += 1
                     continue
 
                 batch.append(symbol)
                 batch_data.append(df)
 
                 # Process batch
-                if len(batch) >= BATCH_SIZE:
-                    self._process_batch(batch, batch_data)
+                if len(batch) >= self.batch_size:
+                    pbar.update(unreported)
+                    unreported = 0
+                    failed_imports += self._process_batch(batch, batch_data)
                     batch = []
                     batch_data = []
 
             # Process remaining
+            pbar.update(unreported)
             if batch:
-                self._process_batch(batch, batch_data)
+                failed_imports += self._process_batch(batch, batch_data)
+
+        self.stats.files_skipped += files_skipped
 
+        # Only a clean run may mark the source as imported
+        if fingerprint is not None and failed_imports == 0:
+            self.writer.write_global_metadata(
+                pd.Series({SOURCE_FINGERPRINT_KEY: fingerprint})
+            )
         return self.stats
 
-    def _process_batch(self, symbols: list, dataframes: list):
-        """Process a batch of stocks in a single transaction."""
+    def _process_batch(self, symbols: list, dataframes: list) -> int:
+        """
+        Process a batch of stocks in a single transaction.
+
+        Returns:
+            Number of stocks that failed to import
+        """
+        if not self.full_import:
+            self.max_dates = self.writer.get_max_dates("stocks", symbols)
+
+        processed = 0
+        failed = 0
+
         self.writer.begin()
         try:
             for symbol, df in zip(symbols, dataframes):
                 try:
                     self.import_stock(symbol, df)
-                    self.stats["files_processed"] += 1
+                    processed += 1
                 except Exception as e:
                     logger.warning(f"Failed to import {symbol}: {e}")
-                    self.stats["files_skipped"] += 1
+                    failed += 1
 
             self.writer.commit()
         except Exception as e:
@@ -429,6 +534,11 @@ class TdxDayImporter:
             self.writer.rollback()
             raise
 
+        # Count files only once the batch is committed
+        self.stats.files_processed += processed
+        self.stats.files_skipped += failed
+        return failed
+
     def close(self):
         """Close database connection."""
         self.writer.close()
@@ -446,6 +556,9 @@ Examples:
     # Full reimport from ZIP
     poetry run python scripts/import_tdx_day.py hsjday.zip --full
 
+    # Full reimport with larger transactions (fewer commits)
+    poetry run python scripts/import_tdx_day.py hsjday.zip --full --batch-size 200
+
     # Import from extracted directory
     poetry run python scripts/import_tdx_day.py ~/tdx/vipdoc/
 
@@ -470,8 +583,16 @@ Data source:
         action="store_true",
         help="Full import (ignore existing data, reimport all)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Stocks written per transaction (default: {BATCH_SIZE})",
+    )
 
     args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
 
     source_path = Path(args.source)
     if not source_path.exists():
@@ -485,7 +606,9 @@ Data source:
     print(f"Database: {args.db}")
     print()
 
-    importer = TdxDayImporter(db_path=args.db, full_import=args.full)
+    importer = TdxDayImporter(
+        db_path=args.db, full_import=args.full, batch_size=args.batch_size
+    )
 
     try:
         stats = importer.import_from_source(source_path)
@@ -494,15 +617,15 @@ Data source:
         print("=" * 60)
         print("Import Complete")
         print("=" * 60)
-        print(f"Files processed: {stats['files_processed']}")
-        print(f"Files skipped: {stats['files_skipped']}")
-        print(f"Records imported: {stats['records_imported']}")
+        print(f"Files processed: {stats.files_processed}")
+        print(f"Files skipped: {stats.files_skipped}")
+        print(f"Records imported: {stats.records_imported}")
 
-        if stats["records_backfilled"] > 0:
-            print(f"  - Backfilled (historical): {stats['records_backfilled']}")
+        if stats.records_backfilled > 0:
+            print(f"  - Backfilled (historical): {stats.records_backfilled}")
 
-        if stats["records_skipped"] > 0:
-            print(f"Records skipped (up to date): {stats['records_skipped']}")
+        if stats.records_skipped > 0:
+            print(f"Records skipped (up to date): {stats.records_skipped}")
 
     finally:
         importer.close()
@@ -70,9 +70,12 @@ class DataConverter:
         column_order = ["close", "open", "high", "low", "volume", "money"]
         result = result.reindex(columns=column_order)
 
-        # Convert to appropriate data types with validation
+        # Convert to appropriate data types with validation (columns that
+        # are already numeric need no conversion)
         failed_cols = []
         for col in result.columns:
+            if pd.api.types.is_numeric_dtype(result[col]):
+                continue
             try:
                 result[col] = pd.to_numeric(result[col])
             except (ValueError, TypeError):
@@ -81,8 +84,10 @@ class DataConverter:
         # If any column failed strict conversion, use coerce with warning
         if failed_cols:
             logger.warning(
-                f"{symbol}: Market data columns {failed_cols} have invalid values, "
-                f"using coerce (may introduce NaN)"
+                "%s: Market data columns %s have invalid values, "
+                "using coerce (may introduce NaN)",
+                symbol,
+                failed_cols,
             )
             for col in failed_cols:
                 result[col] = pd.to_numeric(result[col], errors="coerce")
@@ -90,12 +95,18 @@ class DataConverter:
                 nan_count = result[col].isna().sum()
                 if nan_count > 0:
                     logger.warning(
-                        f"{symbol}.{col}: {nan_count}/{len(result)} values converted to NaN"
+                        "%s.%s: %d/%d values converted to NaN",
+                        symbol,
+                        col,
+                        nan_count,
+                        len(result),
                     )
 
         logger.info(
-            f"Converted market data for {symbol}: {len(result)} rows, "
-            f"{len(result.columns)} columns"
+            "Converted market data for %s: %d rows, %d columns",
+            symbol,
+            len(result),
+            len(result.columns),
         )
 
         return result
@@ -151,7 +162,7 @@ class DataConverter:
         # calculated in the download script using market_cap_calculator.py
         # They require combining daily valuation data with quarterly fundamental data
 
-        logger.info(f"Converted valuation data for {symbol}: {len(result)} rows")
+        logger.info("Converted valuation data for %s: %d rows", symbol, len(result))
 
         return result
 
@@ -247,8 +258,10 @@ class DataConverter:
         final_result = mapped_result.reindex(columns=ptrade_fields)
 
         logger.info(
-            f"Converted fundamentals for {symbol}: {len(final_result)} quarters, "
-            f"{len(final_result.columns)} indicators"
+            "Converted fundamentals for %s: %d quarters, %d indicators",
+            symbol,
+            len(final_result),
+            len(final_result.columns),
         )
 
         return final_result
@@ -291,7 +304,7 @@ class DataConverter:
         else:
             result = pd.Series(dtype=np.float32, name="backward_a")
 
-        logger.info(f"Converted adjust factor for {symbol}: {len(result)} days")
+        logger.info("Converted adjust factor for %s: %d days", symbol, len(result))
 
         return result
 
@@ -349,14 +362,18 @@ class DataConverter:
             )
 
             result["exer_forward_a"] = result.get("foreAdjustFactor", np.nan)
-            result["exer_forward_b"] = np.nan  # Needs calculation
             result["exer_backward_a"] = result.get("backAdjustFactor", np.nan)
-            result["exer_backward_b"] = np.nan  # Needs calculation
+            # b factors need calculation
+            result[["exer_forward_b", "exer_backward_b"]] = np.nan
         else:
-            result["exer_forward_a"] = np.nan
-            result["exer_forward_b"] = np.nan
-            result["exer_backward_a"] = np.nan
-            result["exer_backward_b"] = np.nan
+            result[
+                [
+                    "exer_forward_a",
+                    "exer_forward_b",
+                    "exer_backward_a",
+                    "exer_backward_b",
+                ]
+            ] = np.nan
 
         # Set date as index
         if "date" in result.columns:
@@ -375,7 +392,7 @@ class DataConverter:
         ]
         result = result[[col for col in ptrade_fields if col in result.columns]]
 
-        logger.info(f"Converted exrights data for {symbol}: {len(result)} records")
+        logger.info("Converted exrights data for %s: %d records", symbol, len(result))
 
         return result
 
@@ -410,6 +427,6 @@ class DataConverter:
             "blocks": "{}",  # TODO: Fetch industry classification
         }
 
-        logger.info(f"Converted metadata for {symbol}")
+        logger.info("Converted metadata for %s", symbol)
 
         return metadata
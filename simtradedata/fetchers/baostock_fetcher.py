@@ -93,11 +93,11 @@ class BaoStockFetcher(BaseFetcher):
         if df.empty:
             # Check if it's an index (indices don't have adjust factors)
             if bs_code.startswith("sh.") and bs_code[3:].startswith("00"):
-                logger.debug(f"No adjust factor data for index {symbol} (expected)")
+                logger.debug("No adjust factor data for index %s (expected)", symbol)
             elif bs_code.startswith("sz.399"):  # Shenzhen indices
-                logger.debug(f"No adjust factor data for index {symbol} (expected)")
+                logger.debug("No adjust factor data for index %s (expected)", symbol)
             else:
-                logger.warning(f"No adjust factor data for {symbol}")
+                logger.warning("No adjust factor data for %s", symbol)
             return pd.DataFrame()
 
         # Note: BaoStock returns 'dividOperateDate', not 'date'
@@ -112,10 +112,10 @@ class BaoStockFetcher(BaseFetcher):
         nan_count = df["backAdjustFactor"].isna().sum()
         if nan_count > 0:
             logger.warning(
-                f"{symbol}: {nan_count}/{len(df)} adjust factors are invalid/NaN"
+                "%s: %d/%d adjust factors are invalid/NaN", symbol, nan_count, len(df)
             )
 
-        logger.info(f"Fetched {len(df)} adjust factor rows for {symbol}")
+        logger.debug("Fetched %d adjust factor rows for %s", len(df), symbol)
 
         return df
 
@@ -161,7 +161,7 @@ class BaoStockFetcher(BaseFetcher):
             DataFrame with industry classification
         """
         bs_code = convert_from_ptrade_code(symbol, "baostock")
-        date_str = date or datetime.now().strftime("%Y-%m-%d")
+        date_str = date or datetime.now().date().isoformat()
 
         rs = bs.query_stock_industry(code=bs_code, date=date_str)
 
@@ -171,7 +171,7 @@ class BaoStockFetcher(BaseFetcher):
         df = rs.get_data()
 
         if df.empty:
-            logger.warning(f"No industry data for {symbol}")
+            logger.warning("No industry data for %s", symbol)
             return pd.DataFrame()
 
         return df
@@ -219,7 +219,7 @@ class BaoStockFetcher(BaseFetcher):
             - 000300.SS (沪深300): query_hs300_stocks
             - 000905.SS (中证500): query_zz500_stocks
         """
-        query_date = date or datetime.now().strftime("%Y-%m-%d")
+        query_date = date or datetime.now().date().isoformat()
 
         # Map PTrade index codes to BaoStock query functions
         index_query_map = {
@@ -230,7 +230,7 @@ class BaoStockFetcher(BaseFetcher):
 
         query_func = index_query_map.get(index_code)
         if query_func is None:
-            logger.warning(f"Index {index_code} not supported by BaoStock")
+            logger.warning("Index %s not supported by BaoStock", index_code)
             return pd.DataFrame()
 
         rs = query_func(date=query_date)
@@ -243,7 +243,7 @@ class BaoStockFetcher(BaseFetcher):
         df = rs.get_data()
 
         if df.empty:
-            logger.warning(f"No constituent stocks found for {index_code}")
+            logger.warning("No constituent stocks found for %s", index_code)
             return pd.DataFrame()
 
         return df
@@ -291,7 +291,7 @@ class BaoStockFetcher(BaseFetcher):
                     dfs.append(df)
 
         if not dfs:
-            logger.debug(f"No fundamentals data for {symbol} {year}Q{quarter}")
+            logger.debug("No fundamentals data for %s %sQ%s", symbol, year, quarter)
             return pd.DataFrame()
 
         # Merge all dataframes on common keys
@@ -367,7 +367,10 @@ class BaoStockFetcher(BaseFetcher):
             if field in result.columns:
                 result[field] = pd.to_numeric(result[field], errors='coerce')
         
-        logger.info(f"Fetched fundamentals for {symbol} {year}Q{quarter}: {len(result)} rows")
+        logger.debug(
+            "Fetched fundamentals for %s %sQ%s: %d rows",
+            symbol, year, quarter, len(result),
+        )
         return result
 
     @retry_on_failure()
@@ -406,14 +409,14 @@ class BaoStockFetcher(BaseFetcher):
         df = rs.get_data()
 
         if df.empty:
-            logger.debug(f"No dividend data for {symbol} year {year}")
+            logger.debug("No dividend data for %s year %s", symbol, year)
             return pd.DataFrame()
 
         # Filter only records with valid ex-dividend date
         df = df[df["dividOperateDate"].notna() & (df["dividOperateDate"] != "")]
 
         if df.empty:
-            logger.debug(f"No valid dividend records for {symbol} year {year}")
+            logger.debug("No valid dividend records for %s year %s", symbol, year)
             return pd.DataFrame()
 
         # Map to PTrade format
@@ -441,7 +444,7 @@ class BaoStockFetcher(BaseFetcher):
             df["dividCashPsBeforeTax"], errors="coerce"
         )
 
-        logger.info(f"Fetched {len(result)} dividend records for {symbol} year {year}")
+        logger.debug("Fetched %d dividend records for %s year %s", len(result), symbol, year)
         return result
 
     def fetch_dividend_data_range(
@@ -465,7 +468,9 @@ class BaoStockFetcher(BaseFetcher):
                 if not df.empty:
                     dfs.append(df)
             except Exception as e:
-                logger.warning(f"Failed to fetch dividend for {symbol} year {year}: {e}")
+                logger.warning(
+                    "Failed to fetch dividend for %s year %s: %s", symbol, year, e
+                )
 
         if not dfs:
             return pd.DataFrame()
@@ -473,8 +478,8 @@ class BaoStockFetcher(BaseFetcher):
         result = pd.concat(dfs, ignore_index=True)
         result = result.drop_duplicates(subset=["date"]).sort_values("date")
 
-        logger.info(
-            f"Fetched {len(result)} total dividend records for {symbol} "
-            f"({start_year}-{end_year})"
+        logger.debug(
+            "Fetched %d total dividend records for %s (%d-%d)",
+            len(result), symbol, start_year, end_year,
         )
         return result
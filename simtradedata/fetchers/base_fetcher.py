@@ -54,7 +54,7 @@ class BaseFetcher(ABC):
         if not self._logged_in:
             self._do_login()
             self._logged_in = True
-            logger.info(f"{self.__class__.__name__} login successful")
+            logger.info("%s login successful", self.__class__.__name__)
 
     def logout(self):
         """
@@ -66,10 +66,10 @@ class BaseFetcher(ABC):
             try:
                 self._do_logout()
             except Exception as e:
-                logger.warning(f"{self.__class__.__name__} logout failed: {e}")
+                logger.warning("%s logout failed: %s", self.__class__.__name__, e)
             finally:
                 self._logged_in = False
-                logger.info(f"{self.__class__.__name__} logout complete")
+                logger.info("%s logout complete", self.__class__.__name__)
 
     def __enter__(self):
         """Context manager entry - login"""
@@ -8,6 +8,7 @@ much more efficient than BaoStock's per-stock API approach.
 
 import logging
 import tempfile
+import time
 from pathlib import Path
 from typing import List, Optional
 
@@ -21,6 +22,25 @@ from simtradedata.config.mootdx_finvalue_map import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds to reuse the server's report file listing
+REPORT_LIST_TTL = 300
+
+
+def _parse_date_column(raw: pd.Series) -> pd.Series:
+    """
+    Parse a FINVALUE date column to datetimes, once per distinct value.
+
+    All stocks in a quarter file share a handful of report/publication
+    dates, so the uniques are parsed and mapped back instead of parsing
+    every row.
+    """
+    uniques = raw.unique()
+    parsed = pd.to_datetime(
+        pd.Series([parse_finvalue_date(v) for v in uniques], index=uniques),
+        errors="coerce",
+    )
+    return raw.map(parsed)
+
 
 class MootdxAffairFetcher:
     """
@@ -48,25 +68,38 @@ class MootdxAffairFetcher:
             self._download_dir = Path(tempfile.gettempdir()) / "mootdx_affair"
             self._download_dir.mkdir(parents=True, exist_ok=True)
 
+        self._report_list_cache = None  # (fetched_at, files)
+
     def list_available_reports(self) -> List[dict]:
         """
         List available financial report files on TDX server.
 
+        The listing is cached for REPORT_LIST_TTL seconds, so per-quarter
+        lookups such as get_remote_file_hash() share one server request.
+
         Returns:
             List of dicts with keys: filename, hash, filesize
             Example: [{'filename': 'gpcw20231231.zip', 'hash': '...', 'filesize': 12345}]
         """
+        if self._report_list_cache is not None:
+            fetched_at, cached = self._report_list_cache
+            if time.monotonic() - fetched_at < REPORT_LIST_TTL:
+                return list(cached)
+
         from mootdx.affair import Affair
 
         try:
             files = Affair.files()
             if files:
-                logger.info(f"Found {len(files)} available financial reports")
-            return files or []
+                logger.info("Found %d available financial reports", len(files))
+            files = files or []
         except Exception as e:
-            logger.error(f"Failed to list available reports: {e}")
+            logger.error("Failed to list available reports: %s", e)
             raise
 
+        self._report_list_cache = (time.monotonic(), tuple(files))
+        return list(files)
+
     def fetch_and_parse(self, filename: str) -> pd.DataFrame:
         """
         Download and parse a financial data ZIP file.
@@ -90,7 +123,7 @@ class MootdxAffairFetcher:
             )
 
             if not fetch_result:
-                logger.warning(f"Failed to download {filename}")
+                logger.warning("Failed to download %s", filename)
                 return pd.DataFrame()
 
             # Step 2: Parse the downloaded file
@@ -100,14 +133,14 @@ class MootdxAffairFetcher:
             )
 
             if df is None or not isinstance(df, pd.DataFrame) or df.empty:
-                logger.warning(f"No data parsed from {filename}")
+                logger.warning("No data parsed from %s", filename)
                 return pd.DataFrame()
 
-            logger.info(f"Parsed {filename}: {len(df)} rows")
+            logger.info("Parsed %s: %d rows", filename, len(df))
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch and parse {filename}: {e}")
+            logger.error("Failed to fetch and parse %s: %s", filename, e)
             raise
 
     def parse_local(self, filename: str) -> pd.DataFrame:
@@ -138,7 +171,7 @@ class MootdxAffairFetcher:
             return df
 
         except Exception as e:
-            logger.error(f"Failed to parse local file {filename}: {e}")
+            logger.error("Failed to parse local file %s: %s", filename, e)
             raise
 
     def fetch_fundamentals_for_quarter(
@@ -174,7 +207,7 @@ class MootdxAffairFetcher:
         # Download and parse
         raw_df = self.fetch_and_parse(filename)
         if raw_df.empty:
-            logger.warning(f"No data for {year}Q{quarter}")
+            logger.warning("No data for %sQ%s", year, quarter)
             return pd.DataFrame()
 
         return self._convert_to_ptrade_format(raw_df, fields)
@@ -203,40 +236,51 @@ class MootdxAffairFetcher:
         target_fields = fields or CORE_FUNDAMENTAL_FIELDS
         num_columns = len(raw_df.columns)
 
-        # Extract columns by position index using iloc to avoid duplicate name issues
-        result_data = {}
-        for finvalue_idx, (ptrade_name, desc, unit) in FINVALUE_TO_PTRADE.items():
-            if ptrade_name.startswith("_") or ptrade_name in target_fields:
-                if isinstance(finvalue_idx, int) and finvalue_idx < num_columns:
-                    result_data[ptrade_name] = raw_df.iloc[:, finvalue_idx].values
+        # Extract columns by position index using iloc to avoid duplicate name
+        # issues, taking all wanted positions in one selection
+        wanted = [
+            (finvalue_idx, ptrade_name)
+            for finvalue_idx, (ptrade_name, _, _) in FINVALUE_TO_PTRADE.items()
+            if finvalue_idx < num_columns
+            and (ptrade_name.startswith("_") or ptrade_name in target_fields)
+        ]
 
-        if not result_data:
+        if not wanted:
             logger.warning("No matching columns found in raw data")
             return pd.DataFrame()
 
-        result = pd.DataFrame(result_data)
+        result = raw_df.iloc[:, [finvalue_idx for finvalue_idx, _ in wanted]]
+        result.columns = [ptrade_name for _, ptrade_name in wanted]
+        result = result.reset_index(drop=True)
 
         # Preserve stock code from index
         result["code"] = raw_df.index.values
 
         # Parse report date (YYMMDD format)
         if "_report_date_raw" in result.columns:
-            result["end_date"] = result["_report_date_raw"].apply(parse_finvalue_date)
-            result["end_date"] = pd.to_datetime(result["end_date"], errors="coerce")
+            result["end_date"] = _parse_date_column(result["_report_date_raw"])
             result = result.drop(columns=["_report_date_raw"])
 
         # Parse publication date
         if "_publ_date_raw" in result.columns:
-            result["publ_date"] = result["_publ_date_raw"].apply(parse_finvalue_date)
-            result["publ_date"] = pd.to_datetime(result["publ_date"], errors="coerce")
+            result["publ_date"] = _parse_date_column(result["_publ_date_raw"])
             result = result.drop(columns=["_publ_date_raw"])
 
-        # Convert numeric fields
-        numeric_cols = [c for c in result.columns if c not in ("end_date", "publ_date", "code")]
+        # Convert numeric fields; the parsed report columns are usually
+        # float already, so only non-numeric ones go through to_numeric
+        numeric_cols = [
+            c for c in result.columns
+            if c not in ("end_date", "publ_date", "code")
+            and not pd.api.types.is_numeric_dtype(result[c])
+        ]
         for col in numeric_cols:
             result[col] = pd.to_numeric(result[col], errors="coerce")
 
-        logger.info(f"Converted to PTrade format: {len(result)} rows, {len(result.columns)} columns")
+        logger.info(
+            "Converted to PTrade format: %d rows, %d columns",
+            len(result),
+            len(result.columns),
+        )
         return result
 
     def get_quarter_filename(self, year: int, quarter: int) -> str:
@@ -257,7 +301,8 @@ class MootdxAffairFetcher:
         """
         Get hash value of a quarter's financial data file from TDX server.
 
-        Uses list_available_reports() to get file metadata including hash.
+        Uses list_available_reports() to get file metadata including hash;
+        the listing is cached, so checking many quarters costs one request.
 
         Args:
             year: Year (e.g., 2024)
@@ -275,5 +320,5 @@ class MootdxAffairFetcher:
                     return file_info.get("hash")
             return None
         except Exception as e:
-            logger.warning(f"Failed to get remote hash for {filename}: {e}")
+            logger.warning("Failed to get remote hash for %s: %s", filename, e)
             return None
@@ -9,6 +9,7 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from simtradedata.fetchers.base_fetcher import BaseFetcher
@@ -109,7 +110,7 @@ class MootdxFetcher(BaseFetcher):
                     df["market"] = m
                     dfs.append(df)
             except Exception as e:
-                logger.warning(f"Failed to fetch stocks for market {m}: {e}")
+                logger.warning("Failed to fetch stocks for market %s: %s", m, e)
 
         if not dfs:
             return pd.DataFrame()
@@ -149,7 +150,7 @@ class MootdxFetcher(BaseFetcher):
             )
 
             if df is None or df.empty:
-                logger.debug(f"No daily data for {symbol}")
+                logger.debug("No daily data for %s", symbol)
                 return pd.DataFrame()
 
             # Apply adjustment if requested
@@ -175,11 +176,11 @@ class MootdxFetcher(BaseFetcher):
                 df["date"] = pd.to_datetime(df["date"])
                 df = df[(df["date"] >= start_date) & (df["date"] <= end_date)]
 
-            logger.info(f"Fetched {len(df)} daily bars for {symbol}")
+            logger.debug("Fetched %d daily bars for %s", len(df), symbol)
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch daily bars for {symbol}: {e}")
+            logger.error("Failed to fetch daily bars for %s: %s", symbol, e)
             raise
 
     @retry_on_failure(max_retries=2, delay=0.5)
@@ -212,11 +213,11 @@ class MootdxFetcher(BaseFetcher):
 
             df = df.rename(columns={"datetime": "date", "vol": "volume"})
 
-            logger.info(f"Fetched {len(df)} minute bars for {symbol}")
+            logger.debug("Fetched %d minute bars for %s", len(df), symbol)
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch minute bars for {symbol}: {e}")
+            logger.error("Failed to fetch minute bars for %s: %s", symbol, e)
             raise
 
     @retry_on_failure(max_retries=2, delay=0.5)
@@ -244,11 +245,11 @@ class MootdxFetcher(BaseFetcher):
             if "code" in df.columns:
                 df["ptrade_code"] = symbols[: len(df)]
 
-            logger.info(f"Fetched real-time quotes for {len(df)} stocks")
+            logger.info("Fetched real-time quotes for %d stocks", len(df))
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch real-time quotes: {e}")
+            logger.error("Failed to fetch real-time quotes: %s", e)
             raise
 
     @retry_on_failure(max_retries=2, delay=0.5)
@@ -270,14 +271,14 @@ class MootdxFetcher(BaseFetcher):
             df = self._client.xdxr(symbol=code)
 
             if df is None or df.empty:
-                logger.debug(f"No XDXR data for {symbol}")
+                logger.debug("No XDXR data for %s", symbol)
                 return pd.DataFrame()
 
-            logger.info(f"Fetched {len(df)} XDXR records for {symbol}")
+            logger.debug("Fetched %d XDXR records for %s", len(df), symbol)
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch XDXR for {symbol}: {e}")
+            logger.error("Failed to fetch XDXR for %s: %s", symbol, e)
             raise
 
     @retry_on_failure(max_retries=2, delay=0.5)
@@ -302,13 +303,13 @@ class MootdxFetcher(BaseFetcher):
             df = self._client.finance(symbol=code)
 
             if df is None or df.empty:
-                logger.debug(f"No finance data for {symbol}")
+                logger.debug("No finance data for %s", symbol)
                 return pd.DataFrame()
 
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch finance for {symbol}: {e}")
+            logger.error("Failed to fetch finance for %s: %s", symbol, e)
             raise
 
     @retry_on_failure(max_retries=2, delay=0.5)
@@ -347,7 +348,7 @@ class MootdxFetcher(BaseFetcher):
             )
 
             if df is None or df.empty:
-                logger.debug(f"No index data for {symbol}")
+                logger.debug("No index data for %s", symbol)
                 return pd.DataFrame()
 
             df = df.rename(columns={"datetime": "date", "vol": "volume"})
@@ -360,11 +361,11 @@ class MootdxFetcher(BaseFetcher):
                 if end_date:
                     df = df[df["date"] <= end_date]
 
-            logger.info(f"Fetched {len(df)} index bars for {symbol}")
+            logger.info("Fetched %d index bars for %s", len(df), symbol)
             return df
 
         except Exception as e:
-            logger.error(f"Failed to fetch index bars for {symbol}: {e}")
+            logger.error("Failed to fetch index bars for %s: %s", symbol, e)
             raise
 
     @retry_on_failure(max_retries=2, delay=0.5)
@@ -397,17 +398,17 @@ class MootdxFetcher(BaseFetcher):
         if index_df.empty:
             return pd.DataFrame()
 
-        trading_days = set(index_df["date"].dt.strftime("%Y-%m-%d"))
+        trading_days = index_df["date"].dt.normalize().to_numpy(dtype="datetime64[D]")
 
-        # Generate full calendar
+        # Generate full calendar, marking trading days with a vectorized
+        # datetime64 membership test instead of comparing formatted strings
         all_dates = pd.date_range(start=start_date, end=end_date, freq="D")
-        result = pd.DataFrame({"calendar_date": all_dates.strftime("%Y-%m-%d")})
-        result["is_trading_day"] = result["calendar_date"].isin(trading_days).astype(str)
-        result["is_trading_day"] = result["is_trading_day"].map(
-            {True: "1", False: "0", "True": "1", "False": "0"}
-        )
+        is_trading = np.isin(all_dates.to_numpy(dtype="datetime64[D]"), trading_days)
 
-        return result
+        return pd.DataFrame({
+            "calendar_date": all_dates.strftime("%Y-%m-%d"),
+            "is_trading_day": np.where(is_trading, "1", "0"),
+        })
 
     @retry_on_failure(max_retries=2, delay=0.5)
     def fetch_adjust_factor(
@@ -415,6 +416,7 @@ class MootdxFetcher(BaseFetcher):
         symbol: str,
         start_date: str,
         end_date: str,
+        raw_df: Optional[pd.DataFrame] = None,
     ) -> pd.DataFrame:
         """
         Calculate adjust factors from hfq (backward adjusted) and raw prices.
@@ -426,6 +428,8 @@ class MootdxFetcher(BaseFetcher):
             symbol: Stock code in PTrade format
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
+            raw_df: Raw daily bars for the same range from fetch_daily_bars,
+                if already fetched; saves requesting them again
 
         Returns:
             DataFrame with columns: date, backAdjustFactor
@@ -435,12 +439,15 @@ class MootdxFetcher(BaseFetcher):
         code = convert_from_ptrade_code(symbol, "mootdx")
 
         try:
-            # Fetch raw and hfq data
-            raw_df = self._client.k(
-                symbol=code,
-                begin=start_date.replace("-", ""),
-                end=end_date.replace("-", ""),
-            )
+            # Fetch raw data unless the caller already has it
+            if raw_df is None:
+                raw_df = self._client.k(
+                    symbol=code,
+                    begin=start_date.replace("-", ""),
+                    end=end_date.replace("-", ""),
+                )
+                if raw_df is not None:
+                    raw_df = raw_df.rename(columns={"datetime": "date"})
 
             if raw_df is None or raw_df.empty:
                 return pd.DataFrame()
@@ -456,13 +463,13 @@ class MootdxFetcher(BaseFetcher):
                 return pd.DataFrame()
 
             # Calculate adjust factor: hfq_close / raw_close
-            raw_df = raw_df.rename(columns={"datetime": "date"})
+            raw_df = raw_df[["date", "close"]].copy()
             hfq_df = hfq_df.rename(columns={"datetime": "date"})
 
             raw_df["date"] = pd.to_datetime(raw_df["date"])
             hfq_df["date"] = pd.to_datetime(hfq_df["date"])
 
-            merged = raw_df[["date", "close"]].merge(
+            merged = raw_df.merge(
                 hfq_df[["date", "close"]],
                 on="date",
                 suffixes=("_raw", "_hfq"),
@@ -471,11 +478,11 @@ class MootdxFetcher(BaseFetcher):
             merged["backAdjustFactor"] = merged["close_hfq"] / merged["close_raw"]
             result = merged[["date", "backAdjustFactor"]]
 
-            logger.info(f"Calculated {len(result)} adjust factors for {symbol}")
+            logger.debug("Calculated %d adjust factors for %s", len(result), symbol)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to calculate adjust factor for {symbol}: {e}")
+            logger.error("Failed to calculate adjust factor for %s: %s", symbol, e)
             raise
 
     def fetch_f10_catalog(self, symbol: str) -> pd.DataFrame:
@@ -496,7 +503,7 @@ class MootdxFetcher(BaseFetcher):
             df = self._client.F10C(symbol=code)
             return df if df is not None else pd.DataFrame()
         except Exception as e:
-            logger.error(f"Failed to fetch F10 catalog for {symbol}: {e}")
+            logger.error("Failed to fetch F10 catalog for %s: %s", symbol, e)
             raise
 
     def fetch_f10_detail(self, symbol: str, name: str) -> Optional[str]:
@@ -518,5 +525,5 @@ class MootdxFetcher(BaseFetcher):
             result = self._client.F10(symbol=code, name=name)
             return result
         except Exception as e:
-            logger.error(f"Failed to fetch F10 detail for {symbol}/{name}: {e}")
+            logger.error("Failed to fetch F10 detail for %s/%s: %s", symbol, name, e)
             raise
@@ -6,6 +6,7 @@ into a unified interface compatible with DataSplitter and DuckDBWriter.
 """
 
 import logging
+import time
 
 import pandas as pd
 
@@ -16,6 +17,15 @@ from simtradedata.utils.code_utils import convert_to_ptrade_code
 
 logger = logging.getLogger(__name__)
 
+# How long a fetched stock list stays valid (seconds)
+STOCK_LIST_TTL = 300
+
+# A-share code prefixes: SZ main board/ChiNext, SH main board/STAR Market
+A_SHARE_PREFIXES = frozenset({
+    "000", "001", "002", "003", "300", "301",
+    "600", "601", "603", "605", "688", "689",
+})
+
 
 class MootdxUnifiedFetcher:
     """
@@ -36,6 +46,7 @@ class MootdxUnifiedFetcher:
         """
         self._quotes_fetcher = MootdxFetcher()
         self._affair_fetcher = MootdxAffairFetcher(download_dir=download_dir)
+        self._stock_list_cache = None  # (fetched_at, codes)
 
     def login(self):
         """Login to mootdx quotes server"""
@@ -137,43 +148,38 @@ class MootdxUnifiedFetcher:
         """
         Fetch all stock codes in PTrade format.
 
+        Results are cached for STOCK_LIST_TTL seconds, since the full
+        security list is large and changes rarely.
+
         Returns:
             Sorted list of PTrade stock codes (e.g., ['000001.SZ', '600000.SS'])
         """
+        if self._stock_list_cache is not None:
+            fetched_at, cached = self._stock_list_cache
+            if time.monotonic() - fetched_at < STOCK_LIST_TTL:
+                return list(cached)
+
         df = self._quotes_fetcher.fetch_stock_list()
 
-        if df.empty:
+        if df.empty or "code" not in df.columns:
             return []
 
-        # Filter to actual stock codes (exclude indices, funds, etc.)
-        codes = []
-        for _, row in df.iterrows():
-            code = str(row.get("code", "")).strip()
-            if not code or len(code) != 6:
-                continue
-
-            # Only include A-share stocks: 000xxx-003xxx (SZ), 600xxx-605xxx (SH)
-            first_char = code[0]
-            first_three = code[:3]
-
-            if first_char in ("0", "3"):
-                # Shenzhen main board, ChiNext
-                if first_three in ("000", "001", "002", "003", "300", "301"):
-                    ptrade_code = convert_to_ptrade_code(code, "qstock")
-                    codes.append(ptrade_code)
-            elif first_char == "6":
-                # Shanghai main board, STAR Market
-                if first_three in ("600", "601", "603", "605", "688", "689"):
-                    ptrade_code = convert_to_ptrade_code(code, "qstock")
-                    codes.append(ptrade_code)
-
-        return sorted(codes)
+        # Filter to actual stock codes (exclude indices, funds, etc.),
+        # iterating the code column directly instead of materializing rows
+        codes = sorted(
+            convert_to_ptrade_code(code, "qstock")
+            for code in df["code"].astype(str).str.strip()
+            if len(code) == 6 and code[:3] in A_SHARE_PREFIXES
+        )
+        self._stock_list_cache = (time.monotonic(), tuple(codes))
+        return codes
 
     def fetch_adjust_factor(
         self,
         symbol: str,
         start_date: str,
         end_date: str,
+        raw_df: pd.DataFrame = None,
     ) -> pd.DataFrame:
         """
         Calculate backward adjust factors.
@@ -182,12 +188,14 @@ class MootdxUnifiedFetcher:
             symbol: Stock code in PTrade format
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
+            raw_df: Output of fetch_daily_data for the same range, if already
+                fetched, so the raw bars are not requested twice
 
         Returns:
             DataFrame with columns: date, backAdjustFactor
         """
         return self._quotes_fetcher.fetch_adjust_factor(
-            symbol, start_date, end_date
+            symbol, start_date, end_date, raw_df=raw_df
         )
 
     def fetch_xdxr(self, symbol: str) -> pd.DataFrame:
@@ -222,6 +230,22 @@ class MootdxUnifiedFetcher:
         """
         return self._affair_fetcher.fetch_fundamentals_for_quarter(year, quarter)
 
+    def list_available_reports(self) -> list:
+        """
+        List financial report files available on the TDX server.
+
+        Served from the affair fetcher's cached listing, so every caller
+        sharing this fetcher pays for one request per TTL window.
+
+        Returns:
+            List of dicts with keys: filename, hash, filesize
+        """
+        return self._affair_fetcher.list_available_reports()
+
+    def get_quarter_filename(self, year: int, quarter: int) -> str:
+        """ZIP filename of the financial report for a quarter."""
+        return self._affair_fetcher.get_quarter_filename(year, quarter)
+
     def fetch_trade_calendar(
         self,
         start_date: str,
@@ -95,7 +95,7 @@ def _run_with_timeout(func, timeout_seconds, error_message):
 
         if thread.is_alive():
             # Thread is still running, timeout occurred
-            logger.warning(f"Timeout: {error_message}")
+            logger.warning("Timeout: %s", error_message)
             raise TimeoutError(error_message)
 
         if exception[0]:
@@ -146,7 +146,7 @@ class UnifiedDataFetcher(BaoStockFetcher):
         # Build fields string (all fields in one call)
         fields_str = ",".join(UNIFIED_DAILY_FIELDS)
 
-        logger.debug(f"Fetching unified data for {symbol}...")
+        logger.debug("Fetching unified data for %s...", symbol)
 
         # Define API call function
         def api_call():
@@ -167,14 +167,14 @@ class UnifiedDataFetcher(BaoStockFetcher):
                 f"BaoStock API timeout for {symbol}"
             )
         except TimeoutError:
-            logger.error(f"Timeout fetching {symbol}, skipping")
+            logger.error("Timeout fetching %s, skipping", symbol)
             raise
 
         # Check for login expiration and retry once
         if rs.error_code != "0":
             if "未登录" in rs.error_msg or "登录" in rs.error_msg:
                 # Session expired, re-login and retry
-                logger.warning(f"BaoStock session expired, re-logging in...")
+                logger.warning("BaoStock session expired, re-logging in...")
                 from simtradedata.fetchers.baostock_fetcher import BaoStockFetcher
                 BaoStockFetcher._bs_logged_in = False  # Reset login state
                 BaoStockFetcher._ensure_login()  # Re-login
@@ -187,7 +187,7 @@ class UnifiedDataFetcher(BaoStockFetcher):
                         f"BaoStock API timeout for {symbol} (retry)"
                     )
                 except TimeoutError:
-                    logger.error(f"Timeout fetching {symbol} (retry), skipping")
+                    logger.error("Timeout fetching %s (retry), skipping", symbol)
                     raise
 
             # Check error again after potential retry
@@ -199,7 +199,9 @@ class UnifiedDataFetcher(BaoStockFetcher):
         df = rs.get_data()
 
         if df.empty:
-            logger.info(f"No unified data for {symbol} (may be delisted or no trading)")
+            logger.info(
+                "No unified data for %s (may be delisted or no trading)", symbol
+            )
             return pd.DataFrame()
         
         # Convert data types
@@ -211,9 +213,9 @@ class UnifiedDataFetcher(BaoStockFetcher):
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors="coerce")
         
-        logger.info(
-            f"Fetched unified data for {symbol}: {len(df)} rows, "
-            f"{len(df.columns)} fields"
+        logger.debug(
+            "Fetched unified data for %s: %d rows, %d fields",
+            symbol, len(df), len(df.columns),
         )
         
         return df
@@ -243,7 +245,7 @@ class UnifiedDataFetcher(BaoStockFetcher):
         # Fetch basic OHLCV data for index
         fields = "date,open,high,low,close,volume,amount"
 
-        logger.debug(f"Fetching index data for {index_code}...")
+        logger.debug("Fetching index data for %s...", index_code)
 
         # Define API call function
         def api_call():
@@ -264,7 +266,7 @@ class UnifiedDataFetcher(BaoStockFetcher):
                 f"BaoStock API timeout for index {index_code}"
             )
         except TimeoutError:
-            logger.error(f"Timeout fetching index {index_code}, skipping")
+            logger.error("Timeout fetching index %s, skipping", index_code)
             raise
 
         if rs.error_code != "0":
@@ -275,7 +277,9 @@ class UnifiedDataFetcher(BaoStockFetcher):
         df = rs.get_data()
 
         if df.empty:
-            logger.info(f"No index data for {index_code} (may be unavailable for date range)")
+            logger.info(
+                "No index data for %s (may be unavailable for date range)", index_code
+            )
             return pd.DataFrame()
 
         # Convert data types
@@ -294,8 +298,6 @@ class UnifiedDataFetcher(BaoStockFetcher):
         if rename_map:
             df = df.rename(columns=rename_map)
 
-        logger.info(
-            f"Fetched index data for {index_code}: {len(df)} rows"
-        )
+        logger.info("Fetched index data for %s: %d rows", index_code, len(df))
 
         return df
@@ -8,10 +8,12 @@ No API key required.
 
 import json
 import logging
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -43,6 +45,8 @@ class YFinanceFetcher(BaseFetcher):
     def __init__(self, rate_limit: float = 0.5):
         super().__init__()
         self._rate_limit = rate_limit
+        # Per worker thread: monotonic time the last _throttle() returned
+        self._last_call = threading.local()
 
     def _do_login(self):
         # yfinance is stateless HTTP - no login needed
@@ -53,9 +57,22 @@ class YFinanceFetcher(BaseFetcher):
         pass
 
     def _throttle(self):
-        """Rate limit between per-stock API calls."""
-        if self._rate_limit > 0:
+        """Rate limit between per-stock API calls.
+
+        Each calling thread is held to one call per rate_limit seconds. Time
+        already spent on the requests since its previous call counts toward
+        the interval, so only the remainder is slept.
+        """
+        if self._rate_limit <= 0:
+            return
+        last = getattr(self._last_call, "at", None)
+        if last is None:
             time.sleep(self._rate_limit)
+        else:
+            remaining = self._rate_limit - (time.monotonic() - last)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_call.at = time.monotonic()
 
     # ========================================
     # Stock list
@@ -71,7 +88,7 @@ class YFinanceFetcher(BaseFetcher):
         try:
             df = pd.read_csv(NASDAQ_TRADED_URL, sep="|")
         except Exception as e:
-            logger.error(f"Failed to download NASDAQ traded file: {e}")
+            logger.error("Failed to download NASDAQ traded file: %s", e)
             return []
 
         if "Symbol" not in df.columns:
@@ -111,7 +128,7 @@ class YFinanceFetcher(BaseFetcher):
 
         # Convert to PTrade format
         ptrade_symbols = [convert_to_ptrade_code(s, "yfinance") for s in symbols]
-        logger.info(f"Fetched {len(ptrade_symbols)} US common stocks")
+        logger.info("Fetched %d US common stocks", len(ptrade_symbols))
         return ptrade_symbols
 
     # ========================================
@@ -136,11 +153,43 @@ class YFinanceFetcher(BaseFetcher):
             Dict mapping PTrade symbol -> DataFrame with columns:
             date(index), open, high, low, close, volume, money, preclose
         """
+        raw = self._download_batch(symbols, start_date, end_date)
+        return self._ohlcv_from_raw(raw, symbols)
+
+    def fetch_batch_ohlcv_with_adjust(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+        """
+        Batch download OHLCV and adjust factors with a single yf.download().
+
+        Both come from the same auto_adjust=False download, so fetching them
+        together halves the requests of fetch_batch_ohlcv() followed by
+        fetch_adjust_factors().
+
+        Returns:
+            (ohlcv, adjust_factors) dicts, as returned by those two methods
+        """
+        raw = self._download_batch(symbols, start_date, end_date)
+        return (
+            self._ohlcv_from_raw(raw, symbols),
+            self._adjust_factors_from_raw(raw, symbols),
+        )
+
+    def _download_batch(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> pd.DataFrame:
+        """Run yf.download() for PTrade symbols (empty DataFrame on failure)."""
         # Convert to yfinance tickers
         yf_tickers = [convert_from_ptrade_code(s, "yfinance") for s in symbols]
 
         try:
-            raw = yf.download(
+            return yf.download(
                 tickers=yf_tickers,
                 start=start_date,
                 end=end_date,
@@ -149,19 +198,24 @@ class YFinanceFetcher(BaseFetcher):
                 threads=True,
             )
         except Exception as e:
-            logger.error(f"yf.download failed: {e}")
-            return {}
+            logger.error("yf.download failed: %s", e)
+            return pd.DataFrame()
 
+    def _ohlcv_from_raw(
+        self, raw: pd.DataFrame, symbols: list[str]
+    ) -> dict[str, pd.DataFrame]:
+        """Split a yf.download() result into per-symbol OHLCV frames."""
         if raw.empty:
             return {}
 
         result = {}
-        is_single = len(yf_tickers) == 1
+        is_single = len(symbols) == 1
 
-        for ptrade_sym, yf_ticker in zip(symbols, yf_tickers):
+        for ptrade_sym in symbols:
+            yf_ticker = convert_from_ptrade_code(ptrade_sym, "yfinance")
             try:
                 if is_single:
-                    df = self._flatten_columns(raw.copy())
+                    df = self._flatten_columns(raw)
                 else:
                     df = self._extract_ticker(raw, yf_ticker, is_single)
                     if df is None:
@@ -183,10 +237,13 @@ class YFinanceFetcher(BaseFetcher):
                 df["preclose"] = df["close"].shift(1)
 
                 # Calculate approximate money (VWAP proxy)
-                # money = average_price * volume
-                df["money"] = (
-                    (df["open"] + df["high"] + df["low"] + df["close"]) / 4
-                    * df["volume"]
+                # money = average_price * volume, on raw arrays to skip
+                # index alignment for each intermediate
+                prices = df[["open", "high", "low", "close"]].to_numpy(
+                    dtype=np.float64
+                )
+                df["money"] = prices.mean(axis=1) * df["volume"].to_numpy(
+                    dtype=np.float64
                 )
 
                 # high_limit and low_limit are NULL for US stocks
@@ -203,7 +260,7 @@ class YFinanceFetcher(BaseFetcher):
                 result[ptrade_sym] = df
 
             except Exception as e:
-                logger.warning(f"Failed to process OHLCV for {ptrade_sym}: {e}")
+                logger.warning("Failed to process OHLCV for %s: %s", ptrade_sym, e)
                 continue
 
         return result
@@ -226,31 +283,24 @@ class YFinanceFetcher(BaseFetcher):
         Returns:
             Dict mapping PTrade symbol -> DataFrame with columns: date, adj_a, adj_b
         """
-        yf_tickers = [convert_from_ptrade_code(s, "yfinance") for s in symbols]
-
-        try:
-            raw = yf.download(
-                tickers=yf_tickers,
-                start=start_date,
-                end=end_date,
-                auto_adjust=False,
-                group_by="ticker",
-                threads=True,
-            )
-        except Exception as e:
-            logger.error(f"yf.download for adjust factors failed: {e}")
-            return {}
+        raw = self._download_batch(symbols, start_date, end_date)
+        return self._adjust_factors_from_raw(raw, symbols)
 
+    def _adjust_factors_from_raw(
+        self, raw: pd.DataFrame, symbols: list[str]
+    ) -> dict[str, pd.DataFrame]:
+        """Compute per-symbol adjust factors from a yf.download() result."""
         if raw.empty:
             return {}
 
         result = {}
-        is_single = len(yf_tickers) == 1
+        is_single = len(symbols) == 1
 
-        for ptrade_sym, yf_ticker in zip(symbols, yf_tickers):
+        for ptrade_sym in symbols:
+            yf_ticker = convert_from_ptrade_code(ptrade_sym, "yfinance")
             try:
                 if is_single:
-                    df = self._flatten_columns(raw.copy())
+                    df = self._flatten_columns(raw)
                 else:
                     df = self._extract_ticker(raw, yf_ticker, is_single)
                     if df is None:
@@ -273,7 +323,9 @@ class YFinanceFetcher(BaseFetcher):
                 result[ptrade_sym] = adj_df
 
             except Exception as e:
-                logger.warning(f"Failed to compute adjust factors for {ptrade_sym}: {e}")
+                logger.warning(
+                    "Failed to compute adjust factors for %s: %s", ptrade_sym, e
+                )
 
         return result
 
@@ -298,7 +350,7 @@ class YFinanceFetcher(BaseFetcher):
             income = ticker.quarterly_income_stmt
             balance = ticker.quarterly_balance_sheet
         except Exception as e:
-            logger.warning(f"Failed to fetch financials for {symbol}: {e}")
+            logger.warning("Failed to fetch financials for %s: %s", symbol, e)
             return pd.DataFrame()
 
         if income is None or income.empty:
@@ -307,7 +359,11 @@ class YFinanceFetcher(BaseFetcher):
         # income/balance have dates as columns, fields as rows
         quarters = sorted(income.columns)
 
+        # The statement values (None if missing) are kept for the YoY pass below
         rows = []
+        revenues = []
+        net_incomes = []
+        assets = []
         for q_date in quarters:
             row = {"date": q_date}
 
@@ -370,6 +426,9 @@ class YFinanceFetcher(BaseFetcher):
                 row["inventory_turnover_rate"] = (total_revenue * 4) / inventory
 
             rows.append(row)
+            revenues.append(total_revenue)
+            net_incomes.append(net_income)
+            assets.append(total_assets)
 
         if not rows:
             return pd.DataFrame()
@@ -381,42 +440,29 @@ class YFinanceFetcher(BaseFetcher):
         # Calculate YoY growth rates (compare with same quarter last year)
         # Need at least 5 quarters of data
         if len(df) >= 5:
-            for q_date in quarters:
-                if q_date not in df.index:
-                    continue
-                prev_year = q_date - pd.DateOffset(years=1)
-                # Find closest quarter date
-                closest = df.index[df.index <= prev_year]
-                if len(closest) == 0:
-                    continue
-                prev_q = closest[-1]
-                # Only compare if within 400 days (roughly 1 year + margin)
-                if (q_date - prev_q).days > 400:
-                    continue
-
-                # Revenue growth
-                rev_cur = _safe_get_from_stmt(income, "Total Revenue", q_date)
-                rev_prev = _safe_get_from_stmt(income, "Total Revenue", prev_q)
-                if rev_prev and rev_prev != 0 and rev_cur is not None:
-                    df.loc[q_date, "operating_revenue_grow_rate"] = (
-                        (rev_cur - rev_prev) / abs(rev_prev) * 100
-                    )
-
-                # Net profit growth
-                ni_cur = _safe_get_from_stmt(income, "Net Income", q_date)
-                ni_prev = _safe_get_from_stmt(income, "Net Income", prev_q)
-                if ni_prev and ni_prev != 0 and ni_cur is not None:
-                    df.loc[q_date, "net_profit_grow_rate"] = (
-                        (ni_cur - ni_prev) / abs(ni_prev) * 100
-                    )
-
-                # Total asset growth
-                ta_cur = _safe_get_from_stmt(balance, "Total Assets", q_date)
-                ta_prev = _safe_get_from_stmt(balance, "Total Assets", prev_q)
-                if ta_prev and ta_prev != 0 and ta_cur is not None:
-                    df.loc[q_date, "total_asset_grow_rate"] = (
-                        (ta_cur - ta_prev) / abs(ta_prev) * 100
-                    )
+            q_index = df.index
+            # Latest quarter on or before one year earlier (binary search)
+            prev_pos = q_index.searchsorted(
+                q_index - pd.DateOffset(years=1), side="right"
+            ) - 1
+            has_prev = prev_pos >= 0
+            prev_pos = np.maximum(prev_pos, 0)
+            # Only compare if within 400 days (roughly 1 year + margin)
+            has_prev &= (q_index - q_index[prev_pos]).days <= 400
+
+            for column, values in (
+                ("operating_revenue_grow_rate", revenues),
+                ("net_profit_grow_rate", net_incomes),
+                ("total_asset_grow_rate", assets),
+            ):
+                cur = np.array(values, dtype=np.float64)
+                prev = cur[prev_pos]
+                valid = has_prev & ~np.isnan(cur) & ~np.isnan(prev) & (prev != 0)
+                if valid.any():
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        df[column] = np.where(
+                            valid, (cur - prev) / np.abs(prev) * 100, np.nan
+                        )
 
         return df
 
@@ -476,57 +522,37 @@ class YFinanceFetcher(BaseFetcher):
                 metrics["bvps"] = bvps
                 quarterly_metrics[q_date] = metrics
 
-        # Calculate TTM values (trailing 4 quarters)
+        # Calculate TTM values (trailing 4 quarters) from running sums
         sorted_dates = sorted(quarterly_metrics.keys())
-        ttm_data = {}
-        for i, q_date in enumerate(sorted_dates):
-            start_idx = max(0, i - 3)
-            window = sorted_dates[start_idx:i + 1]
-            ttm_ni = sum(
-                quarterly_metrics[d].get("net_income") or 0 for d in window
-            )
-            ttm_rev = sum(
-                quarterly_metrics[d].get("revenue") or 0 for d in window
-            )
-            bvps = quarterly_metrics[q_date].get("bvps")
-            ttm_data[q_date] = {
-                "eps_ttm": ttm_ni / shares_outstanding if shares_outstanding else None,
-                "revenue_ttm": ttm_rev,
-                "bvps": bvps,
-            }
+        ttm_ni = _trailing_sums(
+            [quarterly_metrics[d].get("net_income") or 0 for d in sorted_dates], 4
+        )
+        ttm_rev = _trailing_sums(
+            [quarterly_metrics[d].get("revenue") or 0 for d in sorted_dates], 4
+        )
 
         # Build daily valuation
         df = ohlcv_df[["close", "volume"]].copy()
         df["total_shares"] = float(shares_outstanding)
         df["a_floats"] = float(float_shares) if float_shares else None
 
-        # Forward-fill TTM data onto daily dates
-        df["eps_ttm"] = None
-        df["bvps"] = None
-        df["revenue_ttm"] = None
-        for q_date, vals in sorted(ttm_data.items()):
-            mask = df.index >= q_date
-            if vals["eps_ttm"] is not None:
-                df.loc[mask, "eps_ttm"] = vals["eps_ttm"]
-            if vals["bvps"] is not None:
-                df.loc[mask, "bvps"] = vals["bvps"]
-            if vals["revenue_ttm"] is not None:
-                df.loc[mask, "revenue_ttm"] = vals["revenue_ttm"]
-
-        # Calculate ratios
-        df["pe_ttm"] = None
-        mask = df["eps_ttm"].notna() & (df["eps_ttm"] != 0)
-        df.loc[mask, "pe_ttm"] = df.loc[mask, "close"] / df.loc[mask, "eps_ttm"]
-
-        df["pb"] = None
-        mask = df["bvps"].notna() & (df["bvps"] != 0)
-        df.loc[mask, "pb"] = df.loc[mask, "close"] / df.loc[mask, "bvps"]
-
-        df["ps_ttm"] = None
-        mask = df["revenue_ttm"].notna() & (df["revenue_ttm"] != 0)
-        df.loc[mask, "ps_ttm"] = (
-            df.loc[mask, "close"] * shares_outstanding / df.loc[mask, "revenue_ttm"]
+        # Forward-fill quarterly data onto daily dates (binary search per day)
+        eps_ttm = _as_of(
+            df.index, sorted_dates, [ni / shares_outstanding for ni in ttm_ni]
+        )
+        bvps = _as_of(
+            df.index, sorted_dates, [quarterly_metrics[d]["bvps"] for d in sorted_dates]
         )
+        revenue_ttm = _as_of(df.index, sorted_dates, ttm_rev)
+
+        # Calculate ratios (NaN where the denominator is missing or zero)
+        close = df["close"].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df["pe_ttm"] = np.where(eps_ttm != 0, close / eps_ttm, np.nan)
+            df["pb"] = np.where(bvps != 0, close / bvps, np.nan)
+            df["ps_ttm"] = np.where(
+                revenue_ttm != 0, close * shares_outstanding / revenue_ttm, np.nan
+            )
 
         # Turnover rate
         df["turnover_rate"] = df["volume"] / shares_outstanding * 100
@@ -596,7 +622,7 @@ class YFinanceFetcher(BaseFetcher):
         try:
             actions = ticker.actions
         except Exception as e:
-            logger.warning(f"Failed to fetch actions for {symbol}: {e}")
+            logger.warning("Failed to fetch actions for %s: %s", symbol, e)
             return pd.DataFrame()
 
         if actions is None or actions.empty:
@@ -655,7 +681,7 @@ class YFinanceFetcher(BaseFetcher):
                 auto_adjust=True,
             )
         except Exception as e:
-            logger.error(f"Failed to fetch benchmark: {e}")
+            logger.error("Failed to fetch benchmark: %s", e)
             return pd.DataFrame()
 
         if raw.empty:
@@ -693,7 +719,7 @@ class YFinanceFetcher(BaseFetcher):
             symbols = df["Symbol"].str.strip().str.replace(".", "-", regex=False).tolist()
             return [convert_to_ptrade_code(s, "yfinance") for s in symbols]
         except Exception as e:
-            logger.error(f"Failed to fetch S&P 500 constituents: {e}")
+            logger.error("Failed to fetch S&P 500 constituents: %s", e)
             return []
 
     def fetch_index_constituents_ndx100(self) -> list[str]:
@@ -720,7 +746,7 @@ class YFinanceFetcher(BaseFetcher):
                     return [convert_to_ptrade_code(s, "yfinance") for s in symbols]
             return []
         except Exception as e:
-            logger.error(f"Failed to fetch NASDAQ-100 constituents: {e}")
+            logger.error("Failed to fetch NASDAQ-100 constituents: %s", e)
             return []
 
     # ========================================
@@ -732,7 +758,7 @@ class YFinanceFetcher(BaseFetcher):
         try:
             return ticker.info or {}
         except Exception as e:
-            logger.warning(f"Failed to get ticker info: {e}")
+            logger.warning("Failed to get ticker info: %s", e)
             return {}
 
     @staticmethod
@@ -754,20 +780,43 @@ class YFinanceFetcher(BaseFetcher):
 
         With group_by='ticker', MultiIndex is (Ticker, Price).
         For single ticker: just flatten. For multi: select by ticker name.
+
+        No copy is made: callers derive new frames (dropna/rename) before
+        assigning columns, so the shared download result is never mutated.
         """
         if not isinstance(raw.columns, pd.MultiIndex):
-            return raw.copy()
+            return raw
 
         if is_single:
-            return raw.droplevel("Ticker", axis=1).copy()
+            return raw.droplevel("Ticker", axis=1)
 
         # Multi-ticker: top level is Ticker name
         top_level = raw.columns.get_level_values(0).unique()
         if yf_ticker in top_level:
-            return raw[yf_ticker].copy()
+            return raw[yf_ticker]
         return None
 
 
+def _trailing_sums(values: list, window: int) -> list:
+    """Sum each value with up to window-1 predecessors (one cumsum pass)."""
+    csum = np.concatenate(([0.0], np.cumsum(np.asarray(values, dtype=np.float64))))
+    lower = np.maximum(np.arange(len(values)) + 1 - window, 0)
+    return (csum[1:] - csum[lower]).tolist()
+
+
+def _as_of(days: pd.Index, q_dates: list, values: list) -> np.ndarray:
+    """Value of the latest quarter on or before each day, NaN before the first.
+
+    Quarters whose value is None are skipped, so the previous value carries
+    forward. q_dates must be sorted.
+    """
+    known = [(q, v) for q, v in zip(q_dates, values) if v is not None]
+    # The trailing NaN is picked up by days before the first quarter (idx -1)
+    lookup = np.array([v for _, v in known] + [np.nan], dtype=np.float64)
+    idx = pd.DatetimeIndex([q for q, _ in known]).searchsorted(days, side="right") - 1
+    return lookup[idx]
+
+
 def _safe_get_from_stmt(
     stmt: Optional[pd.DataFrame], field: str, date
 ) -> Optional[float]:
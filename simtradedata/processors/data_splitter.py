@@ -33,6 +33,12 @@ class DataSplitter:
                            If None, uses default DATA_ROUTING.
         """
         self.routing_config = routing_config or DATA_ROUTING
+
+        # Resolve routing entries once; split_data runs once per symbol
+        self._routes = [
+            (data_type, config['fields'], config.get('rename'))
+            for data_type, config in self.routing_config.items()
+        ]
     
     def split_data(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -55,16 +61,16 @@ class DataSplitter:
         
         result = {}
         
-        for data_type, config in self.routing_config.items():
-            fields = config['fields']
-            
+        for data_type, fields, rename in self._routes:
             # Check which fields are available in the DataFrame
             available_fields = [f for f in fields if f in df.columns]
             
             if not available_fields:
                 logger.warning(
-                    f"No fields available for {data_type} data type. "
-                    f"Expected: {fields}, Available: {list(df.columns)}"
+                    "No fields available for %s data type. Expected: %s, Available: %s",
+                    data_type,
+                    fields,
+                    list(df.columns),
                 )
                 continue
             
@@ -72,8 +78,8 @@ class DataSplitter:
             subset = df[available_fields].copy()
             
             # Rename fields to match PTrade format
-            if config.get('rename'):
-                subset = subset.rename(columns=config['rename'])
+            if rename:
+                subset = subset.rename(columns=rename)
             
             # Set date as index (except for status data which keeps date as column)
             if 'date' in subset.columns and data_type != 'status':
@@ -82,13 +88,14 @@ class DataSplitter:
             result[data_type] = subset
             
             logger.debug(
-                f"Split {data_type} data: {len(subset)} rows, "
-                f"{len(subset.columns)} columns"
+                "Split %s data: %d rows, %d columns",
+                data_type, len(subset), len(subset.columns),
             )
         
-        logger.info(
-            f"Data split complete: {len(result)} data types "
-            f"({', '.join(result.keys())})"
+        # Runs once per symbol: keep it at DEBUG with lazy formatting
+        logger.debug(
+            "Data split complete: %d data types (%s)",
+            len(result), ", ".join(result),
         )
 
         return result
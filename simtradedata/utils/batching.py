@@ -0,0 +1,29 @@
+"""
+Batching helpers for per-symbol download loops
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+
+def iter_batches(items: Iterable, size: int) -> Iterator[List]:
+    """Yield consecutive batches of up to size items.
+
+    Batches are produced lazily, so callers never hold a list of all
+    slices of the input at once.
+
+    Args:
+        items: Items to batch (any iterable)
+        size: Maximum batch size
+
+    Yields:
+        Lists of at most size items, in input order
+    """
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def batch_count(total: int, size: int) -> int:
+    """Number of batches iter_batches yields for total items."""
+    return -(-total // size)
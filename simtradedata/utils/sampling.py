@@ -7,7 +7,7 @@ Provides consistent date sampling across all data types:
 - Quarterly end dates: For fundamentals progress tracking
 """
 
-from datetime import datetime
+from datetime import date
 
 import pandas as pd
 
@@ -22,12 +22,13 @@ def generate_monthly_start_dates(start_date: str, end_date: str = None) -> list:
     Returns:
         List of datetime objects at month starts, plus end_date if not included
     """
-    end = end_date or datetime.now().strftime("%Y-%m-%d")
+    end = end_date or date.today().isoformat()
     end_dt = pd.to_datetime(end)
 
     dates = pd.date_range(start=start_date, end=end, freq="MS").to_pydatetime().tolist()
 
-    if end_dt not in [pd.to_datetime(d) for d in dates]:
+    # date_range output is sorted, so end_dt can only match the last entry
+    if not dates or dates[-1] != end_dt.to_pydatetime():
         dates.append(end_dt.to_pydatetime())
 
     return dates
@@ -43,7 +44,7 @@ def generate_monthly_end_dates(start_date: str, end_date: str = None) -> list:
     Returns:
         List of datetime objects at month ends
     """
-    end = end_date or datetime.now().strftime("%Y-%m-%d")
+    end = end_date or date.today().isoformat()
     return pd.date_range(start=start_date, end=end, freq="ME").to_pydatetime().tolist()
 
 
@@ -5,10 +5,15 @@ This module provides utilities to calculate TTM indicators from quarterly data.
 """
 
 import logging
+
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Quarterly ratio fields averaged into <field>_ttm
+TTM_RATIO_FIELDS = ('roe', 'roa', 'net_profit_ratio', 'gross_income_ratio')
+
 
 def calculate_ttm_indicators(
     df: pd.DataFrame, periods: int = 4
@@ -29,43 +34,55 @@ def calculate_ttm_indicators(
     
     if len(df) < periods:
         logger.warning(
-            f"Not enough data for TTM calculation (need {periods} periods, got {len(df)})"
+            "Not enough data for TTM calculation (need %d periods, got %d)",
+            periods,
+            len(df),
         )
         # Still return the dataframe with NaN for TTM fields
     
-    # Make a copy to avoid modifying original
-    result = df.copy()
-    
-    # Ensure sorted by end_date (handle both column and index cases)
-    if 'end_date' in result.columns:
-        result = result.sort_values('end_date')
-    elif result.index.name == 'end_date' or isinstance(result.index, pd.DatetimeIndex):
-        result = result.sort_index()
-    
-    # Calculate TTM for ratio fields (use rolling mean)
-    if 'roe' in result.columns:
-        result['roe_ttm'] = result['roe'].rolling(window=periods, min_periods=periods).mean()
+    # Sorting returns a new frame, so the original is never modified
+    if 'end_date' in df.columns:
+        result = df.sort_values('end_date')
+    elif df.index.name == 'end_date' or isinstance(df.index, pd.DatetimeIndex):
+        result = df.sort_index()
+    else:
+        result = df.copy()
     
-    if 'roa' in result.columns:
-        result['roa_ttm'] = result['roa'].rolling(window=periods, min_periods=periods).mean()
-    
-    if 'net_profit_ratio' in result.columns:
-        result['net_profit_ratio_ttm'] = result['net_profit_ratio'].rolling(
-            window=periods, min_periods=periods
-        ).mean()
-    
-    if 'gross_income_ratio' in result.columns:
-        result['gross_income_ratio_ttm'] = result['gross_income_ratio'].rolling(
-            window=periods, min_periods=periods
-        ).mean()
+    # Calculate TTM for ratio fields (rolling mean), all columns at once
+    ratio_fields = [field for field in TTM_RATIO_FIELDS if field in result.columns]
+    if ratio_fields:
+        ttm = _rolling_mean(result[ratio_fields].to_numpy(dtype=np.float64), periods)
+        result[[f'{field}_ttm' for field in ratio_fields]] = ttm
     
     # Note: roa_ebit_ttm and roic require additional data not available from these APIs
     # These will be left as NaN for now
     
-    logger.debug(f"Calculated TTM indicators for {len(result)} rows")
+    logger.debug("Calculated TTM indicators for %d rows", len(result))
     return result
 
 
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over window rows of each column of a 2D array
+    
+    Same result as rolling(window, min_periods=window).mean(): NaN unless
+    every value in the window is present. Computed from cumulative sums
+    instead of a pandas Rolling object.
+    """
+    present = ~np.isnan(values)
+    zeros = np.zeros((1, values.shape[1]))
+    sums = np.vstack([zeros, np.cumsum(np.where(present, values, 0.0), axis=0)])
+    counts = np.vstack([zeros, np.cumsum(present, axis=0)])
+    
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        full = (counts[window:] - counts[:-window]) == window
+        out[window - 1:] = np.where(
+            full, (sums[window:] - sums[:-window]) / window, np.nan
+        )
+    return out
+
+
 def get_quarters_in_range(start_date: str, end_date: str) -> list:
     """
     Get list of (year, quarter) tuples in date range
@@ -77,35 +94,13 @@ def get_quarters_in_range(start_date: str, end_date: str) -> list:
     Returns:
         List of (year, quarter) tuples
     """
-    start = pd.to_datetime(start_date)
-    end = pd.to_datetime(end_date)
-    
-    quarters = []
-    
-    # Start from the quarter of start_date
-    year = start.year
-    quarter = (start.month - 1) // 3 + 1
-    
-    while True:
-        # Quarter end date
-        if quarter == 1:
-            q_end = pd.Timestamp(year, 3, 31)
-        elif quarter == 2:
-            q_end = pd.Timestamp(year, 6, 30)
-        elif quarter == 3:
-            q_end = pd.Timestamp(year, 9, 30)
-        else:  # quarter == 4
-            q_end = pd.Timestamp(year, 12, 31)
-        
-        if q_end > end:
-            break
-        
-        quarters.append((year, quarter))
-        
-        # Next quarter
-        quarter += 1
-        if quarter > 4:
-            quarter = 1
-            year += 1
-    
-    return quarters
+    # Quarters are numbered from 1970Q1 via month numbers since the epoch:
+    # start from the quarter of start_date, and end with the last quarter
+    # that closes on or before end_date (the one before the quarter
+    # containing the day after end_date)
+    start = np.datetime64(start_date, 'D')
+    end = np.datetime64(end_date, 'D')
+    first = int(start.astype('datetime64[M]').astype(np.int64)) // 3
+    last = int((end + 1).astype('datetime64[M]').astype(np.int64)) // 3 - 1
+    
+    return [(1970 + index // 4, index % 4 + 1) for index in range(first, last + 1)]
@@ -14,6 +14,11 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
+def _float_values(column: pd.Series) -> np.ndarray:
+    """Column values as a float64 array, with None/NA as NaN like pandas compares them"""
+    return column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
 class DataQualityError(Exception):
     """Raised when data quality validation fails"""
     pass
@@ -74,28 +79,24 @@ class MarketDataValidator:
             return False
 
         # 4. Value range checks
-        issues = []
-
-        # Close price should be positive
-        if (df["close"] <= 0).any():
-            invalid_count = (df["close"] <= 0).sum()
-            issues.append(f"{invalid_count} non-positive close prices")
-
-        # High >= Low
-        if (df["high"] < df["low"]).any():
-            invalid_count = (df["high"] < df["low"]).sum()
-            issues.append(f"{invalid_count} rows where high < low")
-
-        # Close should be between high and low
-        out_of_range = (df["close"] > df["high"]) | (df["close"] < df["low"])
-        if out_of_range.any():
-            invalid_count = out_of_range.sum()
-            issues.append(f"{invalid_count} rows where close not in [low, high]")
-
-        # Volume should be non-negative
-        if (df["volume"] < 0).any():
-            invalid_count = (df["volume"] < 0).sum()
-            issues.append(f"{invalid_count} negative volume values")
+        # Each check counts its violations in one pass over raw arrays
+        close = _float_values(df["close"])
+        high = _float_values(df["high"])
+        low = _float_values(df["low"])
+        checks = (
+            # Close price should be positive
+            (np.count_nonzero(close <= 0), "non-positive close prices"),
+            # High >= Low
+            (np.count_nonzero(high < low), "rows where high < low"),
+            # Close should be between high and low
+            (
+                np.count_nonzero((close > high) | (close < low)),
+                "rows where close not in [low, high]",
+            ),
+            # Volume should be non-negative
+            (np.count_nonzero(_float_values(df["volume"]) < 0), "negative volume values"),
+        )
+        issues = [f"{count} {desc}" for count, desc in checks if count]
 
         if issues:
             msg = f"{symbol}: Data range issues: {'; '.join(issues)}"
@@ -104,18 +105,20 @@ class MarketDataValidator:
             logger.warning(msg)
             return False
 
-        # 5. Check for excessive NaN values
-        nan_pct = df.isna().sum() / len(df) * 100
-        high_nan_fields = nan_pct[nan_pct > 10].to_dict()
+        # 5. Check for excessive NaN values (over 10%), on integer counts;
+        # percentages are only computed for the fields being reported
+        nan_counts = df.isna().sum()
+        high_nan_fields = nan_counts[nan_counts * 10 > len(df)].to_dict()
         if high_nan_fields:
+            n = len(df)
             msg = (
                 f"{symbol}: High NaN percentage: "
-                f"{', '.join(f'{k}={v:.1f}%' for k, v in high_nan_fields.items())}"
+                f"{', '.join(f'{k}={v / n * 100:.1f}%' for k, v in high_nan_fields.items())}"
             )
             logger.warning(msg)
             # Don't fail on high NaN, just warn
 
-        logger.debug(f"{symbol}: Market data validation passed")
+        logger.debug("%s: Market data validation passed", symbol)
         return True
 
 
@@ -166,15 +169,16 @@ class ValuationDataValidator:
 
         # PE, PB, PS, PCF should generally be positive (negative means loss)
         for field in ["pb", "pcf"]:
-            if field in df.columns and (df[field] < 0).any():
-                invalid_count = (df[field] < 0).sum()
-                issues.append(f"{invalid_count} negative {field} values")
+            if field in df.columns:
+                invalid_count = np.count_nonzero(_float_values(df[field]) < 0)
+                if invalid_count:
+                    issues.append(f"{invalid_count} negative {field} values")
 
         # Turnover rate should be in reasonable range [0, 100]%
         if "turnover_rate" in df.columns:
-            invalid = (df["turnover_rate"] < 0) | (df["turnover_rate"] > 100)
-            if invalid.any():
-                invalid_count = invalid.sum()
+            turnover = _float_values(df["turnover_rate"])
+            invalid_count = np.count_nonzero((turnover < 0) | (turnover > 100))
+            if invalid_count:
                 issues.append(f"{invalid_count} turnover_rate out of [0, 100] range")
 
         if issues:
@@ -182,7 +186,7 @@ class ValuationDataValidator:
             logger.warning(msg)
             # Don't fail on valuation issues, just warn
 
-        logger.debug(f"{symbol}: Valuation data validation passed")
+        logger.debug("%s: Valuation data validation passed", symbol)
         return True
 
 
@@ -236,16 +240,24 @@ class FundamentalDataValidator:
             logger.error(msg)
             return False
 
-        # 4. Check percentage of available data
-        data_pct = (non_nan_count / total_count) * 100
-        if data_pct < 20:
+        # 4. Check percentage of available data (under 20%)
+        if non_nan_count * 5 < total_count:
+            data_pct = non_nan_count / total_count * 100
             msg = f"{symbol}: Only {data_pct:.1f}% of fundamental data available"
             logger.warning(msg)
 
-        logger.debug(f"{symbol}: Fundamental data validation passed")
+        logger.debug("%s: Fundamental data validation passed", symbol)
         return True
 
 
+# Validate functions by data type, resolved once at import
+_VALIDATORS = {
+    "market": MarketDataValidator.validate,
+    "valuation": ValuationDataValidator.validate,
+    "fundamental": FundamentalDataValidator.validate,
+}
+
+
 def validate_before_write(
     data: pd.DataFrame,
     data_type: str,
@@ -267,12 +279,8 @@ def validate_before_write(
     Raises:
         DataQualityError: If strict=True and validation fails
     """
-    if data_type == "market":
-        return MarketDataValidator.validate(data, symbol, strict)
-    elif data_type == "valuation":
-        return ValuationDataValidator.validate(data, symbol, strict)
-    elif data_type == "fundamental":
-        return FundamentalDataValidator.validate(data, symbol, strict)
-    else:
-        logger.warning(f"Unknown data type: {data_type}, skipping validation")
+    validate = _VALIDATORS.get(data_type)
+    if validate is None:
+        logger.warning("Unknown data type: %s, skipping validation", data_type)
         return True
+    return validate(data, symbol, strict)
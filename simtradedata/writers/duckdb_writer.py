@@ -8,9 +8,13 @@ with automatic upsert (INSERT OR REPLACE) for deduplication.
 
 import json
 import logging
-from datetime import datetime
+import queue
+import threading
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 import duckdb
 import pandas as pd
@@ -19,6 +23,74 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = "data/simtradedata.duckdb"
 
+# Committed batches the background writer may hold before commit_async() blocks
+WRITE_QUEUE_SIZE = 2
+
+# Seconds between liveness checks of the writer thread while waiting on it
+WRITER_POLL_INTERVAL = 1.0
+
+# Tables exported by _export_metadata only when non-empty
+_METADATA_EXPORT_TABLES = (
+    "stock_metadata",
+    "benchmark",
+    "trade_days",
+    "index_constituents",
+    "stock_status",
+)
+
+# Tables summarised by get_data_status, in status report order
+STATUS_SYMBOL_TABLES = (
+    "stocks",
+    "valuation",
+    "fundamentals",
+    "exrights",
+    "adjust_factors",
+)
+STATUS_SIMPLE_TABLES = ("benchmark", "trade_days", "index_constituents", "stock_status")
+
+# The table set is fixed, so the status query is built once at import
+_DATA_STATUS_SQL = " UNION ALL ".join(
+    [
+        f"""
+            SELECT '{table}', COUNT(*), COUNT(DISTINCT symbol), MIN(date), MAX(date)
+            FROM {table}
+        """
+        for table in STATUS_SYMBOL_TABLES
+    ]
+    + [
+        f"SELECT '{table}', COUNT(*), NULL, NULL, NULL FROM {table}"
+        for table in STATUS_SIMPLE_TABLES + ("fundamentals_progress",)
+    ]
+)
+
+
+@lru_cache(maxsize=128)
+def _upsert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build (once per table/column set) the upsert of registered frame df.
+
+    The write_* methods run once per symbol with the same few column sets,
+    so the statement text is cached instead of re-formatted on every call.
+    """
+    cols_str = ", ".join(columns)
+    return f"""
+        INSERT OR REPLACE INTO {table} ({cols_str})
+        SELECT {cols_str} FROM df
+    """
+
+
+@lru_cache(maxsize=32)
+def _insert_missing_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build (once per table/column set) the anti-join insert of new df rows."""
+    cols_str = ", ".join(columns)
+    return f"""
+        INSERT INTO {table} ({cols_str})
+        SELECT {cols_str} FROM df
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {table} t
+            WHERE t.symbol = df.symbol AND t.date = df.date
+        )
+    """
+
 
 class DuckDBWriter:
     """
@@ -37,6 +109,19 @@ class DuckDBWriter:
         self.conn = duckdb.connect(str(self.db_path))
         self._init_schema()
 
+        # Sorted trading days loaded lazily by has_trading_day_between()
+        self._trade_days_cache: Optional[List[date]] = None
+
+        # Upserts queued by begin(defer_writes=True), keyed by (table, columns)
+        self._defer_writes = False
+        self._pending: Dict[Tuple[str, Tuple[str, ...]], List[pd.DataFrame]] = {}
+
+        # Writer thread started by start_background_writes()
+        self._write_queue: Optional[queue.Queue] = None
+        self._write_thread: Optional[threading.Thread] = None
+        # Batches the writer thread failed to write, retried by drain()
+        self._failed_batches: List[dict] = []
+
         logger.info(f"DuckDBWriter initialized: {self.db_path}")
 
     def _init_schema(self) -> None:
@@ -238,7 +323,7 @@ class DuckDBWriter:
             SELECT column_name FROM information_schema.columns
             WHERE table_name = 'fundamentals_progress'
         """).fetchall()
-        column_names = {row[0] for row in columns}
+        column_names = {name for (name,) in columns}
 
         if "filename" not in column_names:
             self.conn.execute("""
@@ -252,12 +337,21 @@ class DuckDBWriter:
             """)
             logger.info("Added file_hash column to fundamentals_progress")
 
-    def get_sampled_dates(self) -> list:
-        """Get list of dates that have already been sampled"""
-        result = self.conn.execute(
-            "SELECT sample_date FROM sampling_progress ORDER BY sample_date"
-        ).fetchall()
-        return [row[0] for row in result]
+    def _fetch_column(self, sql: str, params: Optional[list] = None) -> list:
+        """Run a query selecting one non-null column and return its values
+
+        The column is fetched as a single array (fetchnumpy) instead of one
+        row tuple per value. DATE values come back as date objects, as
+        with fetchall().
+        """
+        values = next(iter(self.conn.execute(sql, params).fetchnumpy().values()))
+        if values.dtype.kind == "M":
+            values = values.astype("datetime64[D]")
+        return values.tolist()
+
+    def get_sampled_dates(self) -> set:
+        """Get set of dates that have already been sampled"""
+        return set(self._fetch_column("SELECT sample_date FROM sampling_progress"))
 
     def add_sampled_date(self, sample_date) -> None:
         """Mark a date as sampled"""
@@ -268,29 +362,33 @@ class DuckDBWriter:
 
     def get_stock_pool(self) -> list:
         """Get all symbols in stock pool"""
-        result = self.conn.execute(
-            "SELECT symbol FROM stock_pool ORDER BY symbol"
-        ).fetchall()
-        return [row[0] for row in result]
+        return self._fetch_column("SELECT symbol FROM stock_pool ORDER BY symbol")
 
     def update_stock_pool(self, symbols: list, sample_date) -> None:
-        """Update stock pool with new symbols from a sample date"""
-        for symbol in symbols:
-            self.conn.execute("""
-                INSERT INTO stock_pool (symbol, first_seen_date, last_seen_date)
-                VALUES (?, ?, ?)
-                ON CONFLICT (symbol) DO UPDATE SET
-                    last_seen_date = CASE
-                        WHEN excluded.last_seen_date > stock_pool.last_seen_date
-                        THEN excluded.last_seen_date
-                        ELSE stock_pool.last_seen_date
-                    END,
-                    first_seen_date = CASE
-                        WHEN excluded.first_seen_date < stock_pool.first_seen_date
-                        THEN excluded.first_seen_date
-                        ELSE stock_pool.first_seen_date
-                    END
-            """, [symbol, sample_date, sample_date])
+        """Update stock pool with new symbols from a sample date.
+
+        All symbols are passed as one list parameter and unnested in SQL,
+        so the statement text is constant and runs once per sample date.
+        """
+        if not symbols:
+            return
+
+        self.conn.execute("""
+            INSERT INTO stock_pool (symbol, first_seen_date, last_seen_date)
+            SELECT DISTINCT s.symbol, ?::DATE, ?::DATE
+            FROM (SELECT unnest(?::VARCHAR[]) AS symbol) s
+            ON CONFLICT (symbol) DO UPDATE SET
+                last_seen_date = CASE
+                    WHEN excluded.last_seen_date > stock_pool.last_seen_date
+                    THEN excluded.last_seen_date
+                    ELSE stock_pool.last_seen_date
+                END,
+                first_seen_date = CASE
+                    WHEN excluded.first_seen_date < stock_pool.first_seen_date
+                    THEN excluded.first_seen_date
+                    ELSE stock_pool.first_seen_date
+                END
+        """, [sample_date, sample_date, list(symbols)])
 
     # ========================================
     # Fundamentals progress tracking
@@ -302,10 +400,9 @@ class DuckDBWriter:
         Returns:
             Set of date strings like {'2024-03-31', '2024-06-30', ...}
         """
-        result = self.conn.execute("""
+        return {str(d) for d in self._fetch_column("""
             SELECT DISTINCT date FROM fundamentals WHERE symbol = ?
-        """, [symbol]).fetchall()
-        return {str(row[0]) for row in result}
+        """, [symbol])}
 
     def has_fundamental(self, symbol: str, date_str: str) -> bool:
         """Check if a specific symbol+date exists in fundamentals table."""
@@ -314,12 +411,28 @@ class DuckDBWriter:
         """, [symbol, date_str]).fetchone()
         return result is not None
 
+    def get_fundamental_symbols(self, date_str: str) -> set:
+        """Get set of symbols that already have fundamentals for a quarter end date.
+
+        Bulk alternative to calling has_fundamental() once per symbol.
+
+        Args:
+            date_str: Quarter end date (e.g., '2024-03-31')
+
+        Returns:
+            Set of symbols like {'600000.SS', '000001.SZ', ...}
+        """
+        return set(self._fetch_column("""
+            SELECT symbol FROM fundamentals WHERE date = ?
+        """, [date_str]))
+
     def get_completed_fundamental_quarters(self) -> set:
         """Get set of (year, quarter) tuples that are fully downloaded."""
-        result = self.conn.execute(
-            "SELECT year, quarter FROM fundamentals_progress ORDER BY year, quarter"
-        ).fetchall()
-        return {(row[0], row[1]) for row in result}
+        # Rows already come back as (year, quarter) tuples; no ORDER BY is
+        # needed since the result is a set
+        return set(self.conn.execute(
+            "SELECT year, quarter FROM fundamentals_progress"
+        ).fetchall())
 
     def get_fundamental_quarter_hash(self, year: int, quarter: int) -> Optional[str]:
         """Get stored hash value for a quarter's financial data.
@@ -337,6 +450,17 @@ class DuckDBWriter:
         """, [year, quarter]).fetchone()
         return result[0] if result else None
 
+    def get_fundamental_quarter_hashes(self) -> dict:
+        """Get stored hash values for all recorded quarters in one query.
+
+        Returns:
+            Dict mapping (year, quarter) to hash string (None if not recorded)
+        """
+        result = self.conn.execute(
+            "SELECT year, quarter, file_hash FROM fundamentals_progress"
+        ).fetchall()
+        return {(year, quarter): file_hash for year, quarter, file_hash in result}
+
     def delete_fundamental_quarter_data(self, year: int, quarter: int) -> int:
         """Delete all fundamentals data for a specific quarter.
 
@@ -350,16 +474,13 @@ class DuckDBWriter:
         quarter_end = {1: "03-31", 2: "06-30", 3: "09-30", 4: "12-31"}
         date_str = f"{year}-{quarter_end[quarter]}"
 
-        # Get count before delete (DuckDB doesn't have changes() function)
+        # DuckDB returns the deleted row count as the DELETE result, so no
+        # separate COUNT(*) pass is needed
         count_result = self.conn.execute("""
-            SELECT COUNT(*) FROM fundamentals WHERE date = ?
+            DELETE FROM fundamentals WHERE date = ?
         """, [date_str]).fetchone()
         count = count_result[0] if count_result else 0
 
-        self.conn.execute("""
-            DELETE FROM fundamentals WHERE date = ?
-        """, [date_str])
-
         # Also delete the progress record
         self.conn.execute("""
             DELETE FROM fundamentals_progress WHERE year = ? AND quarter = ?
@@ -393,46 +514,266 @@ class DuckDBWriter:
 
     def close(self) -> None:
         """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        try:
+            self.stop_background_writes()
+        finally:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    def begin(self, defer_writes: bool = False) -> None:
+        """Begin a transaction for batch writes
 
-    def begin(self) -> None:
-        """Begin a transaction for batch writes"""
+        Args:
+            defer_writes: Queue the per-symbol upserts and run them as one
+                statement per table at commit(), instead of one per call
+        """
         self.conn.execute("BEGIN TRANSACTION")
+        self._defer_writes = defer_writes
 
     def commit(self) -> None:
-        """Commit current transaction"""
+        """Flush queued upserts and commit current transaction"""
+        self.flush_pending()
+        self._defer_writes = False
         self.conn.execute("COMMIT")
 
     def rollback(self) -> None:
-        """Rollback current transaction"""
+        """Rollback current transaction, dropping queued upserts"""
+        self._pending.clear()
+        self._defer_writes = False
         self.conn.execute("ROLLBACK")
 
+    def flush_pending(self) -> int:
+        """Run queued upserts with one INSERT per (table, column set)
+
+        Returns:
+            Number of rows written
+        """
+        pending, self._pending = self._pending, {}
+        return self._run_upserts(self.conn, pending)
+
+    @staticmethod
+    def _run_upserts(conn, pending: dict) -> int:
+        """Run one upsert per (table, column set) of pending on conn"""
+        total = 0
+        for (table, columns), frames in pending.items():
+            if len(frames) == 1:
+                df = frames[0]
+            else:
+                # A single upsert statement must not hit the same key twice
+                keys = [c for c in ("symbol", "date") if c in columns]
+                df = pd.concat(frames, ignore_index=True).drop_duplicates(
+                    subset=keys, keep="last"
+                )
+            conn.execute(_upsert_sql(table, columns))
+            total += len(df)
+        return total
+
+    def _upsert(self, table: str, df: pd.DataFrame) -> None:
+        """Upsert df into table, or queue it while writes are deferred"""
+        columns = tuple(df.columns)
+        if self._defer_writes:
+            self._pending.setdefault((table, columns), []).append(df)
+            return
+        self.conn.execute(_upsert_sql(table, columns))
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    # ========================================
+    # Background writes
+    # ========================================
+
+    def start_background_writes(self, maxsize: int = WRITE_QUEUE_SIZE) -> None:
+        """Start a writer thread that commits deferred batches
+
+        Once running, commit_async() hands each batch of queued upserts to
+        the writer thread, so the caller can fetch the next batch while the
+        previous one is written. The queue is bounded, so a slow database
+        blocks the caller instead of piling batches up in memory.
+
+        Args:
+            maxsize: Batches that may wait for the writer thread
+        """
+        if self._write_thread is not None:
+            return
+        self._write_queue = queue.Queue(maxsize=maxsize)
+        self._write_thread = threading.Thread(
+            target=self._write_loop,
+            args=(self.conn.cursor(), self._write_queue),
+            name="duckdb-writer",
+            daemon=True,
+        )
+        self._write_thread.start()
+
+    def commit_async(self) -> None:
+        """Commit current transaction, leaving queued upserts to the writer thread
+
+        Same as commit() when no writer thread is running.
+        """
+        if self._write_queue is None:
+            self.commit()
+            return
+        pending, self._pending = self._pending, {}
+        self._defer_writes = False
+        self.conn.execute("COMMIT")
+        if pending:
+            self._submit(pending)
+
+    def drain(self) -> Set[str]:
+        """Wait until the writer thread has handled every submitted batch
+
+        Batches the writer thread failed to write are retried here on the
+        calling thread's connection, one transaction per batch.
+
+        Returns:
+            Symbols whose rows are still unwritten after the retry
+
+        Raises:
+            RuntimeError: If the writer thread has died
+        """
+        if self._write_thread is None:
+            return set()
+        reached = threading.Event()
+        self._submit(reached)
+        while not reached.wait(WRITER_POLL_INTERVAL):
+            self._check_writer_alive()
+        failed, self._failed_batches = self._failed_batches, []
+        return self._retry_batches(failed)
+
+    def stop_background_writes(self) -> Set[str]:
+        """Drain and stop the writer thread
+
+        Returns:
+            Symbols whose rows could not be written, as for drain()
+        """
+        if self._write_thread is None:
+            return set()
+        try:
+            return self.drain()
+        finally:
+            if self._write_thread.is_alive():
+                self._write_queue.put(None)
+                self._write_thread.join()
+            self._write_queue = None
+            self._write_thread = None
+
+    def _submit(self, item) -> None:
+        """Queue item for the writer thread, raising if the thread has died"""
+        while True:
+            try:
+                self._write_queue.put(item, timeout=WRITER_POLL_INTERVAL)
+                return
+            except queue.Full:
+                self._check_writer_alive()
+
+    def _check_writer_alive(self) -> None:
+        if not self._write_thread.is_alive():
+            raise RuntimeError(
+                "DuckDB writer thread stopped; queued batches were not written"
+            )
+
+    def _retry_batches(self, batches: List[dict]) -> Set[str]:
+        """Rewrite failed batches on self.conn; return the symbols still unwritten"""
+        unwritten = set()
+        for pending in batches:
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                self._run_upserts(self.conn, pending)
+                self.conn.execute("COMMIT")
+            except Exception as e:
+                self.conn.execute("ROLLBACK")
+                symbols = self._batch_symbols(pending)
+                unwritten |= symbols
+                logger.error(f"Batch write failed again for {len(symbols)} symbols: {e}")
+        return unwritten
+
+    @staticmethod
+    def _batch_symbols(pending: dict) -> Set[str]:
+        """Symbols that have rows in a batch of queued upserts"""
+        symbols = set()
+        for frames in pending.values():
+            for df in frames:
+                if "symbol" in df.columns:
+                    symbols.update(df["symbol"].unique())
+        return symbols
+
+    def _write_loop(self, conn, write_queue: queue.Queue) -> None:
+        """Writer thread: commit each submitted batch in its own transaction
+
+        A batch that fails is rolled back and kept for drain() to retry.
+        Event items are drain() markers and are set when reached.
+        """
+        try:
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()
+                    continue
+                try:
+                    conn.execute("BEGIN TRANSACTION")
+                    self._run_upserts(conn, item)
+                    conn.execute("COMMIT")
+                except Exception as e:
+                    logger.error(f"Background batch write failed, will retry: {e}")
+                    self._failed_batches.append(item)
+                    try:
+                        conn.execute("ROLLBACK")
+                    except duckdb.Error:
+                        # Nothing to roll back if BEGIN itself failed
+                        pass
+        finally:
+            conn.close()
+
     # ========================================
     # Core write methods (with upsert)
     # ========================================
 
-    def write_market_data(self, symbol: str, df: pd.DataFrame) -> int:
-        """Write market data with automatic upsert"""
-        if df.empty:
-            return 0
+    @staticmethod
+    def _prepare_dated_frame(
+        df: pd.DataFrame,
+        symbol: Optional[str] = None,
+        date_aliases: tuple = (),
+    ) -> pd.DataFrame:
+        """Normalize a DataFrame to have a ``date`` column of ``datetime.date``.
+
+        Shared by all write_* methods that take date-indexed data.
 
+        Args:
+            df: Input DataFrame, either DatetimeIndex-ed or with a date column
+            symbol: If given, added as the ``symbol`` column
+            date_aliases: Column names to rename to ``date`` when it is missing
+
+        Returns:
+            Normalized copy of df
+        """
         df = df.copy()
-        df["symbol"] = symbol
+        if symbol is not None:
+            df["symbol"] = symbol
 
         if isinstance(df.index, pd.DatetimeIndex):
             df = df.reset_index()
             if "index" in df.columns:
                 df = df.rename(columns={"index": "date"})
 
+        for alias in date_aliases:
+            if alias in df.columns and "date" not in df.columns:
+                df = df.rename(columns={alias: "date"})
+
         df["date"] = pd.to_datetime(df["date"]).dt.date
+        return df
+
+    def write_market_data(self, symbol: str, df: pd.DataFrame) -> int:
+        """Write market data with automatic upsert"""
+        if df.empty:
+            return 0
+
+        df = self._prepare_dated_frame(df, symbol)
 
         columns = [
             "symbol", "date", "open", "close", "high", "low",
@@ -441,29 +782,47 @@ class DuckDBWriter:
         available = [c for c in columns if c in df.columns]
         df = df[available]
 
-        cols_str = ", ".join(available)
-        self.conn.execute(f"""
-            INSERT OR REPLACE INTO stocks ({cols_str})
-            SELECT {cols_str} FROM df
-        """)
+        self._upsert("stocks", df)
 
-        logger.debug(f"Wrote {len(df)} market rows for {symbol}")
+        logger.debug("Wrote %d market rows for %s", len(df), symbol)
         return len(df)
 
-    def write_valuation(self, symbol: str, df: pd.DataFrame) -> int:
-        """Write valuation data with upsert"""
+    def write_missing_market_data(self, symbol: str, df: pd.DataFrame) -> int:
+        """Insert only market rows whose (symbol, date) is not yet stored.
+
+        The missing-date check is an anti-join done inside DuckDB, so
+        existing rows are never shipped back to Python. Fills gaps before,
+        inside and after the stored date range in a single statement.
+
+        Returns:
+            Number of rows inserted
+        """
         if df.empty:
             return 0
 
-        df = df.copy()
-        df["symbol"] = symbol
+        df = self._prepare_dated_frame(df, symbol)
 
-        if isinstance(df.index, pd.DatetimeIndex):
-            df = df.reset_index()
-            if "index" in df.columns:
-                df = df.rename(columns={"index": "date"})
+        columns = [
+            "symbol", "date", "open", "close", "high", "low",
+            "high_limit", "low_limit", "preclose", "volume", "money",
+        ]
+        available = [c for c in columns if c in df.columns]
+        df = df[available]
 
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        result = self.conn.execute(
+            _insert_missing_sql("stocks", tuple(available))
+        ).fetchone()
+        inserted = result[0] if result else 0
+
+        logger.debug("Inserted %d missing market rows for %s", inserted, symbol)
+        return inserted
+
+    def write_valuation(self, symbol: str, df: pd.DataFrame) -> int:
+        """Write valuation data with upsert"""
+        if df.empty:
+            return 0
+
+        df = self._prepare_dated_frame(df, symbol)
 
         columns = [
             "symbol", "date", "pe_ttm", "pb", "ps_ttm", "pcf",
@@ -473,13 +832,9 @@ class DuckDBWriter:
         available = [c for c in columns if c in df.columns]
         df = df[available]
 
-        cols_str = ", ".join(available)
-        self.conn.execute(f"""
-            INSERT OR REPLACE INTO valuation ({cols_str})
-            SELECT {cols_str} FROM df
-        """)
+        self._upsert("valuation", df)
 
-        logger.debug(f"Wrote {len(df)} valuation rows for {symbol}")
+        logger.debug("Wrote %d valuation rows for %s", len(df), symbol)
         return len(df)
 
     def write_fundamentals(self, symbol: str, df: pd.DataFrame) -> int:
@@ -487,18 +842,7 @@ class DuckDBWriter:
         if df.empty:
             return 0
 
-        df = df.copy()
-        df["symbol"] = symbol
-
-        if isinstance(df.index, pd.DatetimeIndex):
-            df = df.reset_index()
-            if "index" in df.columns:
-                df = df.rename(columns={"index": "date"})
-
-        if "end_date" in df.columns and "date" not in df.columns:
-            df = df.rename(columns={"end_date": "date"})
-
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._prepare_dated_frame(df, symbol, date_aliases=("end_date",))
 
         if "publ_date" in df.columns:
             df["publ_date"] = pd.to_datetime(
@@ -522,13 +866,9 @@ class DuckDBWriter:
         available = [c for c in columns if c in df.columns]
         df = df[available]
 
-        cols_str = ", ".join(available)
-        self.conn.execute(f"""
-            INSERT OR REPLACE INTO fundamentals ({cols_str})
-            SELECT {cols_str} FROM df
-        """)
+        self._upsert("fundamentals", df)
 
-        logger.debug(f"Wrote {len(df)} fundamental rows for {symbol}")
+        logger.debug("Wrote %d fundamental rows for %s", len(df), symbol)
         return len(df)
 
     def write_exrights(self, symbol: str, df: pd.DataFrame) -> int:
@@ -536,15 +876,7 @@ class DuckDBWriter:
         if df.empty:
             return 0
 
-        df = df.copy()
-        df["symbol"] = symbol
-
-        if isinstance(df.index, pd.DatetimeIndex):
-            df = df.reset_index()
-            if "index" in df.columns:
-                df = df.rename(columns={"index": "date"})
-
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._prepare_dated_frame(df, symbol)
 
         columns = [
             "symbol", "date", "allotted_ps", "rationed_ps",
@@ -553,13 +885,9 @@ class DuckDBWriter:
         available = [c for c in columns if c in df.columns]
         df = df[available]
 
-        cols_str = ", ".join(available)
-        self.conn.execute(f"""
-            INSERT OR REPLACE INTO exrights ({cols_str})
-            SELECT {cols_str} FROM df
-        """)
+        self._upsert("exrights", df)
 
-        logger.debug(f"Wrote {len(df)} exrights rows for {symbol}")
+        logger.debug("Wrote %d exrights rows for %s", len(df), symbol)
         return len(df)
 
     def write_adjust_factor(self, symbol: str, data) -> int:
@@ -590,12 +918,9 @@ class DuckDBWriter:
 
         df = df[["symbol", "date", "adj_a", "adj_b"]]
 
-        self.conn.execute("""
-            INSERT OR REPLACE INTO adjust_factors
-            SELECT * FROM df
-        """)
+        self._upsert("adjust_factors", df)
 
-        logger.debug(f"Wrote {len(df)} adjust factor rows for {symbol}")
+        logger.debug("Wrote %d adjust factor rows for %s", len(df), symbol)
         return len(df)
 
     def write_benchmark(self, df: pd.DataFrame) -> int:
@@ -603,24 +928,13 @@ class DuckDBWriter:
         if df.empty:
             return 0
 
-        df = df.copy()
-
-        if isinstance(df.index, pd.DatetimeIndex):
-            df = df.reset_index()
-            if "index" in df.columns:
-                df = df.rename(columns={"index": "date"})
-
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._prepare_dated_frame(df)
 
         columns = ["date", "open", "high", "low", "close", "volume", "money"]
         available = [c for c in columns if c in df.columns]
         df = df[available]
 
-        cols_str = ", ".join(available)
-        self.conn.execute(f"""
-            INSERT OR REPLACE INTO benchmark ({cols_str})
-            SELECT {cols_str} FROM df
-        """)
+        self._upsert("benchmark", df)
 
         logger.info(f"Wrote {len(df)} benchmark rows")
         return len(df)
@@ -630,23 +944,14 @@ class DuckDBWriter:
         if df.empty:
             return 0
 
-        df = df.copy()
-
-        if isinstance(df.index, pd.DatetimeIndex):
-            df = df.reset_index()
-            if "index" in df.columns:
-                df = df.rename(columns={"index": "date"})
-
-        if "trade_date" in df.columns:
-            df = df.rename(columns={"trade_date": "date"})
-
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._prepare_dated_frame(df, date_aliases=("trade_date",))
         df = df[["date"]]
 
         self.conn.execute("""
             INSERT OR IGNORE INTO trade_days
             SELECT * FROM df
         """)
+        self.refresh_trading_calendar()
 
         logger.info(f"Wrote {len(df)} trade days")
         return len(df)
@@ -670,11 +975,7 @@ class DuckDBWriter:
         available = [c for c in columns if c in df.columns]
         df = df[available]
 
-        cols_str = ", ".join(available)
-        self.conn.execute(f"""
-            INSERT OR REPLACE INTO stock_metadata ({cols_str})
-            SELECT {cols_str} FROM df
-        """)
+        self._upsert("stock_metadata", df)
 
         logger.info(f"Wrote {len(df)} stock metadata records")
         return len(df)
@@ -683,12 +984,32 @@ class DuckDBWriter:
         self, date: str, index_code: str, symbols: List[str]
     ) -> None:
         """Write index constituents for a specific date"""
-        symbols_json = json.dumps(symbols, ensure_ascii=False)
+        self.write_index_constituents_batch([(date, index_code, symbols)])
 
-        self.conn.execute("""
+    def write_index_constituents_batch(
+        self, rows: List[Tuple[str, str, List[str]]]
+    ) -> int:
+        """
+        Write several index constituent snapshots with one prepared statement
+
+        Args:
+            rows: (date, index_code, symbols) tuples
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        self.conn.executemany("""
             INSERT OR REPLACE INTO index_constituents (date, index_code, symbols)
             VALUES (?, ?, ?)
-        """, [date, index_code, symbols_json])
+        """, [
+            [date, index_code, json.dumps(symbols, ensure_ascii=False)]
+            for date, index_code, symbols in rows
+        ])
+
+        return len(rows)
 
     def write_stock_status(
         self, date: str, status_type: str, symbols: List[str]
@@ -701,13 +1022,46 @@ class DuckDBWriter:
             VALUES (?, ?, ?)
         """, [date, status_type, symbols_json])
 
+    def write_stock_status_batch(self, status_type: str, by_date: pd.Series) -> int:
+        """
+        Write stock status for many dates in one statement
+
+        Args:
+            status_type: Status type (e.g. 'ST', 'HALT')
+            by_date: Series mapping date string (YYYYMMDD) to list of symbols
+
+        Returns:
+            Number of rows written
+        """
+        if by_date.empty:
+            return 0
+
+        df = pd.DataFrame({
+            "date": by_date.index.astype(str),
+            "status_type": status_type,
+            "symbols": [json.dumps(s, ensure_ascii=False) for s in by_date],
+        })
+
+        self.conn.execute("""
+            INSERT OR REPLACE INTO stock_status (date, status_type, symbols)
+            SELECT date, status_type, symbols FROM df
+        """)
+
+        return len(df)
+
     def write_global_metadata(self, meta: pd.Series) -> None:
         """Write global metadata to version_info table"""
-        for key, value in meta.items():
-            self.conn.execute("""
-                INSERT OR REPLACE INTO version_info (key, value)
-                VALUES (?, ?)
-            """, [str(key), str(value)])
+        self.conn.executemany("""
+            INSERT OR REPLACE INTO version_info (key, value)
+            VALUES (?, ?)
+        """, [[str(key), str(value)] for key, value in meta.items()])
+
+    def get_global_metadata(self, key: str) -> Optional[str]:
+        """Read one value from the version_info table"""
+        result = self.conn.execute(
+            "SELECT value FROM version_info WHERE key = ?", [key]
+        ).fetchone()
+        return result[0] if result else None
 
     # ========================================
     # Incremental update helpers
@@ -728,6 +1082,29 @@ class DuckDBWriter:
             return str(result[0])
         return None
 
+    def get_max_dates(self, table: str, symbols: List[str]) -> Dict[str, date]:
+        """
+        Get MAX(date) for many symbols with a single GROUP BY query
+
+        Args:
+            table: Table name
+            symbols: Symbols to look up
+
+        Returns:
+            Dict mapping symbol to its MAX(date) as a date object (no string
+            round-trip); symbols without data are absent
+        """
+        if not symbols:
+            return {}
+
+        rows = self.conn.execute(f"""
+            SELECT symbol, MAX(date) FROM {table}
+            WHERE symbol IN (SELECT unnest(?::VARCHAR[]))
+            GROUP BY symbol
+        """, [list(symbols)]).fetchall()
+
+        return {symbol: max_date for symbol, max_date in rows if max_date}
+
     def get_min_date(self, table: str, symbol: str = None) -> Optional[str]:
         """Get minimum date for backfill detection"""
         if symbol:
@@ -743,12 +1120,106 @@ class DuckDBWriter:
             return str(result[0])
         return None
 
+    def get_trade_days_start(self, start_date: str) -> str:
+        """Get the date from which the trading calendar still needs fetching.
+
+        The trade_days table acts as a persistent calendar cache: when it
+        already covers start_date, only days after its MAX(date) are needed.
+
+        Args:
+            start_date: Requested calendar start (YYYY-MM-DD)
+
+        Returns:
+            start_date, or the day after the cached MAX(date)
+        """
+        return self._next_missing_date("trade_days", start_date)
+
+    def get_benchmark_start(self, start_date: str) -> str:
+        """Get the date from which benchmark bars still need fetching.
+
+        Same rule as get_trade_days_start(), so a rerun on an up-to-date
+        database asks for nothing instead of the full history.
+
+        Args:
+            start_date: Requested benchmark start (YYYY-MM-DD)
+
+        Returns:
+            start_date, or the day after the stored MAX(date)
+        """
+        return self._next_missing_date("benchmark", start_date)
+
+    def _next_missing_date(self, table: str, start_date: str) -> str:
+        """Day after MAX(date) of a date-keyed table that covers start_date."""
+        result = self.conn.execute(
+            f"SELECT MIN(date), MAX(date) FROM {table}"
+        ).fetchone()
+
+        if not result or result[0] is None:
+            return start_date
+
+        min_day, max_day = result
+        # First trading day may fall a few days after a calendar start date
+        if (min_day - date.fromisoformat(start_date)).days > 7:
+            return start_date
+
+        return (max_day + timedelta(days=1)).isoformat()
+
+    def has_trading_day_between(self, start: date, end: date) -> bool:
+        """Check whether [start, end] may contain a trading day.
+
+        Days covered by the stored calendar are checked against it; days
+        after the calendar's last entry are assumed to be trading days
+        unless they fall on a weekend.
+
+        Args:
+            start: First date of the range (inclusive)
+            end: Last date of the range (inclusive)
+
+        Returns:
+            False only if no day in the range can be a trading day
+        """
+        trade_days = self._load_trade_days()
+
+        if trade_days:
+            i = bisect_left(trade_days, start)
+            if i < len(trade_days) and trade_days[i] <= end:
+                return True
+            # Only the days past the calendar are left to guess
+            start = max(start, trade_days[-1] + timedelta(days=1))
+
+        # Any three consecutive days include a weekday
+        day = start
+        for _ in range(3):
+            if day > end:
+                break
+            if day.weekday() < 5:
+                return True
+            day += timedelta(days=1)
+        return False
+
+    def _load_trade_days(self) -> List[date]:
+        """Load trade_days, sorted, into the in-memory calendar cache on first use."""
+        if self._trade_days_cache is None:
+            self._trade_days_cache = self._fetch_column(
+                "SELECT date FROM trade_days ORDER BY date"
+            )
+        return self._trade_days_cache
+
+    def refresh_trading_calendar(self) -> None:
+        """Drop the in-memory trading calendar so it is reloaded on next use."""
+        self._trade_days_cache = None
+
     def get_existing_stocks(self, table: str = "stocks") -> List[str]:
         """Get list of symbols in database"""
-        result = self.conn.execute(f"""
+        return self._fetch_column(f"""
             SELECT DISTINCT symbol FROM {table}
-        """).fetchall()
-        return [r[0] for r in result]
+        """)
+
+    def get_index_constituent_dates(self) -> set:
+        """Get set of dates (YYYYMMDD strings) with stored index constituents"""
+        return set(self._fetch_column(
+            "SELECT DISTINCT date FROM index_constituents"
+        ))
 
     def get_stock_count(self) -> int:
         """Get total number of unique stocks"""
@@ -760,18 +1231,43 @@ class DuckDBWriter:
     def get_data_status(self) -> dict:
         """Get a summary of data completeness across all tables.
 
+        All tables are summarised by a single UNION ALL query (_DATA_STATUS_SQL).
+
         Returns:
             Dict with table names as keys and summary dicts as values.
         """
+        try:
+            rows = self.conn.execute(_DATA_STATUS_SQL).fetchall()
+        except Exception:
+            return self._get_data_status_per_table()
+
         status = {}
-        for table in ["stocks", "valuation", "fundamentals", "exrights", "adjust_factors"]:
+        for table, row_count, stock_count, min_date, max_date in rows:
+            if table in STATUS_SYMBOL_TABLES:
+                status[table] = {
+                    "rows": row_count,
+                    "stocks": stock_count,
+                    "min_date": str(min_date) if min_date else None,
+                    "max_date": str(max_date) if max_date else None,
+                }
+            elif table == "fundamentals_progress":
+                # Add fundamentals quarter progress
+                status["fundamentals_quarters"] = row_count
+            else:
+                status[table] = {"rows": row_count}
+        return status
+
+    def _get_data_status_per_table(self) -> dict:
+        """Summarise each table separately, tolerating missing tables."""
+        status = {}
+        for table in STATUS_SYMBOL_TABLES:
             status[table] = self._get_table_summary(table)
 
         # Add fundamentals quarter progress
         status["fundamentals_quarters"] = len(self.get_completed_fundamental_quarters())
 
         # Add metadata counts
-        for table in ["benchmark", "trade_days", "index_constituents", "stock_status"]:
+        for table in STATUS_SIMPLE_TABLES:
             status[table] = self._get_table_summary_simple(table)
 
         return status
@@ -829,13 +1325,20 @@ class DuckDBWriter:
         logger.info("Exporting valuation...")
         self._export_per_symbol_table("valuation", output_path / "valuation")
 
+        # Date range and stock count shared by version.parquet and the
+        # manifest, aggregated in one pass over stocks
+        stocks_summary = self.conn.execute("""
+            SELECT MIN(date), MAX(date), COUNT(DISTINCT symbol)
+            FROM stocks
+        """).fetchone()
+
         logger.info("Exporting metadata...")
-        self._export_metadata(output_path / "metadata")
+        self._export_metadata(output_path / "metadata", stocks_summary)
 
         logger.info("Exporting adjust factors...")
         self._export_adjust_factors(output_path)
 
-        self._write_manifest(output_path)
+        self._write_manifest(output_path, stocks_summary)
 
         logger.info(f"Export complete: {output_path}")
 
@@ -889,39 +1392,32 @@ class DuckDBWriter:
 
         if is_chinext_star:
             # ChiNext/STAR: 20% after 2020-08-24, 10% before
-            self.conn.execute(f"""
-                COPY (
-                    SELECT
-                        date, open, close, high, low,
-                        CASE
+            high_limit = """CASE
                             WHEN date >= DATE '2020-08-24' THEN ROUND(preclose * 1.20, 2)
                             ELSE ROUND(preclose * 1.10, 2)
-                        END AS high_limit,
-                        CASE
+                        END"""
+            low_limit = """CASE
                             WHEN date >= DATE '2020-08-24' THEN ROUND(preclose * 0.80, 2)
                             ELSE ROUND(preclose * 0.90, 2)
-                        END AS low_limit,
-                        preclose, volume, money
-                    FROM stocks
-                    WHERE symbol = '{symbol_escaped}'
-                    ORDER BY date
-                ) TO '{output_file}' (FORMAT PARQUET)
-            """)
+                        END"""
         else:
             # Normal stocks: 10% limit (ST handling needs isST from status)
             # For now, use 10% as default; ST detection could be added later
-            self.conn.execute(f"""
-                COPY (
-                    SELECT
-                        date, open, close, high, low,
-                        ROUND(preclose * 1.10, 2) AS high_limit,
-                        ROUND(preclose * 0.90, 2) AS low_limit,
-                        preclose, volume, money
-                    FROM stocks
-                    WHERE symbol = '{symbol_escaped}'
-                    ORDER BY date
-                ) TO '{output_file}' (FORMAT PARQUET)
-            """)
+            high_limit = "ROUND(preclose * 1.10, 2)"
+            low_limit = "ROUND(preclose * 0.90, 2)"
+
+        self.conn.execute(f"""
+            COPY (
+                SELECT
+                    date, open, close, high, low,
+                    {high_limit} AS high_limit,
+                    {low_limit} AS low_limit,
+                    preclose, volume, money
+                FROM stocks
+                WHERE symbol = '{symbol_escaped}'
+                ORDER BY date
+            ) TO '{output_file}' (FORMAT PARQUET)
+        """)
 
     def _export_fundamentals_with_ttm(
         self, symbol_escaped: str, output_file: Path
@@ -1033,69 +1529,80 @@ class DuckDBWriter:
             ) TO '{output_file}' (FORMAT PARQUET)
         """)
 
-    def _export_metadata(self, output_dir: Path) -> None:
-        """Export metadata tables using DuckDB COPY"""
+    def _export_metadata(self, output_dir: Path, stocks_summary: tuple) -> None:
+        """Export metadata tables using DuckDB COPY
+
+        Args:
+            output_dir: Metadata output directory
+            stocks_summary: (min date, max date, stock count) of stocks table
+        """
+        # Check which tables have rows with one query instead of one per table
+        has_rows = dict(zip(
+            _METADATA_EXPORT_TABLES,
+            self.conn.execute("SELECT " + ", ".join(
+                f"EXISTS (SELECT 1 FROM {table})"
+                for table in _METADATA_EXPORT_TABLES
+            )).fetchone(),
+        ))
+
         # stock_metadata.parquet
-        count = self.conn.execute("SELECT COUNT(*) FROM stock_metadata").fetchone()[0]
-        if count > 0:
+        if has_rows["stock_metadata"]:
             self.conn.execute(f"""
                 COPY stock_metadata TO '{output_dir / "stock_metadata.parquet"}'
                 (FORMAT PARQUET)
             """)
 
         # benchmark.parquet
-        count = self.conn.execute("SELECT COUNT(*) FROM benchmark").fetchone()[0]
-        if count > 0:
+        if has_rows["benchmark"]:
             self.conn.execute(f"""
                 COPY (SELECT * FROM benchmark ORDER BY date)
                 TO '{output_dir / "benchmark.parquet"}' (FORMAT PARQUET)
             """)
 
         # trade_days.parquet
-        count = self.conn.execute("SELECT COUNT(*) FROM trade_days").fetchone()[0]
-        if count > 0:
+        if has_rows["trade_days"]:
             self.conn.execute(f"""
                 COPY (SELECT * FROM trade_days ORDER BY date)
                 TO '{output_dir / "trade_days.parquet"}' (FORMAT PARQUET)
             """)
 
         # index_constituents.parquet
-        count = self.conn.execute("SELECT COUNT(*) FROM index_constituents").fetchone()[0]
-        if count > 0:
+        if has_rows["index_constituents"]:
             self.conn.execute(f"""
                 COPY index_constituents TO '{output_dir / "index_constituents.parquet"}'
                 (FORMAT PARQUET)
             """)
 
         # stock_status.parquet
-        count = self.conn.execute("SELECT COUNT(*) FROM stock_status").fetchone()[0]
-        if count > 0:
+        if has_rows["stock_status"]:
             self.conn.execute(f"""
                 COPY stock_status TO '{output_dir / "stock_status.parquet"}'
                 (FORMAT PARQUET)
             """)
 
         # version.parquet
+        start_date, _, num_stocks = stocks_summary
         result = self.conn.execute("""
             SELECT
                 (SELECT value FROM version_info WHERE key='version') as version,
-                (SELECT COUNT(DISTINCT symbol) FROM stocks) as num_stocks,
-                CURRENT_DATE as export_date,
-                (SELECT MIN(date)::VARCHAR FROM stocks) as start_date
+                CURRENT_DATE as export_date
         """).fetchone()
 
         version_data = pd.DataFrame([{
             "version": result[0] or "3.0.0",
-            "num_stocks": result[1] or 0,
-            "export_date": str(result[2]),
-            "start_date": result[3] or "",
+            "num_stocks": num_stocks or 0,
+            "export_date": str(result[1]),
+            "start_date": str(start_date) if start_date else "",
         }])
         version_data.to_parquet(output_dir / "version.parquet", index=False)
 
     def _export_adjust_factors(self, output_dir: Path) -> None:
         """Export adjust factors to pre/post files using DuckDB COPY"""
-        count = self.conn.execute("SELECT COUNT(*) FROM adjust_factors").fetchone()[0]
-        if count == 0:
+        # Only emptiness matters here, so stop at the first row
+        has_rows = self.conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM adjust_factors)"
+        ).fetchone()[0]
+        if not has_rows:
             logger.info("No adjust factors to export")
             return
 
@@ -1117,16 +1624,12 @@ class DuckDBWriter:
             ) TO '{output_dir / "ptrade_adj_post.parquet"}' (FORMAT PARQUET)
         """)
 
-    def _write_manifest(self, output_dir: Path) -> None:
-        """Write manifest.json"""
-        result = self.conn.execute("""
-            SELECT MIN(date), MAX(date), COUNT(DISTINCT symbol)
-            FROM stocks
-        """).fetchone()
-
-        start_date = str(result[0]) if result[0] else ""
-        end_date = str(result[1]) if result[1] else ""
-        stock_count = result[2] or 0
+    def _write_manifest(self, output_dir: Path, stocks_summary: tuple) -> None:
+        """Write manifest.json from the (min date, max date, stock count)
+        summary of the stocks table"""
+        start_date = str(stocks_summary[0]) if stocks_summary[0] else ""
+        end_date = str(stocks_summary[1]) if stocks_summary[1] else ""
+        stock_count = stocks_summary[2] or 0
 
         manifest = {
             "version": "3.0.0",
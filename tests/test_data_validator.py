@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the market and valuation data validators
+"""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from simtradedata.validators.data_validator import (
+    MarketDataValidator,
+    ValuationDataValidator,
+)
+
+pytestmark = pytest.mark.unit
+
+INDEX = pd.date_range("2024-01-01", periods=10)
+
+
+def _column(values):
+    # Object dtype keeps None as None, as frames built from records do
+    return pd.Series(values, index=INDEX, dtype=object)
+
+
+class TestRangeChecksWithMissingValues:
+    def test_market_data_counts_none_as_valid(self, caplog):
+        df = pd.DataFrame(
+            {
+                "open": _column([1.0] * 10),
+                "high": _column([2.0] * 9 + [None]),
+                "low": _column([0.5] * 10),
+                "close": _column([1.0] * 8 + [None, -1.0]),
+                "volume": _column([1] * 8 + [None, -1]),
+                "money": _column([1.0] * 10),
+            }
+        )
+
+        with caplog.at_level(logging.WARNING):
+            assert not MarketDataValidator.validate(df, "000001.SZ")
+
+        assert (
+            "1 non-positive close prices; 1 rows where close not in [low, high]; "
+            "1 negative volume values"
+        ) in caplog.text
+
+    def test_valuation_data_counts_none_as_valid(self, caplog):
+        df = pd.DataFrame(
+            {
+                "pb": _column([1.0] * 8 + [None, -1.0]),
+                "pcf": _column([1.0] * 10),
+                "turnover_rate": _column([1] * 8 + [None, 200]),
+            }
+        )
+
+        with caplog.at_level(logging.WARNING):
+            assert ValuationDataValidator.validate(df, "000001.SZ")
+
+        assert (
+            "1 negative pb values; 1 turnover_rate out of [0, 100] range"
+        ) in caplog.text
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for DuckDBWriter
+"""
+
+import threading
+from datetime import date
+
+import duckdb
+import pandas as pd
+import pytest
+
+from simtradedata.writers import duckdb_writer
+from simtradedata.writers.duckdb_writer import DuckDBWriter
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def writer(tmp_path):
+    w = DuckDBWriter(str(tmp_path / "test.duckdb"))
+    yield w
+    w.close()
+
+
+def _bars(dates, close=10.0):
+    return pd.DataFrame({"date": dates, "close": close})
+
+
+def _stock_count(writer):
+    return writer.conn.execute("SELECT COUNT(*) FROM stocks").fetchone()[0]
+
+
+class _RecordingConnection:
+    """Connection proxy that records the queries passed to execute()"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.queries = []
+
+    def execute(self, sql, parameters=None):
+        self.queries.append((sql, parameters))
+        return self._conn.execute(sql, parameters)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class TestDeferredWrites:
+    def test_commit_flushes_deferred_rows(self, writer):
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02"]))
+        writer.write_market_data("000002.SZ", _bars(["2024-01-02"]))
+        assert _stock_count(writer) == 0
+
+        writer.commit()
+        assert _stock_count(writer) == 2
+
+    def test_rollback_drops_deferred_rows(self, writer):
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02"]))
+        writer.rollback()
+
+        assert writer.flush_pending() == 0
+        assert _stock_count(writer) == 0
+
+    def test_duplicate_keys_keep_last_write(self, writer):
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02"], close=1.0))
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02"], close=2.0))
+        writer.commit()
+
+        rows = writer.conn.execute("SELECT close FROM stocks").fetchall()
+        assert rows == [(2.0,)]
+
+
+class TestBackgroundWrites:
+    def test_batch_is_written_after_drain(self, writer):
+        writer.start_background_writes()
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02", "2024-01-03"]))
+        writer.commit_async()
+
+        assert writer.drain() == set()
+        assert _stock_count(writer) == 2
+
+    def test_failed_batch_symbols_are_reported(self, writer):
+        writer.start_background_writes()
+        writer.begin(defer_writes=True)
+        # NULL date violates the stocks NOT NULL constraint, on every retry
+        writer.write_market_data("000001.SZ", _bars([None]))
+        writer.commit_async()
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000002.SZ", _bars(["2024-01-02"]))
+        writer.commit_async()
+
+        assert writer.drain() == {"000001.SZ"}
+        assert _stock_count(writer) == 1
+        # Failures are reported once
+        assert writer.drain() == set()
+
+    def test_failed_batch_is_retried_on_calling_thread(self, writer, monkeypatch):
+        run_upserts = DuckDBWriter._run_upserts
+
+        def fail_off_main_thread(conn, pending):
+            if threading.current_thread() is not threading.main_thread():
+                raise duckdb.IOException("simulated write failure")
+            return run_upserts(conn, pending)
+
+        monkeypatch.setattr(writer, "_run_upserts", fail_off_main_thread)
+        writer.start_background_writes()
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02"]))
+        writer.commit_async()
+
+        assert writer.stop_background_writes() == set()
+        assert _stock_count(writer) == 1
+
+    def test_dead_writer_thread_raises_instead_of_blocking(self, writer, monkeypatch):
+        monkeypatch.setattr(duckdb_writer, "WRITER_POLL_INTERVAL", 0.01)
+        monkeypatch.setattr(writer, "_write_loop", lambda conn, write_queue: None)
+        writer.start_background_writes(maxsize=1)
+        writer._write_thread.join()
+
+        writer.begin(defer_writes=True)
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02"]))
+        writer.commit_async()
+
+        with pytest.raises(RuntimeError):
+            writer.stop_background_writes()
+
+
+class TestWriteMissingMarketData:
+    def test_returns_inserted_count_and_skips_existing(self, writer):
+        writer.write_market_data("000001.SZ", _bars(["2024-01-03"], close=1.0))
+
+        inserted = writer.write_missing_market_data(
+            "000001.SZ",
+            _bars(["2024-01-02", "2024-01-03", "2024-01-04"], close=2.0),
+        )
+
+        assert inserted == 2
+        rows = writer.conn.execute(
+            "SELECT date, close FROM stocks ORDER BY date"
+        ).fetchall()
+        assert rows == [
+            (date(2024, 1, 2), 2.0),
+            (date(2024, 1, 3), 1.0),
+            (date(2024, 1, 4), 2.0),
+        ]
+
+    def test_empty_frame_inserts_nothing(self, writer):
+        assert writer.write_missing_market_data("000001.SZ", pd.DataFrame()) == 0
+        assert _stock_count(writer) == 0
+
+
+class TestUpdateStockPool:
+    def test_accepts_string_and_date_sample_dates(self, writer):
+        writer.update_stock_pool(["000001.SZ", "000002.SZ"], "2024-01-01")
+        writer.update_stock_pool(["000001.SZ"], date(2024, 3, 1))
+        writer.update_stock_pool(["000002.SZ"], "2023-06-01")
+
+        rows = writer.conn.execute(
+            "SELECT symbol, first_seen_date, last_seen_date"
+            " FROM stock_pool ORDER BY symbol"
+        ).fetchall()
+        assert rows == [
+            ("000001.SZ", date(2024, 1, 1), date(2024, 3, 1)),
+            ("000002.SZ", date(2023, 6, 1), date(2024, 1, 1)),
+        ]
+
+
+class TestGetMaxDates:
+    def test_omits_symbols_without_rows(self, writer):
+        writer.write_market_data("000001.SZ", _bars(["2024-01-02", "2024-01-05"]))
+        writer.write_market_data("000002.SZ", _bars(["2024-01-03"]))
+
+        max_dates = writer.get_max_dates(
+            "stocks", ["000001.SZ", "000002.SZ", "600000.SH"]
+        )
+
+        assert max_dates == {
+            "000001.SZ": date(2024, 1, 5),
+            "000002.SZ": date(2024, 1, 3),
+        }
+
+    def test_empty_symbol_list(self, writer):
+        assert writer.get_max_dates("stocks", []) == {}
+
+    def test_plan_is_one_hash_semi_join_over_one_scan(self, writer, monkeypatch):
+        for symbol in ["000001.SZ", "000002.SZ", "600000.SH"]:
+            writer.write_market_data(symbol, _bars(["2024-01-02", "2024-01-03"]))
+        recorder = _RecordingConnection(writer.conn)
+        monkeypatch.setattr(writer, "conn", recorder)
+
+        writer.get_max_dates("stocks", ["000001.SZ", "600000.SH"])
+
+        assert len(recorder.queries) == 1
+        sql, params = recorder.queries[0]
+        plan = "\n".join(
+            row[1] for row in writer.conn.execute("EXPLAIN " + sql, params).fetchall()
+        )
+        # The symbol list is matched in a single pass over the table, not
+        # with a scan or nested-loop probe per symbol
+        assert plan.count("SEQ_SCAN") == 1
+        assert "stocks" in plan
+        assert "HASH_JOIN" in plan
+        assert "SEMI" in plan
+        assert "NESTED_LOOP_JOIN" not in plan
+        assert plan.count("HASH_GROUP_BY") == 1
+
+
+class TestHasTradingDayBetween:
+    @pytest.fixture
+    def calendar(self, writer):
+        # Thu 2024-01-04 and Mon 2024-01-08; Fri 2024-01-05 is a holiday
+        writer.write_trade_days(
+            pd.DataFrame({"trade_date": ["2024-01-04", "2024-01-08"]})
+        )
+        return writer
+
+    def test_range_inside_calendar(self, calendar):
+        assert calendar.has_trading_day_between(date(2024, 1, 4), date(2024, 1, 4))
+        assert calendar.has_trading_day_between(date(2024, 1, 5), date(2024, 1, 8))
+        assert not calendar.has_trading_day_between(date(2024, 1, 5), date(2024, 1, 7))
+
+    def test_days_after_calendar_count_unless_weekend(self, calendar):
+        assert calendar.has_trading_day_between(date(2024, 1, 9), date(2024, 1, 9))
+        assert not calendar.has_trading_day_between(
+            date(2024, 1, 13), date(2024, 1, 14)
+        )
+        assert calendar.has_trading_day_between(date(2024, 1, 13), date(2024, 1, 15))
+
+    def test_calendar_reloads_after_write(self, calendar):
+        assert not calendar.has_trading_day_between(date(2024, 1, 5), date(2024, 1, 5))
+        calendar.write_trade_days(pd.DataFrame({"trade_date": ["2024-01-05"]}))
+        assert calendar.has_trading_day_between(date(2024, 1, 5), date(2024, 1, 5))
+
+    def test_empty_calendar_checks_weekdays_only(self, writer):
+        assert writer.has_trading_day_between(date(2024, 1, 5), date(2024, 1, 5))
+        assert not writer.has_trading_day_between(date(2024, 1, 6), date(2024, 1, 7))